@@ -0,0 +1,343 @@
+"""SteamNetworkManager — send/receive path benchmark.
+
+Measures throughput (messages/sec and MB/sec) and one-way latency
+(p50/p99/p999) of the SteamNetworkManager receive strategies:
+
+- ``single``:  the one-message-at-a-time loop used in
+  ``examples/network_manager.py``
+- ``batched``: ``receive_messages_on_poll_group``
+- ``buffer``:  ``receive_buffer_on_poll_group`` (zero-copy)
+
+Each run streams messages from a client connection to a server connection
+in a poll group, for every combination of payload size and send mode.  Every
+payload starts with the sender's ``perf_counter_ns`` timestamp, so the
+receiver can compute the one-way latency of each message.
+
+The connection is an in-process socket pair by default; ``--transport
+loopback`` routes it through the network loopback device and ``--transport
+ip`` uses a real listen socket on 127.0.0.1.  ``--loss``, ``--lag``,
+``--reorder`` and ``--dup`` simulate WAN conditions on the packet path, so
+they need the ``loopback`` or ``ip`` transport.  Use ``--json`` to write
+machine-readable results for tracking regressions between releases.
+
+    ppython examples/network_benchmark.py [--sizes 16,256,4096] [--json results.json]
+    ppython examples/network_benchmark.py --transport loopback --lag 75 --loss 2
+"""
+
+import argparse
+import json
+import platform
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from panda3d import core
+from panda3d_steamworks.showbase import SteamShowBase
+from panda3d_steamworks import (
+    SteamConstants,
+    SteamNetworkingConfigValue,
+    SteamNetworkingConnectionState,
+    SteamNetworkFakeConditions,
+    SteamNetworkManager,
+    SteamNetworkMessage,
+)
+
+SEND_MODES = {
+    "reliable": SteamConstants.k_nSteamNetworkingSend_Reliable,
+    "unreliable": SteamConstants.k_nSteamNetworkingSend_Unreliable,
+}
+
+STATE_NONE = SteamNetworkingConnectionState.k_ESteamNetworkingConnectionState_None
+STATE_CONNECTING = SteamNetworkingConnectionState.k_ESteamNetworkingConnectionState_Connecting
+STATE_CONNECTED = SteamNetworkingConnectionState.k_ESteamNetworkingConnectionState_Connected
+
+PORT = 27016
+
+# Every payload starts with a uint64 send timestamp.
+HEADER_SIZE = 8
+
+# Stop waiting for stragglers after this long without progress.  Unreliable
+# runs may legitimately lose messages.
+IDLE_TIMEOUT = 0.5
+
+
+def pump(base, seconds):
+    """Steps the task manager for the given wall-clock duration."""
+    deadline = time.perf_counter() + seconds
+    while time.perf_counter() < deadline:
+        base.taskMgr.step()
+        time.sleep(0.001)
+
+
+def tune_transport():
+    """Lifts the default send-rate cap and send buffer so the benchmark
+    measures the send/receive path rather than Steam's rate limiter."""
+    SteamNetworkManager.set_global_config_int32(
+        SteamNetworkingConfigValue.k_ESteamNetworkingConfig_SendRateMin, 100_000_000)
+    SteamNetworkManager.set_global_config_int32(
+        SteamNetworkingConfigValue.k_ESteamNetworkingConfig_SendRateMax, 100_000_000)
+    SteamNetworkManager.set_global_config_int32(
+        SteamNetworkingConfigValue.k_ESteamNetworkingConfig_SendBufferSize, 16 * 1024 * 1024)
+
+
+def fake_conditions(args):
+    """Builds the simulated network conditions requested on the command
+    line, or returns None if there are none."""
+    if not (args.loss or args.lag or args.reorder or args.dup):
+        return None
+
+    conditions = SteamNetworkFakeConditions()
+    conditions.set_packet_loss(args.loss)
+    conditions.set_packet_lag(args.lag)
+    conditions.packet_reorder_send = args.reorder
+    conditions.packet_reorder_recv = args.reorder
+    conditions.packet_reorder_time = args.lag // 2
+    conditions.packet_dup_send = args.dup
+    conditions.packet_dup_recv = args.dup
+    conditions.packet_dup_time_max = args.lag // 2
+    return conditions
+
+
+def connect_pair(mgr, poll_group, use_network_loopback):
+    """Opens an in-process socket pair and returns the client handle."""
+    pair = mgr.create_socket_pair(use_network_loopback)
+    if pair is None:
+        raise RuntimeError("Failed to create socket pair.")
+    client_conn, server_conn = pair
+    mgr.set_connection_poll_group(server_conn, poll_group)
+    mgr.drain_events()
+    return client_conn
+
+
+def connect_ip(base, mgr, poll_group):
+    """Opens a 127.0.0.1 client/server pair and returns the client handle."""
+    listen = mgr.create_ip_socket(PORT)
+
+    addr = core.NetAddress()
+    addr.set_host("127.0.0.1", PORT)
+    client_conn = mgr.connect_by_ip_address(addr)
+
+    connected = False
+    deadline = time.perf_counter() + 10.0
+    while not connected and time.perf_counter() < deadline:
+        base.taskMgr.step()
+        for event in mgr.drain_events(listen):
+            if event.old_state == STATE_NONE and event.state == STATE_CONNECTING:
+                mgr.accept_connection(event.connection)
+                mgr.set_connection_poll_group(event.connection, poll_group)
+        for event in mgr.drain_client_events():
+            if event.state == STATE_CONNECTED:
+                connected = True
+
+    if not connected:
+        raise RuntimeError("Timed out waiting for the loopback connection.")
+    return client_conn
+
+
+def make_padding(size):
+    return b"\0" * max(0, size - HEADER_SIZE)
+
+
+def send_window(mgr, client_conn, count, padding, send_flags):
+    """Sends count timestamped messages from the client."""
+    for _ in range(count):
+        dg = core.Datagram()
+        dg.add_uint64(time.perf_counter_ns())
+        if padding:
+            dg.append_data(padding)
+        mgr.send_datagram(client_conn, dg, send_flags)
+
+
+def drain_single(mgr, poll_group, latencies):
+    """The existing idiom: one native call and one message per iteration."""
+    received = 0
+    msg = SteamNetworkMessage()
+    while mgr.receive_message_on_poll_group(poll_group, msg):
+        latencies.append(time.perf_counter_ns() - msg.dgi.get_uint64())
+        received += 1
+        msg = SteamNetworkMessage()
+    return received
+
+
+def drain_batched(mgr, poll_group, latencies, batch_size):
+    """Pulls up to batch_size messages per native call."""
+    received = 0
+    while True:
+        batch = mgr.receive_messages_on_poll_group(poll_group, batch_size)
+        if not batch:
+            break
+        now = time.perf_counter_ns()
+        for msg in batch:
+            latencies.append(now - msg.dgi.get_uint64())
+        received += len(batch)
+    return received
+
+
+def drain_buffer(mgr, poll_group, latencies):
+    """Reads each payload in place through the buffer protocol."""
+    received = 0
+    while True:
+        buf = mgr.receive_buffer_on_poll_group(poll_group)
+        if buf is None:
+            break
+        sent = int.from_bytes(memoryview(buf)[:HEADER_SIZE], "little")
+        latencies.append(time.perf_counter_ns() - sent)
+        received += 1
+    return received
+
+
+def percentile(sorted_values, fraction):
+    if not sorted_values:
+        return 0.0
+    index = min(len(sorted_values) - 1, int(fraction * len(sorted_values)))
+    return sorted_values[index]
+
+
+def run(mgr, client_conn, drain, messages, window, size, send_flags):
+    """Streams messages through the connection in windows, draining the
+    server side after each window, and returns the measurements."""
+    padding = make_padding(size)
+    latencies = []
+    received = 0
+    sent = 0
+
+    start = time.perf_counter()
+    while sent < messages:
+        count = min(window, messages - sent)
+        send_window(mgr, client_conn, count, padding, send_flags)
+        sent += count
+        mgr.run_callbacks()
+        received += drain(latencies)
+
+    last_progress = time.perf_counter()
+    while received < sent and time.perf_counter() - last_progress < IDLE_TIMEOUT:
+        mgr.run_callbacks()
+        count = drain(latencies)
+        if count:
+            received += count
+            last_progress = time.perf_counter()
+    elapsed = time.perf_counter() - start
+
+    latencies.sort()
+    payload_bytes = received * max(size, HEADER_SIZE)
+    return {
+        "sent": sent,
+        "received": received,
+        "elapsed_ms": elapsed * 1000.0,
+        "msgs_per_sec": received / elapsed if elapsed > 0 else 0.0,
+        "mb_per_sec": payload_bytes / elapsed / (1024 * 1024) if elapsed > 0 else 0.0,
+        "latency_us": {
+            "p50": percentile(latencies, 0.50) / 1000.0,
+            "p99": percentile(latencies, 0.99) / 1000.0,
+            "p999": percentile(latencies, 0.999) / 1000.0,
+        },
+    }
+
+
+def parse_list(value, convert=str):
+    return [convert(item) for item in value.split(",") if item]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--transport", choices=("pair", "loopback", "ip"), default="pair",
+                        help="in-process socket pair, socket pair over the loopback device, or 127.0.0.1 IP sockets")
+    parser.add_argument("--messages", type=int, default=20000, help="messages per run")
+    parser.add_argument("--window", type=int, default=256, help="messages sent between drains")
+    parser.add_argument("--batch-size", type=int, default=256, help="messages per batched call")
+    parser.add_argument("--sizes", default="16,256,1024,8192", help="comma-separated payload sizes in bytes")
+    parser.add_argument("--modes", default="reliable,unreliable", help="comma-separated send modes")
+    parser.add_argument("--strategies", default="single,batched,buffer", help="comma-separated receive strategies")
+    parser.add_argument("--loss", type=float, default=0.0, help="simulated packet loss percentage, each direction")
+    parser.add_argument("--lag", type=int, default=0, help="simulated lag in ms, each direction")
+    parser.add_argument("--reorder", type=float, default=0.0, help="simulated packet reorder percentage")
+    parser.add_argument("--dup", type=float, default=0.0, help="simulated packet duplication percentage")
+    parser.add_argument("--json", metavar="PATH", help="write results as JSON to PATH ('-' for stdout)")
+    args = parser.parse_args()
+
+    sizes = parse_list(args.sizes, int)
+    modes = parse_list(args.modes)
+    for mode in modes:
+        if mode not in SEND_MODES:
+            parser.error(f"unknown send mode {mode!r}")
+
+    base = SteamShowBase(windowType="none")
+    mgr = SteamNetworkManager.get_global_ptr()
+    tune_transport()
+
+    conditions = fake_conditions(args)
+    if conditions is not None:
+        if args.transport == "pair":
+            parser.error("simulated network conditions need --transport loopback or ip")
+        SteamNetworkManager.set_fake_network_conditions(conditions)
+
+    poll_group = mgr.create_poll_group()
+    if args.transport == "ip":
+        client_conn = connect_ip(base, mgr, poll_group)
+    else:
+        client_conn = connect_pair(mgr, poll_group, args.transport == "loopback")
+    pump(base, 0.25)
+
+    strategies = {
+        "single": lambda latencies: drain_single(mgr, poll_group, latencies),
+        "batched": lambda latencies: drain_batched(mgr, poll_group, latencies, args.batch_size),
+        "buffer": lambda latencies: drain_buffer(mgr, poll_group, latencies),
+    }
+    selected = parse_list(args.strategies)
+    for name in selected:
+        if name not in strategies:
+            parser.error(f"unknown strategy {name!r}")
+
+    results = []
+    human = args.json != "-"
+    if human:
+        print(f"{args.transport}: {args.messages} messages per run, window {args.window}\n")
+        print(f"  {'strategy':<8} {'mode':<10} {'size':>6} {'recv':>8} {'msgs/sec':>12} {'MB/sec':>9}"
+              f" {'p50 us':>9} {'p99 us':>9} {'p999 us':>9}")
+
+    for mode in modes:
+        for size in sizes:
+            for name in selected:
+                result = run(mgr, client_conn, strategies[name], args.messages, args.window,
+                             size, SEND_MODES[mode])
+                result.update(strategy=name, mode=mode, payload_size=size)
+                results.append(result)
+
+                if human:
+                    latency = result["latency_us"]
+                    print(f"  {name:<8} {mode:<10} {size:>6} {result['received']:>8}"
+                          f" {result['msgs_per_sec']:>12,.0f} {result['mb_per_sec']:>9.2f}"
+                          f" {latency['p50']:>9.1f} {latency['p99']:>9.1f} {latency['p999']:>9.1f}")
+
+    mgr.close_connection(client_conn)
+    if conditions is not None:
+        SteamNetworkManager.set_fake_network_conditions(SteamNetworkFakeConditions())
+
+    if args.json:
+        report = {
+            "config": {
+                "transport": args.transport,
+                "messages": args.messages,
+                "window": args.window,
+                "batch_size": args.batch_size,
+                "loss": args.loss,
+                "lag_ms": args.lag,
+                "reorder": args.reorder,
+                "dup": args.dup,
+                "python": platform.python_version(),
+                "platform": platform.platform(),
+            },
+            "results": results,
+        }
+        if args.json == "-":
+            json.dump(report, sys.stdout, indent=2)
+            print()
+        else:
+            Path(args.json).write_text(json.dumps(report, indent=2))
+            print(f"\nWrote {len(results)} results to {args.json}")
+
+
+if __name__ == "__main__":
+    main()
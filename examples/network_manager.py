@@ -2,7 +2,7 @@
 
 Demonstrates the SteamNetworkManager class which wraps the
 ISteamNetworkingSockets API into a Panda3D-friendly interface with
-datagram-based messaging and an event queue.
+datagram-based messaging and per-listen-socket event queues.
 
 This example runs a combined server and client within a single process
 using the SteamNetworkManager. Simply run:
@@ -61,53 +61,52 @@ def main():
     print(f"[client] Connecting to 127.0.0.1:{PORT}  (handle {client_conn})")
 
     client_sent = [False]
+    client_msg = SteamNetworkMessage()
 
     def poll(task):
-        # ---- process ALL events in one place ----
-        event = mgr.get_next_event()
-        while event is not None:
+        # ---- server-side events: only connections on our listen socket ----
+        for event in mgr.drain_events(listen):
             conn = event.connection
             old = event.old_state
             new = event.state
             print(f"  Event: conn={conn}  old_state={old}  state={new}")
 
-            # -- server-side events (any connection that is NOT our client handle) --
-            if conn != client_conn:
-                if old == STATE_NONE and new == STATE_CONNECTING:
-                    mgr.accept_connection(conn)
-                    mgr.set_connection_poll_group(conn, poll_group)
-                    server_clients[conn] = True
-                    print(f"[server] Accepted connection {conn}")
-
-                elif new == STATE_CONNECTED:
-                    print(f"[server] Connection {conn} is now fully connected.")
-
-                elif new in (STATE_CLOSED_BY_PEER, STATE_PROBLEM):
-                    print(f"[server] Connection {conn} lost (state {new}).")
-                    mgr.close_connection(conn)
-                    server_clients.pop(conn, None)
-
-            # -- client-side events --
-            else:
-                if new == STATE_CONNECTING:
-                    print(f"[client] Connecting …")
-
-                elif new == STATE_CONNECTED and not client_sent[0]:
-                    print("[client] Connected!  Sending test datagram …")
-                    dg = core.Datagram()
-                    dg.add_string("Hello from panda3d-steamworks!")
-                    mgr.send_datagram(client_conn, dg, SEND_RELIABLE)
-                    client_sent[0] = True
-
-                elif new in (STATE_CLOSED_BY_PEER, STATE_PROBLEM):
-                    print(f"[client] Connection lost (state {new}).")
-                    mgr.close_connection(client_conn)
-
-            event = mgr.get_next_event()
-
-        # ---- server: receive via poll group ----
-        msg = SteamNetworkMessage()
-        while mgr.receive_message_on_poll_group(poll_group, msg):
+            if old == STATE_NONE and new == STATE_CONNECTING:
+                mgr.accept_connection(conn)
+                mgr.set_connection_poll_group(conn, poll_group)
+                server_clients[conn] = True
+                print(f"[server] Accepted connection {conn}")
+
+            elif new == STATE_CONNECTED:
+                print(f"[server] Connection {conn} is now fully connected.")
+
+            elif new in (STATE_CLOSED_BY_PEER, STATE_PROBLEM):
+                print(f"[server] Connection {conn} lost (state {new}).")
+                mgr.close_connection(conn)
+                server_clients.pop(conn, None)
+
+        # ---- client-side events: outgoing connections have their own queue ----
+        for event in mgr.drain_client_events():
+            new = event.state
+            print(f"  Event: conn={event.connection}  old_state={event.old_state}  state={new}")
+
+            if new == STATE_CONNECTING:
+                print(f"[client] Connecting …")
+
+            elif new == STATE_CONNECTED and not client_sent[0]:
+                print("[client] Connected!  Sending test datagram …")
+                dg = core.Datagram()
+                dg.add_string("Hello from panda3d-steamworks!")
+                mgr.send_datagram(client_conn, dg, SEND_RELIABLE)
+                client_sent[0] = True
+
+            elif new in (STATE_CLOSED_BY_PEER, STATE_PROBLEM):
+                print(f"[client] Connection lost (state {new}).")
+                mgr.close_connection(client_conn)
+
+        # ---- server: receive via poll group into pooled messages ----
+        msg = mgr.receive_pooled_message_on_poll_group(poll_group)
+        while msg is not None:
             dgi = msg.dgi
             text = dgi.get_string()
             sender = msg.connection
@@ -116,15 +115,16 @@ def main():
             reply = core.Datagram()
             reply.add_string(f"echo: {text}")
             mgr.send_datagram(sender, reply, SEND_RELIABLE)
-            msg = SteamNetworkMessage()
 
-        # ---- client: receive replies ----
-        msg = SteamNetworkMessage()
-        while mgr.receive_message_on_connection(client_conn, msg):
-            dgi = msg.dgi
+            # Hand the message back so its buffer is reused.
+            mgr.release_message(msg)
+            msg = mgr.receive_pooled_message_on_poll_group(poll_group)
+
+        # ---- client: receive replies, reusing one message object ----
+        while mgr.receive_message_on_connection(client_conn, client_msg):
+            dgi = client_msg.dgi
             text = dgi.get_string()
             print(f"[client] Server replied: {text!r}")
-            msg = SteamNetworkMessage()
 
         return task.cont
 
@@ -0,0 +1,87 @@
+"""SteamNetworkMessagesManager — connectionless P2P messaging example.
+
+Sends messages to a peer by Steam ID, without opening a connection, and
+receives them in batches across two channels: channel 0 carries chat and
+channel 1 carries unreliable "voice" frames.  To keep it self-contained, the
+example messages itself.
+
+    ppython examples/network_messages_p2p.py
+"""
+
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from panda3d import core
+from panda3d_steamworks.showbase import SteamShowBase
+from panda3d_steamworks import (
+    SteamConstants,
+    SteamNetworkMessageBatch,
+    SteamNetworkMessagesManager,
+    SteamNetworkSessionEvent,
+    SteamUser,
+)
+
+SEND_RELIABLE = SteamConstants.k_nSteamNetworkingSend_Reliable
+SEND_UNRELIABLE = SteamConstants.k_nSteamNetworkingSend_Unreliable
+
+CHANNEL_CHAT = 0
+CHANNEL_VOICE = 1
+
+
+def main():
+    base = SteamShowBase(windowType="none")
+    msgs = SteamNetworkMessagesManager.get_global_ptr()
+
+    my_id = SteamUser.get_steam_id()
+    print(f"Your Steam ID: {my_id}\n")
+
+    # Accept every peer; a real game would check the lobby roster instead.
+    msgs.auto_accept_sessions = True
+    msgs.add_channel(CHANNEL_CHAT)
+    msgs.add_channel(CHANNEL_VOICE)
+
+    # One batch, refilled every frame.
+    batch = SteamNetworkMessageBatch()
+    frame = [0]
+
+    def poll(task):
+        event = msgs.get_next_event()
+        while event is not None:
+            if event.type == SteamNetworkSessionEvent.T_session_request:
+                print(f"Session requested by {event.remote_steam_id}")
+            else:
+                print(f"Session with {event.remote_steam_id} failed (end reason {event.end_reason})")
+            event = msgs.get_next_event()
+
+        frame[0] += 1
+        if frame[0] % 60 == 1:
+            dg = core.Datagram()
+            dg.add_string(f"chat message at frame {frame[0]}")
+            msgs.send_message_to_user(my_id, dg, SEND_RELIABLE, CHANNEL_CHAT)
+        if frame[0] % 6 == 1:
+            dg = core.Datagram()
+            dg.add_uint32(frame[0])
+            dg.append_data(b"\0" * 160)
+            msgs.send_message_to_user(my_id, dg, SEND_UNRELIABLE, CHANNEL_VOICE)
+
+        msgs.receive_messages(batch)
+        for i in range(len(batch)):
+            if batch.get_channel(i) == CHANNEL_CHAT:
+                text = batch[i].dgi.get_string()
+                print(f"[chat] {batch.get_remote_steam_id(i)}: {text!r}")
+        voice = sum(1 for i in range(len(batch)) if batch.get_channel(i) == CHANNEL_VOICE)
+        if voice:
+            print(f"[voice] {voice} frame(s)")
+
+        return task.cont
+
+    base.taskMgr.add(poll, "messages-poll")
+
+    print("Running … press Ctrl+C to quit.\n")
+    base.run()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,93 @@
+"""SteamNetworkManager — native auto-accept server example.
+
+Creates a server socket with ``create_ip_server``.  Incoming connections
+are accepted and put in the server's poll group inside the status
+callback, with no ``accept_connection`` round trip through Python.  The
+server admits at most ``MAX_CLIENTS`` clients.  The accept callback
+refuses any address on its ban list.  Python only sees one T_accepted or
+T_rejected event per client.
+
+To be self-contained, the example connects to itself once more than the
+server will admit:
+
+    ppython examples/network_server.py
+"""
+
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from panda3d import core
+from panda3d_steamworks.showbase import SteamShowBase
+from panda3d_steamworks import (
+    SteamConstants,
+    SteamNetworkEvent,
+    SteamNetworkingConnectionState,
+    SteamNetworkManager,
+)
+
+SEND_RELIABLE = SteamConstants.k_nSteamNetworkingSend_Reliable
+
+STATE_CONNECTED = SteamNetworkingConnectionState.k_ESteamNetworkingConnectionState_Connected
+STATE_CLOSED_BY_PEER = SteamNetworkingConnectionState.k_ESteamNetworkingConnectionState_ClosedByPeer
+STATE_PROBLEM = SteamNetworkingConnectionState.k_ESteamNetworkingConnectionState_ProblemDetectedLocally
+
+PORT = 27016
+MAX_CLIENTS = 2
+BANNED = {"10.0.0.13"}
+
+
+def main():
+    base = SteamShowBase(windowType="none")
+    mgr = SteamNetworkManager.get_global_ptr()
+
+    def allow(info):
+        # May run on the service thread: keep it quick.
+        host = info["address"].rsplit(":", 1)[0]
+        return host not in BANNED
+
+    poll_group = mgr.create_poll_group()
+    listen = mgr.create_ip_server(PORT, poll_group, MAX_CLIENTS, allow)
+    print(f"[server] Listening on port {PORT}, at most {MAX_CLIENTS} clients")
+
+    addr = core.NetAddress()
+    addr.set_host("127.0.0.1", PORT)
+    clients = [mgr.connect_by_ip_address(addr) for _ in range(MAX_CLIENTS + 1)]
+    greeted = set()
+
+    def poll(task):
+        for event in mgr.drain_events(listen):
+            conn = event.connection
+            if event.type == SteamNetworkEvent.T_accepted:
+                print(f"[server] Accepted {conn} ({mgr.get_num_server_clients(listen)} clients)")
+            elif event.type == SteamNetworkEvent.T_rejected:
+                print(f"[server] Rejected {conn} (end reason {event.end_reason})")
+            elif event.state in (STATE_CLOSED_BY_PEER, STATE_PROBLEM):
+                print(f"[server] Client {conn} left")
+                mgr.close_connection(conn)
+
+        for event in mgr.drain_client_events():
+            conn = event.connection
+            if event.state == STATE_CONNECTED and conn not in greeted:
+                dg = core.Datagram()
+                dg.add_string(f"hello from client {conn}")
+                mgr.send_datagram(conn, dg, SEND_RELIABLE)
+                greeted.add(conn)
+            elif event.state in (STATE_CLOSED_BY_PEER, STATE_PROBLEM):
+                print(f"[client] {conn} was turned away")
+                mgr.close_connection(conn)
+
+        for msg in mgr.receive_messages_on_poll_group(poll_group):
+            print(f"[server] {msg.connection}: {msg.dgi.get_string()!r}")
+
+        return task.cont
+
+    base.taskMgr.add(poll, "server-poll")
+
+    print("Running … press Ctrl+C to quit.\n")
+    base.run()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,182 @@
+"""SteamNetworkManager — sharded receive benchmark.
+
+Measures how receive throughput scales with the number of shards started
+by ``SteamNetworkManager.start_shard_threads``.  Each shard is a poll group
+drained by its own native worker thread, and read here by its own Python
+consumer thread, which sleeps in ``wait_for_shard_messages`` with the GIL
+released.
+
+For each shard count, the benchmark opens ``--connections`` in-process
+socket pairs and queues ``--messages`` messages on every one of them before
+any shard is running.  The clock starts when the server ends are spread
+over the shards and stops once every consumer has drained its share, so
+only the receive path is measured.
+
+    ppython examples/network_shard_benchmark.py [--shards 1,2,4,8] [--json results.json]
+"""
+
+import argparse
+import json
+import platform
+import sys
+import threading
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from panda3d import core
+from panda3d_steamworks.showbase import SteamShowBase
+from panda3d_steamworks import (
+    SteamConstants,
+    SteamNetworkingConfigValue,
+    SteamNetworkManager,
+)
+
+SEND_FLAGS = SteamConstants.k_nSteamNetworkingSend_Reliable
+
+# Give up on a run after this long without progress.
+IDLE_TIMEOUT = 2.0
+
+
+def tune_transport():
+    """Lifts the default send-rate cap and send buffer so every message can
+    be queued up front."""
+    SteamNetworkManager.set_global_config_int32(
+        SteamNetworkingConfigValue.k_ESteamNetworkingConfig_SendRateMin, 100_000_000)
+    SteamNetworkManager.set_global_config_int32(
+        SteamNetworkingConfigValue.k_ESteamNetworkingConfig_SendRateMax, 100_000_000)
+    SteamNetworkManager.set_global_config_int32(
+        SteamNetworkingConfigValue.k_ESteamNetworkingConfig_SendBufferSize, 16 * 1024 * 1024)
+
+
+def open_pairs(mgr, count):
+    """Opens count socket pairs and returns (client, server) handle tuples."""
+    pairs = []
+    for _ in range(count):
+        pair = mgr.create_socket_pair()
+        if pair is None:
+            raise RuntimeError("Failed to create socket pair.")
+        pairs.append(pair)
+    mgr.drain_events()
+    return pairs
+
+
+def consume(mgr, shard, counts, stop):
+    """Consumer thread: drains one shard until told to stop."""
+    while not stop.is_set():
+        if mgr.wait_for_shard_messages(shard, 0.05):
+            counts[shard] += len(mgr.drain_shard_messages(shard))
+
+
+def run(mgr, num_shards, num_connections, messages, size, interval):
+    """Times how long num_shards shards take to receive messages on each
+    of num_connections connections."""
+    pairs = open_pairs(mgr, num_connections)
+
+    dg = core.Datagram()
+    dg.append_data(b"\0" * size)
+    for client_conn, _ in pairs:
+        for _ in range(messages):
+            mgr.send_datagram(client_conn, dg, SEND_FLAGS)
+
+    if not mgr.start_shard_threads(num_shards, interval):
+        raise RuntimeError("Failed to start shard threads.")
+
+    counts = [0] * num_shards
+    stop = threading.Event()
+    consumers = [threading.Thread(target=consume, args=(mgr, shard, counts, stop))
+                 for shard in range(num_shards)]
+    for thread in consumers:
+        thread.start()
+
+    expected = num_connections * messages
+    start = time.perf_counter()
+    for _, server_conn in pairs:
+        mgr.assign_connection_to_shard(server_conn)
+
+    received = 0
+    last_progress = time.perf_counter()
+    while received < expected and time.perf_counter() - last_progress < IDLE_TIMEOUT:
+        time.sleep(0.001)
+        total = sum(counts)
+        if total != received:
+            received = total
+            last_progress = time.perf_counter()
+    elapsed = time.perf_counter() - start
+
+    stop.set()
+    for thread in consumers:
+        thread.join()
+    mgr.stop_shard_threads()
+    for client_conn, server_conn in pairs:
+        mgr.close_connection(client_conn)
+        mgr.close_connection(server_conn)
+    mgr.drain_events()
+
+    return {
+        "shards": num_shards,
+        "expected": expected,
+        "received": received,
+        "elapsed_ms": elapsed * 1000.0,
+        "msgs_per_sec": received / elapsed if elapsed > 0 else 0.0,
+        "per_shard": counts,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--shards", default="1,2,4,8", help="comma-separated shard counts")
+    parser.add_argument("--connections", type=int, default=256, help="connections per run")
+    parser.add_argument("--messages", type=int, default=200, help="messages per connection")
+    parser.add_argument("--size", type=int, default=64, help="payload size in bytes")
+    parser.add_argument("--interval", type=float, default=0.0005, help="shard worker poll interval in seconds")
+    parser.add_argument("--json", metavar="PATH", help="write results as JSON to PATH ('-' for stdout)")
+    args = parser.parse_args()
+
+    shard_counts = [int(item) for item in args.shards.split(",") if item]
+
+    SteamShowBase(windowType="none")
+    mgr = SteamNetworkManager.get_global_ptr()
+    tune_transport()
+
+    results = []
+    human = args.json != "-"
+    if human:
+        print(f"{args.connections} connections x {args.messages} messages of {args.size} bytes\n")
+        print(f"  {'shards':>6} {'recv':>9} {'ms':>9} {'msgs/sec':>12} {'speedup':>8}")
+
+    baseline = None
+    for num_shards in shard_counts:
+        result = run(mgr, num_shards, args.connections, args.messages, args.size, args.interval)
+        if baseline is None:
+            baseline = result["msgs_per_sec"] or 1.0
+        result["speedup"] = result["msgs_per_sec"] / baseline
+        results.append(result)
+
+        if human:
+            print(f"  {num_shards:>6} {result['received']:>9} {result['elapsed_ms']:>9.1f}"
+                  f" {result['msgs_per_sec']:>12,.0f} {result['speedup']:>7.2f}x")
+
+    if args.json:
+        report = {
+            "config": {
+                "connections": args.connections,
+                "messages": args.messages,
+                "size": args.size,
+                "interval": args.interval,
+                "python": platform.python_version(),
+                "platform": platform.platform(),
+            },
+            "results": results,
+        }
+        if args.json == "-":
+            json.dump(report, sys.stdout, indent=2)
+            print()
+        else:
+            Path(args.json).write_text(json.dumps(report, indent=2))
+            print(f"\nWrote {len(results)} results to {args.json}")
+
+
+if __name__ == "__main__":
+    main()
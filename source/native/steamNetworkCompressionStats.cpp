@@ -0,0 +1,104 @@
+///
+// Copyright (c) 2026, Digital Descent, LLC. All rights reserved.
+//
+
+#include "steamNetworkCompressionStats.h"
+
+// Guard everything below from interrogate's parser.
+#ifndef CPPPARSER
+
+////////////////////////////////////////////////////////////////////
+//     Function: SteamNetworkCompressionStats::SteamNetworkCompressionStats
+//       Access: Published
+//  Description: Default constructor.  All counters start at zero.
+////////////////////////////////////////////////////////////////////
+SteamNetworkCompressionStats::SteamNetworkCompressionStats() {
+  _num_compressed = 0;
+  _num_uncompressed = 0;
+  _bytes_in = 0;
+  _bytes_out = 0;
+  _compress_time = 0.0;
+  _num_decompressed = 0;
+  _decompress_time = 0.0;
+}
+
+////////////////////////////////////////////////////////////////////
+//     Function: SteamNetworkCompressionStats::get_num_compressed
+//       Access: Published
+//  Description: Returns the number of payloads sent compressed.
+////////////////////////////////////////////////////////////////////
+size_t SteamNetworkCompressionStats::get_num_compressed() const {
+    return _num_compressed;
+}
+
+////////////////////////////////////////////////////////////////////
+//     Function: SteamNetworkCompressionStats::get_num_uncompressed
+//       Access: Published
+//  Description: Returns the number of payloads sent raw, because
+//               they were under the threshold or did not shrink.
+////////////////////////////////////////////////////////////////////
+size_t SteamNetworkCompressionStats::get_num_uncompressed() const {
+    return _num_uncompressed;
+}
+
+////////////////////////////////////////////////////////////////////
+//     Function: SteamNetworkCompressionStats::get_bytes_in
+//       Access: Published
+//  Description: Returns the total size of the payloads that were
+//               compressed, before compression.
+////////////////////////////////////////////////////////////////////
+size_t SteamNetworkCompressionStats::get_bytes_in() const {
+    return _bytes_in;
+}
+
+////////////////////////////////////////////////////////////////////
+//     Function: SteamNetworkCompressionStats::get_bytes_out
+//       Access: Published
+//  Description: Returns the total size of the compressed payloads
+//               after compression.
+////////////////////////////////////////////////////////////////////
+size_t SteamNetworkCompressionStats::get_bytes_out() const {
+    return _bytes_out;
+}
+
+////////////////////////////////////////////////////////////////////
+//     Function: SteamNetworkCompressionStats::get_compress_time
+//       Access: Published
+//  Description: Returns the time, in seconds, spent compressing.
+////////////////////////////////////////////////////////////////////
+double SteamNetworkCompressionStats::get_compress_time() const {
+    return _compress_time;
+}
+
+////////////////////////////////////////////////////////////////////
+//     Function: SteamNetworkCompressionStats::get_num_decompressed
+//       Access: Published
+//  Description: Returns the number of payloads received compressed.
+////////////////////////////////////////////////////////////////////
+size_t SteamNetworkCompressionStats::get_num_decompressed() const {
+    return _num_decompressed;
+}
+
+////////////////////////////////////////////////////////////////////
+//     Function: SteamNetworkCompressionStats::get_decompress_time
+//       Access: Published
+//  Description: Returns the time, in seconds, spent decompressing.
+////////////////////////////////////////////////////////////////////
+double SteamNetworkCompressionStats::get_decompress_time() const {
+    return _decompress_time;
+}
+
+////////////////////////////////////////////////////////////////////
+//     Function: SteamNetworkCompressionStats::get_compression_ratio
+//       Access: Published
+//  Description: Returns bytes_out / bytes_in, or 1.0 if nothing has
+//               been compressed yet.
+////////////////////////////////////////////////////////////////////
+double SteamNetworkCompressionStats::get_compression_ratio() const {
+    if (_bytes_in == 0) {
+        return 1.0;
+    }
+    return (double)_bytes_out / (double)_bytes_in;
+}
+
+#endif  // CPPPARSER
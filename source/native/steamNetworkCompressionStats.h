@@ -0,0 +1,49 @@
+///
+// Copyright (c) 2026, Digital Descent, LLC. All rights reserved.
+//
+
+#pragma once
+
+#include "steamConstants_bindings.h"
+#include "steamPython_bindings.h"
+
+////////////////////////////////////////////////////////////////////
+//       Class : SteamNetworkCompressionStats
+// Description : Counters for the payload compression applied by
+//               SteamNetworkManager to connections that opted in
+//               with set_connection_compression.  Used to tune the
+//               compression threshold.
+////////////////////////////////////////////////////////////////////
+class EXPORT_CLASS SteamNetworkCompressionStats {
+PUBLISHED:
+  SteamNetworkCompressionStats();
+
+  size_t get_num_compressed() const;
+  size_t get_num_uncompressed() const;
+  size_t get_bytes_in() const;
+  size_t get_bytes_out() const;
+  double get_compress_time() const;
+  size_t get_num_decompressed() const;
+  double get_decompress_time() const;
+  double get_compression_ratio() const;
+
+  MAKE_PROPERTY(num_compressed, get_num_compressed);
+  MAKE_PROPERTY(num_uncompressed, get_num_uncompressed);
+  MAKE_PROPERTY(bytes_in, get_bytes_in);
+  MAKE_PROPERTY(bytes_out, get_bytes_out);
+  MAKE_PROPERTY(compress_time, get_compress_time);
+  MAKE_PROPERTY(num_decompressed, get_num_decompressed);
+  MAKE_PROPERTY(decompress_time, get_decompress_time);
+  MAKE_PROPERTY(compression_ratio, get_compression_ratio);
+
+private:
+  size_t _num_compressed;
+  size_t _num_uncompressed;
+  size_t _bytes_in;
+  size_t _bytes_out;
+  double _compress_time;
+  size_t _num_decompressed;
+  double _decompress_time;
+
+  friend class SteamNetworkManager;
+};
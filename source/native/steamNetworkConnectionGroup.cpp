@@ -0,0 +1,96 @@
+///
+// Copyright (c) 2026, Digital Descent, LLC. All rights reserved.
+//
+
+#include "steamNetworkConnectionGroup.h"
+
+// Guard everything below from interrogate's parser.
+#ifndef CPPPARSER
+#include "steamConstants_bindings.h"
+#include "steamEnums_bindings.h"
+#include <algorithm>
+
+////////////////////////////////////////////////////////////////////
+//     Function: SteamNetworkConnectionGroup::add_connection
+//       Access: Published
+//  Description: Adds the connection to the group.  Returns false if
+//               it was already a member.
+////////////////////////////////////////////////////////////////////
+bool SteamNetworkConnectionGroup::add_connection(SteamNetworkConnectionHandle connection) {
+    if (has_connection(connection)) {
+        return false;
+    }
+    _connections.push_back(connection);
+    return true;
+}
+
+////////////////////////////////////////////////////////////////////
+//     Function: SteamNetworkConnectionGroup::remove_connection
+//       Access: Published
+//  Description: Removes the connection from the group.  Returns
+//               false if it was not a member.  Does not preserve
+//               the order of the remaining connections.
+////////////////////////////////////////////////////////////////////
+bool SteamNetworkConnectionGroup::remove_connection(SteamNetworkConnectionHandle connection) {
+    pvector<SteamNetworkConnectionHandle>::iterator it =
+        std::find(_connections.begin(), _connections.end(), connection);
+    if (it == _connections.end()) {
+        return false;
+    }
+    *it = _connections.back();
+    _connections.pop_back();
+    return true;
+}
+
+////////////////////////////////////////////////////////////////////
+//     Function: SteamNetworkConnectionGroup::has_connection
+//       Access: Published
+////////////////////////////////////////////////////////////////////
+bool SteamNetworkConnectionGroup::has_connection(SteamNetworkConnectionHandle connection) const {
+    return std::find(_connections.begin(), _connections.end(), connection) != _connections.end();
+}
+
+////////////////////////////////////////////////////////////////////
+//     Function: SteamNetworkConnectionGroup::clear
+//       Access: Published
+////////////////////////////////////////////////////////////////////
+void SteamNetworkConnectionGroup::clear() {
+    _connections.clear();
+}
+
+////////////////////////////////////////////////////////////////////
+//     Function: SteamNetworkConnectionGroup::get_num_connections
+//       Access: Published
+////////////////////////////////////////////////////////////////////
+size_t SteamNetworkConnectionGroup::get_num_connections() const {
+    return _connections.size();
+}
+
+////////////////////////////////////////////////////////////////////
+//     Function: SteamNetworkConnectionGroup::get_connection
+//       Access: Published
+////////////////////////////////////////////////////////////////////
+SteamNetworkConnectionHandle SteamNetworkConnectionGroup::get_connection(size_t n) const {
+    nassertr(n < _connections.size(), INVALID_STEAM_NETWORK_CONNECTION_HANDLE);
+    return _connections[n];
+}
+
+////////////////////////////////////////////////////////////////////
+//     Function: SteamNetworkConnectionGroup::size
+//       Access: Published
+//  Description: Python len() support; same as get_num_connections().
+////////////////////////////////////////////////////////////////////
+size_t SteamNetworkConnectionGroup::size() const {
+    return _connections.size();
+}
+
+////////////////////////////////////////////////////////////////////
+//     Function: SteamNetworkConnectionGroup::operator []
+//       Access: Published
+//  Description: Python indexing support; same as get_connection().
+////////////////////////////////////////////////////////////////////
+SteamNetworkConnectionHandle SteamNetworkConnectionGroup::operator [] (size_t n) const {
+    return get_connection(n);
+}
+
+#endif  // CPPPARSER
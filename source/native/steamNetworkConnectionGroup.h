@@ -0,0 +1,43 @@
+///
+// Copyright (c) 2026, Digital Descent, LLC. All rights reserved.
+//
+
+#pragma once
+
+#include "steamConstants_bindings.h"
+#include "steamPython_bindings.h"
+
+#include "referenceCount.h"
+#include "pvector.h"
+
+////////////////////////////////////////////////////////////////////
+//       Class : SteamNetworkConnectionGroup
+// Description : A set of connection handles maintained natively, so
+//               servers can keep their client list across ticks and
+//               broadcast to it without rebuilding Python lists.
+//               SteamNetworkManager keeps one of these per poll
+//               group, updated by set_connection_poll_group and
+//               close_connection.
+////////////////////////////////////////////////////////////////////
+class EXPORT_CLASS SteamNetworkConnectionGroup : public ReferenceCount {
+PUBLISHED:
+  SteamNetworkConnectionGroup() = default;
+  virtual ~SteamNetworkConnectionGroup() = default;
+
+  bool add_connection(SteamNetworkConnectionHandle connection);
+  bool remove_connection(SteamNetworkConnectionHandle connection);
+  bool has_connection(SteamNetworkConnectionHandle connection) const;
+  void clear();
+
+  size_t get_num_connections() const;
+  SteamNetworkConnectionHandle get_connection(size_t n) const;
+  MAKE_SEQ(get_connections, get_num_connections, get_connection);
+
+  size_t size() const;
+  SteamNetworkConnectionHandle operator [] (size_t n) const;
+
+  MAKE_SEQ_PROPERTY(connections, get_num_connections, get_connection);
+
+private:
+  pvector<SteamNetworkConnectionHandle> _connections;
+};
@@ -16,9 +16,29 @@
 //               with invalid/default values.
 ////////////////////////////////////////////////////////////////////
 SteamNetworkConnectionInfo::SteamNetworkConnectionInfo() {
+  _connection = INVALID_STEAM_NETWORK_CONNECTION_HANDLE;
   _listen_socket = INVALID_STEAM_NETWORK_LISTEN_SOCKET_HANDLE;
   _state = SteamNetworkingConnectionState::k_ESteamNetworkingConnectionState_None;
   _end_reason = 0;
+  _remote_steam_id = 0;
+  _connect_time = 0.0;
+  _user_data = 0;
+}
+
+////////////////////////////////////////////////////////////////////
+//     Function: SteamNetworkConnectionInfo::set_connection
+//       Access: Published
+////////////////////////////////////////////////////////////////////
+void SteamNetworkConnectionInfo::set_connection(SteamNetworkConnectionHandle connection) {
+    _connection = connection;
+}
+
+////////////////////////////////////////////////////////////////////
+//     Function: SteamNetworkConnectionInfo::get_connection
+//       Access: Published
+////////////////////////////////////////////////////////////////////
+SteamNetworkConnectionHandle SteamNetworkConnectionInfo::get_connection() const {
+    return _connection;
 }
 
 ////////////////////////////////////////////////////////////////////
@@ -85,4 +105,60 @@ int SteamNetworkConnectionInfo::get_end_reason() const {
     return _end_reason;
 }
 
+////////////////////////////////////////////////////////////////////
+//     Function: SteamNetworkConnectionInfo::set_remote_steam_id
+//       Access: Published
+////////////////////////////////////////////////////////////////////
+void SteamNetworkConnectionInfo::set_remote_steam_id(uint64_t steam_id) {
+    _remote_steam_id = steam_id;
+}
+
+////////////////////////////////////////////////////////////////////
+//     Function: SteamNetworkConnectionInfo::get_remote_steam_id
+//       Access: Published
+//  Description: Returns the remote peer's 64-bit Steam ID, or 0 if
+//               the peer is not identified by a Steam ID.
+////////////////////////////////////////////////////////////////////
+uint64_t SteamNetworkConnectionInfo::get_remote_steam_id() const {
+    return _remote_steam_id;
+}
+
+////////////////////////////////////////////////////////////////////
+//     Function: SteamNetworkConnectionInfo::set_connect_time
+//       Access: Published
+////////////////////////////////////////////////////////////////////
+void SteamNetworkConnectionInfo::set_connect_time(double connect_time) {
+    _connect_time = connect_time;
+}
+
+////////////////////////////////////////////////////////////////////
+//     Function: SteamNetworkConnectionInfo::get_connect_time
+//       Access: Published
+//  Description: Returns when the connection was first seen, in
+//               seconds on Steam's local timestamp clock, or 0 if
+//               unknown.  Compare against
+//               SteamNetworkManager::get_local_time.
+////////////////////////////////////////////////////////////////////
+double SteamNetworkConnectionInfo::get_connect_time() const {
+    return _connect_time;
+}
+
+////////////////////////////////////////////////////////////////////
+//     Function: SteamNetworkConnectionInfo::set_user_data
+//       Access: Published
+////////////////////////////////////////////////////////////////////
+void SteamNetworkConnectionInfo::set_user_data(int64_t user_data) {
+    _user_data = user_data;
+}
+
+////////////////////////////////////////////////////////////////////
+//     Function: SteamNetworkConnectionInfo::get_user_data
+//       Access: Published
+//  Description: Returns the application-defined value attached with
+//               SteamNetworkManager::set_connection_user_data.
+////////////////////////////////////////////////////////////////////
+int64_t SteamNetworkConnectionInfo::get_user_data() const {
+    return _user_data;
+}
+
 #endif // CPPPARSER
\ No newline at end of file
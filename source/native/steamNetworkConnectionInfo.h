@@ -13,13 +13,18 @@
 ////////////////////////////////////////////////////////////////////
 //       Class : SteamNetworkConnectionInfo
 // Description : Holds metadata about a Valve GameSockets connection,
-//               including state, end reason, listen socket handle, and address.
+//               including state, end reason, listen socket handle, address,
+//               the remote peer's Steam ID, when it connected and an
+//               application-defined user data value.
 ////////////////////////////////////////////////////////////////////
 class EXPORT_CLASS SteamNetworkConnectionInfo : public ReferenceCount {
 PUBLISHED:
   SteamNetworkConnectionInfo();
   virtual ~SteamNetworkConnectionInfo() = default;
 
+  void set_connection(SteamNetworkConnectionHandle connection);
+  SteamNetworkConnectionHandle get_connection() const;
+
   void set_listen_socket(SteamNetworkListenSocketHandle socket);
   SteamNetworkListenSocketHandle get_listen_socket() const;
     
@@ -32,14 +37,31 @@ PUBLISHED:
   void set_end_reason(int reason);
   int get_end_reason() const;
 
+  void set_remote_steam_id(uint64_t steam_id);
+  uint64_t get_remote_steam_id() const;
+
+  void set_connect_time(double connect_time);
+  double get_connect_time() const;
+
+  void set_user_data(int64_t user_data);
+  int64_t get_user_data() const;
+
+  MAKE_PROPERTY(connection, get_connection, set_connection);
   MAKE_PROPERTY(listen_socket, get_listen_socket, set_listen_socket);
   MAKE_PROPERTY(net_address, get_net_address);
   MAKE_PROPERTY(state, get_state);
   MAKE_PROPERTY(end_reason, get_end_reason);
+  MAKE_PROPERTY(remote_steam_id, get_remote_steam_id);
+  MAKE_PROPERTY(connect_time, get_connect_time);
+  MAKE_PROPERTY(user_data, get_user_data, set_user_data);
 
 private:
+  SteamNetworkConnectionHandle _connection;
   SteamNetworkListenSocketHandle _listen_socket;
   NetAddress _net_address;
   int _state;
   int _end_reason;
+  uint64_t _remote_steam_id;
+  double _connect_time;
+  int64_t _user_data;
 };
\ No newline at end of file
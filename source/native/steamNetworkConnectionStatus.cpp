@@ -0,0 +1,257 @@
+///
+// Copyright (c) 2026, Digital Descent, LLC. All rights reserved.
+//
+
+#include "steamNetworkConnectionStatus.h"
+
+// Guard everything below from interrogate's parser.
+#ifndef CPPPARSER
+#include "steamConstants_bindings.h"
+#include "steamEnums_bindings.h"
+#include <string.h>
+
+static_assert(sizeof(SteamNetworkConnectionStatusRecord) == 64, "SteamNetworkConnectionStatusRecord must match its buffer format");
+
+// PEP 3118 format describing SteamNetworkConnectionStatusRecord.
+static const char *const status_record_format =
+    "T{=I:connection:i:state:i:ping:f:connection_quality_local:f:connection_quality_remote:"
+    "f:out_packets_per_sec:f:out_bytes_per_sec:f:in_packets_per_sec:f:in_bytes_per_sec:"
+    "i:send_rate:i:pending_unreliable:i:pending_reliable:i:sent_unacked_reliable:4x:q:queue_time:}";
+
+////////////////////////////////////////////////////////////////////
+//     Function: SteamNetworkConnectionStatusRecord::set
+//       Access: Public
+//  Description: Copies the fields of a Steam real-time status.
+////////////////////////////////////////////////////////////////////
+void SteamNetworkConnectionStatusRecord::set(SteamNetworkConnectionHandle connection, const SteamNetConnectionRealTimeStatus_t &status) {
+    _connection = connection;
+    _state = static_cast<int32_t>(status.m_eState);
+    _ping = status.m_nPing;
+    _quality_local = status.m_flConnectionQualityLocal;
+    _quality_remote = status.m_flConnectionQualityRemote;
+    _out_packets_per_sec = status.m_flOutPacketsPerSec;
+    _out_bytes_per_sec = status.m_flOutBytesPerSec;
+    _in_packets_per_sec = status.m_flInPacketsPerSec;
+    _in_bytes_per_sec = status.m_flInBytesPerSec;
+    _send_rate = status.m_nSendRateBytesPerSecond;
+    _pending_unreliable = status.m_cbPendingUnreliable;
+    _pending_reliable = status.m_cbPendingReliable;
+    _sent_unacked_reliable = status.m_cbSentUnackedReliable;
+    _reserved = 0;
+    _queue_time = status.m_usecQueueTime;
+}
+
+////////////////////////////////////////////////////////////////////
+//     Function: SteamNetworkConnectionStatus::SteamNetworkConnectionStatus
+//       Access: Published
+//  Description: Default constructor.  All fields start out zeroed.
+////////////////////////////////////////////////////////////////////
+SteamNetworkConnectionStatus::SteamNetworkConnectionStatus() {
+    memset(&_record, 0, sizeof(_record));
+}
+
+////////////////////////////////////////////////////////////////////
+//     Function: SteamNetworkConnectionStatus::get_connection
+//       Access: Published
+////////////////////////////////////////////////////////////////////
+SteamNetworkConnectionHandle SteamNetworkConnectionStatus::get_connection() const {
+    return _record._connection;
+}
+
+////////////////////////////////////////////////////////////////////
+//     Function: SteamNetworkConnectionStatus::get_state
+//       Access: Published
+////////////////////////////////////////////////////////////////////
+int SteamNetworkConnectionStatus::get_state() const {
+    return _record._state;
+}
+
+////////////////////////////////////////////////////////////////////
+//     Function: SteamNetworkConnectionStatus::get_ping
+//       Access: Published
+//  Description: Returns the round-trip time in milliseconds.
+////////////////////////////////////////////////////////////////////
+int SteamNetworkConnectionStatus::get_ping() const {
+    return _record._ping;
+}
+
+////////////////////////////////////////////////////////////////////
+//     Function: SteamNetworkConnectionStatus::get_connection_quality_local
+//       Access: Published
+//  Description: Returns the fraction of packets the local end
+//               received intact, from 0 to 1, or -1 if unknown.
+////////////////////////////////////////////////////////////////////
+float SteamNetworkConnectionStatus::get_connection_quality_local() const {
+    return _record._quality_local;
+}
+
+////////////////////////////////////////////////////////////////////
+//     Function: SteamNetworkConnectionStatus::get_connection_quality_remote
+//       Access: Published
+//  Description: Returns the fraction of packets the remote end
+//               received intact, from 0 to 1, or -1 if unknown.
+////////////////////////////////////////////////////////////////////
+float SteamNetworkConnectionStatus::get_connection_quality_remote() const {
+    return _record._quality_remote;
+}
+
+////////////////////////////////////////////////////////////////////
+//     Function: SteamNetworkConnectionStatus::get_out_packets_per_sec
+//       Access: Published
+////////////////////////////////////////////////////////////////////
+float SteamNetworkConnectionStatus::get_out_packets_per_sec() const {
+    return _record._out_packets_per_sec;
+}
+
+////////////////////////////////////////////////////////////////////
+//     Function: SteamNetworkConnectionStatus::get_out_bytes_per_sec
+//       Access: Published
+////////////////////////////////////////////////////////////////////
+float SteamNetworkConnectionStatus::get_out_bytes_per_sec() const {
+    return _record._out_bytes_per_sec;
+}
+
+////////////////////////////////////////////////////////////////////
+//     Function: SteamNetworkConnectionStatus::get_in_packets_per_sec
+//       Access: Published
+////////////////////////////////////////////////////////////////////
+float SteamNetworkConnectionStatus::get_in_packets_per_sec() const {
+    return _record._in_packets_per_sec;
+}
+
+////////////////////////////////////////////////////////////////////
+//     Function: SteamNetworkConnectionStatus::get_in_bytes_per_sec
+//       Access: Published
+////////////////////////////////////////////////////////////////////
+float SteamNetworkConnectionStatus::get_in_bytes_per_sec() const {
+    return _record._in_bytes_per_sec;
+}
+
+////////////////////////////////////////////////////////////////////
+//     Function: SteamNetworkConnectionStatus::get_send_rate
+//       Access: Published
+//  Description: Returns the estimated available send rate, in
+//               bytes per second.
+////////////////////////////////////////////////////////////////////
+int SteamNetworkConnectionStatus::get_send_rate() const {
+    return _record._send_rate;
+}
+
+////////////////////////////////////////////////////////////////////
+//     Function: SteamNetworkConnectionStatus::get_pending_unreliable
+//       Access: Published
+//  Description: Returns the number of unreliable bytes queued
+//               but not yet sent.
+////////////////////////////////////////////////////////////////////
+int SteamNetworkConnectionStatus::get_pending_unreliable() const {
+    return _record._pending_unreliable;
+}
+
+////////////////////////////////////////////////////////////////////
+//     Function: SteamNetworkConnectionStatus::get_pending_reliable
+//       Access: Published
+//  Description: Returns the number of reliable bytes queued but
+//               not yet sent.
+////////////////////////////////////////////////////////////////////
+int SteamNetworkConnectionStatus::get_pending_reliable() const {
+    return _record._pending_reliable;
+}
+
+////////////////////////////////////////////////////////////////////
+//     Function: SteamNetworkConnectionStatus::get_sent_unacked_reliable
+//       Access: Published
+//  Description: Returns the number of reliable bytes sent but
+//               not yet acknowledged.
+////////////////////////////////////////////////////////////////////
+int SteamNetworkConnectionStatus::get_sent_unacked_reliable() const {
+    return _record._sent_unacked_reliable;
+}
+
+////////////////////////////////////////////////////////////////////
+//     Function: SteamNetworkConnectionStatus::get_queue_time
+//       Access: Published
+//  Description: Returns the estimated time in microseconds a
+//               message queued now would wait before being sent.
+////////////////////////////////////////////////////////////////////
+int64_t SteamNetworkConnectionStatus::get_queue_time() const {
+    return _record._queue_time;
+}
+
+////////////////////////////////////////////////////////////////////
+//     Function: SteamNetworkConnectionStatus::set_record
+//       Access: Public
+////////////////////////////////////////////////////////////////////
+void SteamNetworkConnectionStatus::set_record(const SteamNetworkConnectionStatusRecord &record) {
+    _record = record;
+}
+
+////////////////////////////////////////////////////////////////////
+//     Function: SteamNetworkConnectionStatusBatch::get_num_statuses
+//       Access: Published
+////////////////////////////////////////////////////////////////////
+size_t SteamNetworkConnectionStatusBatch::get_num_statuses() const {
+    return _records.size();
+}
+
+////////////////////////////////////////////////////////////////////
+//     Function: SteamNetworkConnectionStatusBatch::get_status
+//       Access: Published
+//  Description: Returns the nth entry as a SteamNetworkConnectionStatus.
+////////////////////////////////////////////////////////////////////
+PT(SteamNetworkConnectionStatus) SteamNetworkConnectionStatusBatch::get_status(size_t n) const {
+    nassertr(n < _records.size(), nullptr);
+    PT(SteamNetworkConnectionStatus) status = new SteamNetworkConnectionStatus;
+    status->set_record(_records[n]);
+    return status;
+}
+
+////////////////////////////////////////////////////////////////////
+//     Function: SteamNetworkConnectionStatusBatch::size
+//       Access: Published
+//  Description: Python len() support; same as get_num_statuses().
+////////////////////////////////////////////////////////////////////
+size_t SteamNetworkConnectionStatusBatch::size() const {
+    return _records.size();
+}
+
+////////////////////////////////////////////////////////////////////
+//     Function: SteamNetworkConnectionStatusBatch::operator []
+//       Access: Published
+//  Description: Python indexing support; same as get_status().
+////////////////////////////////////////////////////////////////////
+PT(SteamNetworkConnectionStatus) SteamNetworkConnectionStatusBatch::operator [] (size_t n) const {
+    return get_status(n);
+}
+
+////////////////////////////////////////////////////////////////////
+//     Function: SteamNetworkConnectionStatusBatch::__getbuffer__
+//       Access: Published
+//  Description: Exposes the records as a read-only one-dimensional
+//               array of structs.
+////////////////////////////////////////////////////////////////////
+int SteamNetworkConnectionStatusBatch::__getbuffer__(PyObject *self, Py_buffer *view, int flags) const {
+    if ((flags & PyBUF_WRITABLE) == PyBUF_WRITABLE) {
+        PyErr_SetString(PyExc_BufferError, "SteamNetworkConnectionStatusBatch is read-only");
+        return -1;
+    }
+
+    SteamNetworkConnectionStatusBatch *batch = const_cast<SteamNetworkConnectionStatusBatch *>(this);
+    batch->_shape = static_cast<Py_ssize_t>(_records.size());
+    batch->_stride = static_cast<Py_ssize_t>(sizeof(SteamNetworkConnectionStatusRecord));
+
+    view->obj = self;
+    Py_INCREF(self);
+    view->buf = _records.empty() ? (void *)this : (void *)_records.data();
+    view->len = _shape * _stride;
+    view->readonly = 1;
+    view->itemsize = _stride;
+    view->format = (flags & PyBUF_FORMAT) ? (char *)status_record_format : nullptr;
+    view->ndim = 1;
+    view->shape = (flags & PyBUF_ND) ? &batch->_shape : nullptr;
+    view->strides = ((flags & PyBUF_STRIDES) == PyBUF_STRIDES) ? &batch->_stride : nullptr;
+    view->suboffsets = nullptr;
+    view->internal = nullptr;
+    return 0;
+}
+
+#endif  // CPPPARSER
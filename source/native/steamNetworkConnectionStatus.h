@@ -0,0 +1,124 @@
+///
+// Copyright (c) 2026, Digital Descent, LLC. All rights reserved.
+//
+
+#pragma once
+
+#include "steamConstants_bindings.h"
+#include "steamPython_bindings.h"
+
+#include "referenceCount.h"
+#include "pointerTo.h"
+#include "pvector.h"
+
+#ifndef CPPPARSER
+////////////////////////////////////////////////////////////////////
+//       Class : SteamNetworkConnectionStatusRecord
+// Description : Plain real-time status record for one connection.
+//               The layout is exported verbatim through the buffer
+//               protocol of SteamNetworkConnectionStatusBatch.
+////////////////////////////////////////////////////////////////////
+struct SteamNetworkConnectionStatusRecord {
+  uint32_t _connection;
+  int32_t _state;
+  int32_t _ping;
+  float _quality_local;
+  float _quality_remote;
+  float _out_packets_per_sec;
+  float _out_bytes_per_sec;
+  float _in_packets_per_sec;
+  float _in_bytes_per_sec;
+  int32_t _send_rate;
+  int32_t _pending_unreliable;
+  int32_t _pending_reliable;
+  int32_t _sent_unacked_reliable;
+  int32_t _reserved;
+  int64_t _queue_time;
+
+  void set(SteamNetworkConnectionHandle connection, const SteamNetConnectionRealTimeStatus_t &status);
+};
+#endif
+
+////////////////////////////////////////////////////////////////////
+//       Class : SteamNetworkConnectionStatus
+// Description : Real-time quality and throughput snapshot of a
+//               Valve GameSockets connection, as reported by
+//               GetConnectionRealTimeStatus.
+////////////////////////////////////////////////////////////////////
+class EXPORT_CLASS SteamNetworkConnectionStatus : public ReferenceCount {
+PUBLISHED:
+  SteamNetworkConnectionStatus();
+  virtual ~SteamNetworkConnectionStatus() = default;
+
+  SteamNetworkConnectionHandle get_connection() const;
+  int get_state() const;
+  int get_ping() const;
+  float get_connection_quality_local() const;
+  float get_connection_quality_remote() const;
+  float get_out_packets_per_sec() const;
+  float get_out_bytes_per_sec() const;
+  float get_in_packets_per_sec() const;
+  float get_in_bytes_per_sec() const;
+  int get_send_rate() const;
+  int get_pending_unreliable() const;
+  int get_pending_reliable() const;
+  int get_sent_unacked_reliable() const;
+  int64_t get_queue_time() const;
+
+  MAKE_PROPERTY(connection, get_connection);
+  MAKE_PROPERTY(state, get_state);
+  MAKE_PROPERTY(ping, get_ping);
+  MAKE_PROPERTY(connection_quality_local, get_connection_quality_local);
+  MAKE_PROPERTY(connection_quality_remote, get_connection_quality_remote);
+  MAKE_PROPERTY(out_packets_per_sec, get_out_packets_per_sec);
+  MAKE_PROPERTY(out_bytes_per_sec, get_out_bytes_per_sec);
+  MAKE_PROPERTY(in_packets_per_sec, get_in_packets_per_sec);
+  MAKE_PROPERTY(in_bytes_per_sec, get_in_bytes_per_sec);
+  MAKE_PROPERTY(send_rate, get_send_rate);
+  MAKE_PROPERTY(pending_unreliable, get_pending_unreliable);
+  MAKE_PROPERTY(pending_reliable, get_pending_reliable);
+  MAKE_PROPERTY(sent_unacked_reliable, get_sent_unacked_reliable);
+  MAKE_PROPERTY(queue_time, get_queue_time);
+
+#ifndef CPPPARSER
+public:
+  void set_record(const SteamNetworkConnectionStatusRecord &record);
+
+private:
+  SteamNetworkConnectionStatusRecord _record;
+#endif
+};
+
+////////////////////////////////////////////////////////////////////
+//       Class : SteamNetworkConnectionStatusBatch
+// Description : Real-time status of many connections, captured in a
+//               single call.  Entries can be indexed or iterated, or
+//               viewed as a NumPy structured array through the
+//               buffer protocol, with one field per
+//               SteamNetworkConnectionStatus property.
+////////////////////////////////////////////////////////////////////
+class EXPORT_CLASS SteamNetworkConnectionStatusBatch : public ReferenceCount {
+PUBLISHED:
+  SteamNetworkConnectionStatusBatch() = default;
+  virtual ~SteamNetworkConnectionStatusBatch() = default;
+
+  size_t get_num_statuses() const;
+  PT(SteamNetworkConnectionStatus) get_status(size_t n) const;
+  MAKE_SEQ(get_statuses, get_num_statuses, get_status);
+
+  size_t size() const;
+  PT(SteamNetworkConnectionStatus) operator [] (size_t n) const;
+
+  int __getbuffer__(PyObject *self, Py_buffer *view, int flags) const;
+
+  MAKE_SEQ_PROPERTY(statuses, get_num_statuses, get_status);
+
+private:
+#ifndef CPPPARSER
+  pvector<SteamNetworkConnectionStatusRecord> _records;
+  Py_ssize_t _shape;
+  Py_ssize_t _stride;
+#endif
+
+  friend class SteamNetworkManager;
+};
@@ -0,0 +1,46 @@
+///
+// Copyright (c) 2026, Digital Descent, LLC. All rights reserved.
+//
+
+#include "steamNetworkConnectionTable.h"
+
+// Guard everything below from interrogate's parser.
+#ifndef CPPPARSER
+
+////////////////////////////////////////////////////////////////////
+//     Function: SteamNetworkConnectionTable::get_num_connections
+//       Access: Published
+////////////////////////////////////////////////////////////////////
+size_t SteamNetworkConnectionTable::get_num_connections() const {
+    return _connections.size();
+}
+
+////////////////////////////////////////////////////////////////////
+//     Function: SteamNetworkConnectionTable::get_connection
+//       Access: Published
+//  Description: Returns the nth connection's info.
+////////////////////////////////////////////////////////////////////
+PT(SteamNetworkConnectionInfo) SteamNetworkConnectionTable::get_connection(size_t n) const {
+    nassertr(n < _connections.size(), nullptr);
+    return _connections[n];
+}
+
+////////////////////////////////////////////////////////////////////
+//     Function: SteamNetworkConnectionTable::size
+//       Access: Published
+//  Description: Python len() support; same as get_num_connections().
+////////////////////////////////////////////////////////////////////
+size_t SteamNetworkConnectionTable::size() const {
+    return _connections.size();
+}
+
+////////////////////////////////////////////////////////////////////
+//     Function: SteamNetworkConnectionTable::operator []
+//       Access: Published
+//  Description: Python indexing support; same as get_connection().
+////////////////////////////////////////////////////////////////////
+PT(SteamNetworkConnectionInfo) SteamNetworkConnectionTable::operator [] (size_t n) const {
+    return get_connection(n);
+}
+
+#endif  // CPPPARSER
@@ -0,0 +1,41 @@
+///
+// Copyright (c) 2026, Digital Descent, LLC. All rights reserved.
+//
+
+#pragma once
+
+#include "steamConstants_bindings.h"
+#include "steamPython_bindings.h"
+
+#include "referenceCount.h"
+#include "pointerTo.h"
+#include "pvector.h"
+#include "steamNetworkConnectionInfo.h"
+
+////////////////////////////////////////////////////////////////////
+//       Class : SteamNetworkConnectionTable
+// Description : A snapshot of SteamNetworkManager's connection
+//               table, returned by get_connection_table.  Holds one
+//               SteamNetworkConnectionInfo per live connection, with
+//               its remote address and Steam ID, listen socket,
+//               connect time and user data.
+////////////////////////////////////////////////////////////////////
+class EXPORT_CLASS SteamNetworkConnectionTable : public ReferenceCount {
+PUBLISHED:
+  SteamNetworkConnectionTable() = default;
+  virtual ~SteamNetworkConnectionTable() = default;
+
+  size_t get_num_connections() const;
+  PT(SteamNetworkConnectionInfo) get_connection(size_t n) const;
+  MAKE_SEQ(get_connections, get_num_connections, get_connection);
+
+  size_t size() const;
+  PT(SteamNetworkConnectionInfo) operator [] (size_t n) const;
+
+  MAKE_SEQ_PROPERTY(connections, get_num_connections, get_connection);
+
+private:
+  pvector<PT(SteamNetworkConnectionInfo)> _connections;
+
+  friend class SteamNetworkManager;
+};
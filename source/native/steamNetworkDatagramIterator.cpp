@@ -0,0 +1,44 @@
+///
+// Copyright (c) 2026, Digital Descent, LLC. All rights reserved.
+//
+
+#include "steamNetworkDatagramIterator.h"
+
+// Guard everything below from interrogate's parser.
+#ifndef CPPPARSER
+
+////////////////////////////////////////////////////////////////////
+//     Function: SteamNetworkDatagramIterator::SteamNetworkDatagramIterator
+//       Access: Public
+//  Description: Creates an iterator at the start of a copy of dg,
+//               which shares dg's payload storage.
+////////////////////////////////////////////////////////////////////
+SteamNetworkDatagramIterator::SteamNetworkDatagramIterator(const Datagram &dg) :
+    _dg(dg) {
+    assign(_dg);
+}
+
+////////////////////////////////////////////////////////////////////
+//     Function: SteamNetworkDatagramIterator::Copy Constructor
+//       Access: Published
+//  Description: The base iterator points at the Datagram it reads,
+//               so the copy is pointed at its own copy of it, at the
+//               same position.
+////////////////////////////////////////////////////////////////////
+SteamNetworkDatagramIterator::SteamNetworkDatagramIterator(const SteamNetworkDatagramIterator &copy) :
+    DatagramIterator(),
+    _dg(copy._dg) {
+    assign(_dg, copy.get_current_index());
+}
+
+////////////////////////////////////////////////////////////////////
+//     Function: SteamNetworkDatagramIterator::Copy Assignment Operator
+//       Access: Published
+////////////////////////////////////////////////////////////////////
+SteamNetworkDatagramIterator &SteamNetworkDatagramIterator::operator = (const SteamNetworkDatagramIterator &copy) {
+    _dg = copy._dg;
+    assign(_dg, copy.get_current_index());
+    return *this;
+}
+
+#endif  // CPPPARSER
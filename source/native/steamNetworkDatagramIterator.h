@@ -0,0 +1,34 @@
+///
+// Copyright (c) 2026, Digital Descent, LLC. All rights reserved.
+//
+
+#pragma once
+
+#include "steamConstants_bindings.h"
+#include "steamPython_bindings.h"
+
+#include "datagram.h"
+#include "datagramIterator.h"
+
+////////////////////////////////////////////////////////////////////
+//       Class : SteamNetworkDatagramIterator
+// Description : A DatagramIterator that holds its own copy of the
+//               Datagram it reads.  The copy shares the payload
+//               storage rather than duplicating it, and keeps that
+//               storage alive for as long as the iterator exists,
+//               so an iterator returned by a short-lived object,
+//               such as a SteamNetworkMessageView of a temporary
+//               batch, never reads freed memory.
+////////////////////////////////////////////////////////////////////
+class EXPORT_CLASS SteamNetworkDatagramIterator : public DatagramIterator {
+public:
+  SteamNetworkDatagramIterator() = default;
+  explicit SteamNetworkDatagramIterator(const Datagram &dg);
+
+PUBLISHED:
+  SteamNetworkDatagramIterator(const SteamNetworkDatagramIterator &copy);
+  SteamNetworkDatagramIterator &operator = (const SteamNetworkDatagramIterator &copy);
+
+private:
+  Datagram _dg;
+};
@@ -9,6 +9,28 @@
 #include "steamConstants_bindings.h"
 #include "steamEnums_bindings.h"
 
+////////////////////////////////////////////////////////////////////
+//     Function: SteamNetworkEvent::get_type
+//       Access: Published
+//  Description: Returns what kind of event this is: a state change,
+//               a writable/unwritable notification, or a server
+//               socket accepting or rejecting a new connection.
+//
+//               For T_writable and T_unwritable, old_state and state
+//               both hold the current state.
+//
+//               T_accepted and T_rejected stand in for the
+//               connection's first Connecting state change, and
+//               listen_socket is the server socket it arrived on.
+//               For T_accepted, old_state is None, state is
+//               Connecting and end_reason is 0.  For T_rejected, the
+//               connection has already been closed: state is None
+//               and end_reason is k_ESteamNetConnectionEnd_App_Generic.
+////////////////////////////////////////////////////////////////////
+SteamNetworkEvent::Type SteamNetworkEvent::get_type() const {
+    return _type;
+}
+
 ////////////////////////////////////////////////////////////////////
 //     Function: SteamNetworkEvent::get_connection
 //       Access: Published
@@ -33,4 +55,22 @@ int SteamNetworkEvent::get_state() const {
     return _state;
 }
 
+////////////////////////////////////////////////////////////////////
+//     Function: SteamNetworkEvent::get_listen_socket
+//       Access: Published
+//  Description: Returns the listen socket that accepted the
+//               connection, or 0 for client-side connections.
+////////////////////////////////////////////////////////////////////
+SteamNetworkListenSocketHandle SteamNetworkEvent::get_listen_socket() const {
+    return _listen_socket;
+}
+
+////////////////////////////////////////////////////////////////////
+//     Function: SteamNetworkEvent::get_end_reason
+//       Access: Published
+////////////////////////////////////////////////////////////////////
+int SteamNetworkEvent::get_end_reason() const {
+    return _end_reason;
+}
+
 #endif  // CPPPARSER
\ No newline at end of file
@@ -10,24 +10,55 @@
 
 ////////////////////////////////////////////////////////////////////
 //       Class : SteamNetworkEvent
-// Description : Represents a single callback event for a connection state change.
+// Description : Represents a single callback event for a connection state change,
+//               a change in whether a connection with send
+//               watermarks is writable, or the outcome of a server
+//               socket's accept policy.
 ////////////////////////////////////////////////////////////////////
 class EXPORT_CLASS SteamNetworkEvent : public ReferenceCount {
+PUBLISHED:
+  enum Type {
+    T_state_changed = 0,
+    // The connection's pending send bytes fell to its low watermark.
+    T_writable = 1,
+    // The connection's pending send bytes reached its high watermark,
+    // or a send was refused because its send buffer is full.
+    T_unwritable = 2,
+    // A server socket's accept policy accepted the connection and
+    // assigned it to the server's poll group.
+    T_accepted = 3,
+    // A server socket's accept policy closed the connection, because
+    // the server was full or the accept callback refused it.
+    T_rejected = 4,
+  };
+
 public:
-    SteamNetworkEvent(SteamNetworkConnectionHandle connection, int old_state, int state)
-        : _connection(connection), _old_state(old_state), _state(state) {}
+    SteamNetworkEvent(SteamNetworkConnectionHandle connection, int old_state, int state,
+                      SteamNetworkListenSocketHandle listen_socket = INVALID_STEAM_NETWORK_LISTEN_SOCKET_HANDLE,
+                      int end_reason = 0, Type type = T_state_changed)
+        : _connection(connection), _old_state(old_state), _state(state),
+          _listen_socket(listen_socket), _end_reason(end_reason), _type(type) {}
 
 PUBLISHED:
+  Type get_type() const;
   SteamNetworkConnectionHandle get_connection() const;
   int get_old_state() const;
   int get_state() const;
+  SteamNetworkListenSocketHandle get_listen_socket() const;
+  int get_end_reason() const;
   
+  MAKE_PROPERTY(type, get_type);
   MAKE_PROPERTY(connection, get_connection);
   MAKE_PROPERTY(old_state, get_old_state);
   MAKE_PROPERTY(state, get_state);
+  MAKE_PROPERTY(listen_socket, get_listen_socket);
+  MAKE_PROPERTY(end_reason, get_end_reason);
 
 private:
   SteamNetworkConnectionHandle _connection;
   int _old_state;
   int _state;
+  SteamNetworkListenSocketHandle _listen_socket;
+  int _end_reason;
+  Type _type;
 };
\ No newline at end of file
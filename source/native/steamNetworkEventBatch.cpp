@@ -0,0 +1,142 @@
+///
+// Copyright (c) 2026, Digital Descent, LLC. All rights reserved.
+//
+
+#include "steamNetworkEventBatch.h"
+
+// Guard everything below from interrogate's parser.
+#ifndef CPPPARSER
+#include "steamConstants_bindings.h"
+#include "steamEnums_bindings.h"
+
+static_assert(sizeof(SteamNetworkEventRecord) == 24, "SteamNetworkEventRecord must match its buffer format");
+
+// PEP 3118 format describing SteamNetworkEventRecord.
+static const char *const event_record_format =
+    "T{I:connection:I:listen_socket:i:old_state:i:state:i:end_reason:i:type:}";
+
+////////////////////////////////////////////////////////////////////
+//     Function: SteamNetworkEventBatch::get_num_events
+//       Access: Published
+////////////////////////////////////////////////////////////////////
+size_t SteamNetworkEventBatch::get_num_events() const {
+    return _records.size();
+}
+
+////////////////////////////////////////////////////////////////////
+//     Function: SteamNetworkEventBatch::get_event
+//       Access: Published
+//  Description: Returns the nth event as a SteamNetworkEvent.
+////////////////////////////////////////////////////////////////////
+PT(SteamNetworkEvent) SteamNetworkEventBatch::get_event(size_t n) const {
+    nassertr(n < _records.size(), nullptr);
+    const SteamNetworkEventRecord &record = _records[n];
+    return new SteamNetworkEvent(record._connection, record._old_state, record._state,
+                                 record._listen_socket, record._end_reason,
+                                 static_cast<SteamNetworkEvent::Type>(record._type));
+}
+
+////////////////////////////////////////////////////////////////////
+//     Function: SteamNetworkEventBatch::get_connection
+//       Access: Published
+////////////////////////////////////////////////////////////////////
+SteamNetworkConnectionHandle SteamNetworkEventBatch::get_connection(size_t n) const {
+    nassertr(n < _records.size(), INVALID_STEAM_NETWORK_CONNECTION_HANDLE);
+    return _records[n]._connection;
+}
+
+////////////////////////////////////////////////////////////////////
+//     Function: SteamNetworkEventBatch::get_listen_socket
+//       Access: Published
+////////////////////////////////////////////////////////////////////
+SteamNetworkListenSocketHandle SteamNetworkEventBatch::get_listen_socket(size_t n) const {
+    nassertr(n < _records.size(), INVALID_STEAM_NETWORK_LISTEN_SOCKET_HANDLE);
+    return _records[n]._listen_socket;
+}
+
+////////////////////////////////////////////////////////////////////
+//     Function: SteamNetworkEventBatch::get_old_state
+//       Access: Published
+////////////////////////////////////////////////////////////////////
+int SteamNetworkEventBatch::get_old_state(size_t n) const {
+    nassertr(n < _records.size(), 0);
+    return _records[n]._old_state;
+}
+
+////////////////////////////////////////////////////////////////////
+//     Function: SteamNetworkEventBatch::get_state
+//       Access: Published
+////////////////////////////////////////////////////////////////////
+int SteamNetworkEventBatch::get_state(size_t n) const {
+    nassertr(n < _records.size(), 0);
+    return _records[n]._state;
+}
+
+////////////////////////////////////////////////////////////////////
+//     Function: SteamNetworkEventBatch::get_end_reason
+//       Access: Published
+////////////////////////////////////////////////////////////////////
+int SteamNetworkEventBatch::get_end_reason(size_t n) const {
+    nassertr(n < _records.size(), 0);
+    return _records[n]._end_reason;
+}
+
+////////////////////////////////////////////////////////////////////
+//     Function: SteamNetworkEventBatch::get_type
+//       Access: Published
+////////////////////////////////////////////////////////////////////
+SteamNetworkEvent::Type SteamNetworkEventBatch::get_type(size_t n) const {
+    nassertr(n < _records.size(), SteamNetworkEvent::T_state_changed);
+    return static_cast<SteamNetworkEvent::Type>(_records[n]._type);
+}
+
+////////////////////////////////////////////////////////////////////
+//     Function: SteamNetworkEventBatch::size
+//       Access: Published
+//  Description: Python len() support; same as get_num_events().
+////////////////////////////////////////////////////////////////////
+size_t SteamNetworkEventBatch::size() const {
+    return _records.size();
+}
+
+////////////////////////////////////////////////////////////////////
+//     Function: SteamNetworkEventBatch::operator []
+//       Access: Published
+//  Description: Python indexing support; same as get_event().
+////////////////////////////////////////////////////////////////////
+PT(SteamNetworkEvent) SteamNetworkEventBatch::operator [] (size_t n) const {
+    return get_event(n);
+}
+
+////////////////////////////////////////////////////////////////////
+//     Function: SteamNetworkEventBatch::__getbuffer__
+//       Access: Published
+//  Description: Exposes the records as a read-only one-dimensional
+//               array of structs.
+////////////////////////////////////////////////////////////////////
+int SteamNetworkEventBatch::__getbuffer__(PyObject *self, Py_buffer *view, int flags) const {
+    if ((flags & PyBUF_WRITABLE) == PyBUF_WRITABLE) {
+        PyErr_SetString(PyExc_BufferError, "SteamNetworkEventBatch is read-only");
+        return -1;
+    }
+
+    SteamNetworkEventBatch *batch = const_cast<SteamNetworkEventBatch *>(this);
+    batch->_shape = static_cast<Py_ssize_t>(_records.size());
+    batch->_stride = static_cast<Py_ssize_t>(sizeof(SteamNetworkEventRecord));
+
+    view->obj = self;
+    Py_INCREF(self);
+    view->buf = _records.empty() ? (void *)this : (void *)_records.data();
+    view->len = _shape * _stride;
+    view->readonly = 1;
+    view->itemsize = _stride;
+    view->format = (flags & PyBUF_FORMAT) ? (char *)event_record_format : nullptr;
+    view->ndim = 1;
+    view->shape = (flags & PyBUF_ND) ? &batch->_shape : nullptr;
+    view->strides = ((flags & PyBUF_STRIDES) == PyBUF_STRIDES) ? &batch->_stride : nullptr;
+    view->suboffsets = nullptr;
+    view->internal = nullptr;
+    return 0;
+}
+
+#endif  // CPPPARSER
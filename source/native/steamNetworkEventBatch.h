@@ -0,0 +1,74 @@
+///
+// Copyright (c) 2026, Digital Descent, LLC. All rights reserved.
+//
+
+#pragma once
+
+#include "steamConstants_bindings.h"
+#include "steamPython_bindings.h"
+
+#include "referenceCount.h"
+#include "pointerTo.h"
+#include "pvector.h"
+#include "steamNetworkEvent.h"
+
+#ifndef CPPPARSER
+////////////////////////////////////////////////////////////////////
+//       Class : SteamNetworkEventRecord
+// Description : Plain record for one connection state change, as
+//               stored in the manager's event queues.  The layout
+//               is exported verbatim through the buffer protocol
+//               of SteamNetworkEventBatch.
+////////////////////////////////////////////////////////////////////
+struct SteamNetworkEventRecord {
+  uint32_t _connection;
+  uint32_t _listen_socket;
+  int32_t _old_state;
+  int32_t _state;
+  int32_t _end_reason;
+  int32_t _type;
+};
+#endif
+
+////////////////////////////////////////////////////////////////////
+//       Class : SteamNetworkEventBatch
+// Description : All connection events drained from a manager in one
+//               call.  Events can be indexed or iterated, read field
+//               by field without creating SteamNetworkEvent objects,
+//               or viewed as a NumPy structured array through the
+//               buffer protocol, e.g. numpy.asarray(batch) with the
+//               fields connection, listen_socket, old_state, state,
+//               end_reason and type.
+////////////////////////////////////////////////////////////////////
+class EXPORT_CLASS SteamNetworkEventBatch : public ReferenceCount {
+PUBLISHED:
+  SteamNetworkEventBatch() = default;
+  virtual ~SteamNetworkEventBatch() = default;
+
+  size_t get_num_events() const;
+  PT(SteamNetworkEvent) get_event(size_t n) const;
+  MAKE_SEQ(get_events, get_num_events, get_event);
+
+  SteamNetworkConnectionHandle get_connection(size_t n) const;
+  SteamNetworkListenSocketHandle get_listen_socket(size_t n) const;
+  int get_old_state(size_t n) const;
+  int get_state(size_t n) const;
+  int get_end_reason(size_t n) const;
+  SteamNetworkEvent::Type get_type(size_t n) const;
+
+  size_t size() const;
+  PT(SteamNetworkEvent) operator [] (size_t n) const;
+
+  int __getbuffer__(PyObject *self, Py_buffer *view, int flags) const;
+
+  MAKE_SEQ_PROPERTY(events, get_num_events, get_event);
+
+private:
+#ifndef CPPPARSER
+  pvector<SteamNetworkEventRecord> _records;
+  Py_ssize_t _shape;
+  Py_ssize_t _stride;
+#endif
+
+  friend class SteamNetworkManager;
+};
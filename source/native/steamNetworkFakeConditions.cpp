@@ -0,0 +1,219 @@
+///
+// Copyright (c) 2026, Digital Descent, LLC. All rights reserved.
+//
+
+#include "steamNetworkFakeConditions.h"
+
+// Guard everything below from interrogate's parser.
+#ifndef CPPPARSER
+
+////////////////////////////////////////////////////////////////////
+//     Function: SteamNetworkFakeConditions::SteamNetworkFakeConditions
+//       Access: Published
+//  Description: Default constructor.  Describes a perfect network.
+////////////////////////////////////////////////////////////////////
+SteamNetworkFakeConditions::SteamNetworkFakeConditions() {
+  _packet_loss_send = 0.0f;
+  _packet_loss_recv = 0.0f;
+  _packet_lag_send = 0;
+  _packet_lag_recv = 0;
+  _packet_reorder_send = 0.0f;
+  _packet_reorder_recv = 0.0f;
+  _packet_reorder_time = 0;
+  _packet_dup_send = 0.0f;
+  _packet_dup_recv = 0.0f;
+  _packet_dup_time_max = 0;
+}
+
+////////////////////////////////////////////////////////////////////
+//     Function: SteamNetworkFakeConditions::set_packet_loss_send
+//       Access: Published
+//  Description: Percentage of outgoing packets to drop, 0 to 100.
+////////////////////////////////////////////////////////////////////
+void SteamNetworkFakeConditions::set_packet_loss_send(float value) {
+    _packet_loss_send = value;
+}
+
+////////////////////////////////////////////////////////////////////
+//     Function: SteamNetworkFakeConditions::get_packet_loss_send
+//       Access: Published
+////////////////////////////////////////////////////////////////////
+float SteamNetworkFakeConditions::get_packet_loss_send() const {
+    return _packet_loss_send;
+}
+
+////////////////////////////////////////////////////////////////////
+//     Function: SteamNetworkFakeConditions::set_packet_loss_recv
+//       Access: Published
+//  Description: Percentage of incoming packets to drop, 0 to 100.
+////////////////////////////////////////////////////////////////////
+void SteamNetworkFakeConditions::set_packet_loss_recv(float value) {
+    _packet_loss_recv = value;
+}
+
+////////////////////////////////////////////////////////////////////
+//     Function: SteamNetworkFakeConditions::get_packet_loss_recv
+//       Access: Published
+////////////////////////////////////////////////////////////////////
+float SteamNetworkFakeConditions::get_packet_loss_recv() const {
+    return _packet_loss_recv;
+}
+
+////////////////////////////////////////////////////////////////////
+//     Function: SteamNetworkFakeConditions::set_packet_lag_send
+//       Access: Published
+//  Description: Milliseconds of delay added to outgoing packets.
+////////////////////////////////////////////////////////////////////
+void SteamNetworkFakeConditions::set_packet_lag_send(int value) {
+    _packet_lag_send = value;
+}
+
+////////////////////////////////////////////////////////////////////
+//     Function: SteamNetworkFakeConditions::get_packet_lag_send
+//       Access: Published
+////////////////////////////////////////////////////////////////////
+int SteamNetworkFakeConditions::get_packet_lag_send() const {
+    return _packet_lag_send;
+}
+
+////////////////////////////////////////////////////////////////////
+//     Function: SteamNetworkFakeConditions::set_packet_lag_recv
+//       Access: Published
+//  Description: Milliseconds of delay added to incoming packets.
+////////////////////////////////////////////////////////////////////
+void SteamNetworkFakeConditions::set_packet_lag_recv(int value) {
+    _packet_lag_recv = value;
+}
+
+////////////////////////////////////////////////////////////////////
+//     Function: SteamNetworkFakeConditions::get_packet_lag_recv
+//       Access: Published
+////////////////////////////////////////////////////////////////////
+int SteamNetworkFakeConditions::get_packet_lag_recv() const {
+    return _packet_lag_recv;
+}
+
+////////////////////////////////////////////////////////////////////
+//     Function: SteamNetworkFakeConditions::set_packet_reorder_send
+//       Access: Published
+//  Description: Percentage of outgoing packets to reorder.
+////////////////////////////////////////////////////////////////////
+void SteamNetworkFakeConditions::set_packet_reorder_send(float value) {
+    _packet_reorder_send = value;
+}
+
+////////////////////////////////////////////////////////////////////
+//     Function: SteamNetworkFakeConditions::get_packet_reorder_send
+//       Access: Published
+////////////////////////////////////////////////////////////////////
+float SteamNetworkFakeConditions::get_packet_reorder_send() const {
+    return _packet_reorder_send;
+}
+
+////////////////////////////////////////////////////////////////////
+//     Function: SteamNetworkFakeConditions::set_packet_reorder_recv
+//       Access: Published
+//  Description: Percentage of incoming packets to reorder.
+////////////////////////////////////////////////////////////////////
+void SteamNetworkFakeConditions::set_packet_reorder_recv(float value) {
+    _packet_reorder_recv = value;
+}
+
+////////////////////////////////////////////////////////////////////
+//     Function: SteamNetworkFakeConditions::get_packet_reorder_recv
+//       Access: Published
+////////////////////////////////////////////////////////////////////
+float SteamNetworkFakeConditions::get_packet_reorder_recv() const {
+    return _packet_reorder_recv;
+}
+
+////////////////////////////////////////////////////////////////////
+//     Function: SteamNetworkFakeConditions::set_packet_reorder_time
+//       Access: Published
+//  Description: Milliseconds of extra delay given to reordered packets.
+////////////////////////////////////////////////////////////////////
+void SteamNetworkFakeConditions::set_packet_reorder_time(int value) {
+    _packet_reorder_time = value;
+}
+
+////////////////////////////////////////////////////////////////////
+//     Function: SteamNetworkFakeConditions::get_packet_reorder_time
+//       Access: Published
+////////////////////////////////////////////////////////////////////
+int SteamNetworkFakeConditions::get_packet_reorder_time() const {
+    return _packet_reorder_time;
+}
+
+////////////////////////////////////////////////////////////////////
+//     Function: SteamNetworkFakeConditions::set_packet_dup_send
+//       Access: Published
+//  Description: Percentage of outgoing packets to duplicate.
+////////////////////////////////////////////////////////////////////
+void SteamNetworkFakeConditions::set_packet_dup_send(float value) {
+    _packet_dup_send = value;
+}
+
+////////////////////////////////////////////////////////////////////
+//     Function: SteamNetworkFakeConditions::get_packet_dup_send
+//       Access: Published
+////////////////////////////////////////////////////////////////////
+float SteamNetworkFakeConditions::get_packet_dup_send() const {
+    return _packet_dup_send;
+}
+
+////////////////////////////////////////////////////////////////////
+//     Function: SteamNetworkFakeConditions::set_packet_dup_recv
+//       Access: Published
+//  Description: Percentage of incoming packets to duplicate.
+////////////////////////////////////////////////////////////////////
+void SteamNetworkFakeConditions::set_packet_dup_recv(float value) {
+    _packet_dup_recv = value;
+}
+
+////////////////////////////////////////////////////////////////////
+//     Function: SteamNetworkFakeConditions::get_packet_dup_recv
+//       Access: Published
+////////////////////////////////////////////////////////////////////
+float SteamNetworkFakeConditions::get_packet_dup_recv() const {
+    return _packet_dup_recv;
+}
+
+////////////////////////////////////////////////////////////////////
+//     Function: SteamNetworkFakeConditions::set_packet_dup_time_max
+//       Access: Published
+//  Description: Maximum delay, in milliseconds, of a duplicated packet.
+////////////////////////////////////////////////////////////////////
+void SteamNetworkFakeConditions::set_packet_dup_time_max(int value) {
+    _packet_dup_time_max = value;
+}
+
+////////////////////////////////////////////////////////////////////
+//     Function: SteamNetworkFakeConditions::get_packet_dup_time_max
+//       Access: Published
+////////////////////////////////////////////////////////////////////
+int SteamNetworkFakeConditions::get_packet_dup_time_max() const {
+    return _packet_dup_time_max;
+}
+
+////////////////////////////////////////////////////////////////////
+//     Function: SteamNetworkFakeConditions::set_packet_loss
+//       Access: Published
+//  Description: Sets the same packet loss percentage in both
+//               directions.
+////////////////////////////////////////////////////////////////////
+void SteamNetworkFakeConditions::set_packet_loss(float percent) {
+    _packet_loss_send = percent;
+    _packet_loss_recv = percent;
+}
+
+////////////////////////////////////////////////////////////////////
+//     Function: SteamNetworkFakeConditions::set_packet_lag
+//       Access: Published
+//  Description: Sets the same lag in both directions.
+////////////////////////////////////////////////////////////////////
+void SteamNetworkFakeConditions::set_packet_lag(int ms) {
+    _packet_lag_send = ms;
+    _packet_lag_recv = ms;
+}
+
+#endif  // CPPPARSER
@@ -0,0 +1,81 @@
+///
+// Copyright (c) 2026, Digital Descent, LLC. All rights reserved.
+//
+
+#pragma once
+
+#include "steamConstants_bindings.h"
+#include "steamPython_bindings.h"
+
+#include "referenceCount.h"
+
+////////////////////////////////////////////////////////////////////
+//       Class : SteamNetworkFakeConditions
+// Description : A set of simulated network conditions: packet loss,
+//               lag, reordering and duplication, in each direction.
+//               Apply it globally or to a single connection through
+//               SteamNetworkManager to reproduce WAN conditions on
+//               loopback.  All values default to zero, which
+//               disables the simulation.
+////////////////////////////////////////////////////////////////////
+class EXPORT_CLASS SteamNetworkFakeConditions : public ReferenceCount {
+PUBLISHED:
+  SteamNetworkFakeConditions();
+  virtual ~SteamNetworkFakeConditions() = default;
+
+  void set_packet_loss_send(float value);
+  float get_packet_loss_send() const;
+
+  void set_packet_loss_recv(float value);
+  float get_packet_loss_recv() const;
+
+  void set_packet_lag_send(int value);
+  int get_packet_lag_send() const;
+
+  void set_packet_lag_recv(int value);
+  int get_packet_lag_recv() const;
+
+  void set_packet_reorder_send(float value);
+  float get_packet_reorder_send() const;
+
+  void set_packet_reorder_recv(float value);
+  float get_packet_reorder_recv() const;
+
+  void set_packet_reorder_time(int value);
+  int get_packet_reorder_time() const;
+
+  void set_packet_dup_send(float value);
+  float get_packet_dup_send() const;
+
+  void set_packet_dup_recv(float value);
+  float get_packet_dup_recv() const;
+
+  void set_packet_dup_time_max(int value);
+  int get_packet_dup_time_max() const;
+
+  void set_packet_loss(float percent);
+  void set_packet_lag(int ms);
+
+  MAKE_PROPERTY(packet_loss_send, get_packet_loss_send, set_packet_loss_send);
+  MAKE_PROPERTY(packet_loss_recv, get_packet_loss_recv, set_packet_loss_recv);
+  MAKE_PROPERTY(packet_lag_send, get_packet_lag_send, set_packet_lag_send);
+  MAKE_PROPERTY(packet_lag_recv, get_packet_lag_recv, set_packet_lag_recv);
+  MAKE_PROPERTY(packet_reorder_send, get_packet_reorder_send, set_packet_reorder_send);
+  MAKE_PROPERTY(packet_reorder_recv, get_packet_reorder_recv, set_packet_reorder_recv);
+  MAKE_PROPERTY(packet_reorder_time, get_packet_reorder_time, set_packet_reorder_time);
+  MAKE_PROPERTY(packet_dup_send, get_packet_dup_send, set_packet_dup_send);
+  MAKE_PROPERTY(packet_dup_recv, get_packet_dup_recv, set_packet_dup_recv);
+  MAKE_PROPERTY(packet_dup_time_max, get_packet_dup_time_max, set_packet_dup_time_max);
+
+private:
+  float _packet_loss_send;
+  float _packet_loss_recv;
+  int _packet_lag_send;
+  int _packet_lag_recv;
+  float _packet_reorder_send;
+  float _packet_reorder_recv;
+  int _packet_reorder_time;
+  float _packet_dup_send;
+  float _packet_dup_recv;
+  int _packet_dup_time_max;
+};
@@ -8,13 +8,128 @@
 #ifndef CPPPARSER
 #include "steamConstants_bindings.h"
 #include "steamEnums_bindings.h"
-#include "steamNetworkConnectionInfo.h"
 #include "steamNetworkMessage.h"
 #include <steam/isteamnetworkingutils.h>
+#include "compress_string.h"
+#include <algorithm>
+#include <atomic>
+#include <chrono>
+#include <new>
+#include <stdlib.h>
+#include <string.h>
 
 
 TypeHandle SteamNetworkManager::_type_handle;
 SteamNetworkManager *SteamNetworkManager::_global_ptr = nullptr;
+pmap<int64_t, SteamNetworkManager *> SteamNetworkManager::_instances;
+int64_t SteamNetworkManager::_next_id = 1;
+std::mutex SteamNetworkManager::_instances_lock;
+
+namespace {
+
+////////////////////////////////////////////////////////////////////
+//       Class : SharedPayload
+// Description : Header placed in front of a payload that is shared
+//               by several Steam messages.  Steam may free messages
+//               from its own service thread, so the count is atomic.
+////////////////////////////////////////////////////////////////////
+struct SharedPayload {
+    std::atomic<int> _ref_count;
+    size_t _size;
+
+    unsigned char *get_data() {
+        return reinterpret_cast<unsigned char *>(this + 1);
+    }
+};
+
+////////////////////////////////////////////////////////////////////
+//     Function: free_shared_payload
+//  Description: m_pfnFreeData hook for messages pointing into a
+//               SharedPayload.  Frees the payload once the last
+//               message referencing it has been released.
+////////////////////////////////////////////////////////////////////
+void free_shared_payload(SteamNetworkingMessage_t *msg) {
+    SharedPayload *payload = reinterpret_cast<SharedPayload *>(msg->m_pData) - 1;
+    if (payload->_ref_count.fetch_sub(1) == 1) {
+        payload->~SharedPayload();
+        free(payload);
+    }
+}
+
+////////////////////////////////////////////////////////////////////
+//     Function: new_shared_payload
+//  Description: Returns a SharedPayload holding a copy of the given
+//               bytes, with no references yet, or nullptr if it
+//               could not be allocated.
+////////////////////////////////////////////////////////////////////
+SharedPayload *new_shared_payload(const void *data, size_t length) {
+    void *memory = malloc(sizeof(SharedPayload) + length);
+    if (memory == nullptr) {
+        return nullptr;
+    }
+    SharedPayload *payload = new (memory) SharedPayload;
+    payload->_size = length;
+    if (length > 0) {
+        memcpy(payload->get_data(), data, length);
+    }
+    return payload;
+}
+
+////////////////////////////////////////////////////////////////////
+//     Function: ip_addr_to_net_address
+//  Description: Converts a Steam IP address into a NetAddress.
+//               Returns false for addresses that are all zeros, as
+//               reported for peers reached only through Steam relays.
+////////////////////////////////////////////////////////////////////
+bool ip_addr_to_net_address(const SteamNetworkingIPAddr &addr, NetAddress &result) {
+    if (addr.IsIPv6AllZeros()) {
+        return false;
+    }
+    char buffer[SteamNetworkingIPAddr::k_cchMaxString];
+    addr.ToString(buffer, sizeof(buffer), false);
+    return result.set_host(buffer, addr.m_port);
+}
+
+////////////////////////////////////////////////////////////////////
+//     Function: apply_fake_conditions
+//  Description: Writes every fake network config value in the
+//               given scope.  Returns false if any of them was
+//               rejected.
+////////////////////////////////////////////////////////////////////
+bool apply_fake_conditions(ESteamNetworkingConfigScope scope, intptr_t scope_obj,
+                           const SteamNetworkFakeConditions &conditions) {
+    ISteamNetworkingUtils *utils = SteamNetworkingUtils();
+    if (utils == nullptr) {
+        steam_cat.error() << "SteamNetworkingUtils interface not initialised." << std::endl;
+        return false;
+    }
+
+    float loss_send = conditions.get_packet_loss_send();
+    float loss_recv = conditions.get_packet_loss_recv();
+    int32 lag_send = conditions.get_packet_lag_send();
+    int32 lag_recv = conditions.get_packet_lag_recv();
+    float reorder_send = conditions.get_packet_reorder_send();
+    float reorder_recv = conditions.get_packet_reorder_recv();
+    int32 reorder_time = conditions.get_packet_reorder_time();
+    float dup_send = conditions.get_packet_dup_send();
+    float dup_recv = conditions.get_packet_dup_recv();
+    int32 dup_time_max = conditions.get_packet_dup_time_max();
+
+    bool ok = true;
+    ok &= utils->SetConfigValue(k_ESteamNetworkingConfig_FakePacketLoss_Send, scope, scope_obj, k_ESteamNetworkingConfig_Float, &loss_send);
+    ok &= utils->SetConfigValue(k_ESteamNetworkingConfig_FakePacketLoss_Recv, scope, scope_obj, k_ESteamNetworkingConfig_Float, &loss_recv);
+    ok &= utils->SetConfigValue(k_ESteamNetworkingConfig_FakePacketLag_Send, scope, scope_obj, k_ESteamNetworkingConfig_Int32, &lag_send);
+    ok &= utils->SetConfigValue(k_ESteamNetworkingConfig_FakePacketLag_Recv, scope, scope_obj, k_ESteamNetworkingConfig_Int32, &lag_recv);
+    ok &= utils->SetConfigValue(k_ESteamNetworkingConfig_FakePacketReorder_Send, scope, scope_obj, k_ESteamNetworkingConfig_Float, &reorder_send);
+    ok &= utils->SetConfigValue(k_ESteamNetworkingConfig_FakePacketReorder_Recv, scope, scope_obj, k_ESteamNetworkingConfig_Float, &reorder_recv);
+    ok &= utils->SetConfigValue(k_ESteamNetworkingConfig_FakePacketReorder_Time, scope, scope_obj, k_ESteamNetworkingConfig_Int32, &reorder_time);
+    ok &= utils->SetConfigValue(k_ESteamNetworkingConfig_FakePacketDup_Send, scope, scope_obj, k_ESteamNetworkingConfig_Float, &dup_send);
+    ok &= utils->SetConfigValue(k_ESteamNetworkingConfig_FakePacketDup_Recv, scope, scope_obj, k_ESteamNetworkingConfig_Float, &dup_recv);
+    ok &= utils->SetConfigValue(k_ESteamNetworkingConfig_FakePacketDup_TimeMax, scope, scope_obj, k_ESteamNetworkingConfig_Int32, &dup_time_max);
+    return ok;
+}
+
+} // namespace
 
 
 ////////////////////////////////////////////////////////////////////
@@ -24,8 +139,20 @@ SteamNetworkManager *SteamNetworkManager::_global_ptr = nullptr;
 //               GameSockets interface.  This does not automatically
 //               register the instance as the global manager; use
 //               get_global_ptr() to access the global instance.
+//               Any number of managers may exist side by side; each
+//               receives only the events for its own sockets and
+//               connections.
 ////////////////////////////////////////////////////////////////////
-SteamNetworkManager::SteamNetworkManager() {
+SteamNetworkManager::SteamNetworkManager() :
+    _max_pooled_messages(1024),
+    _next_event_sequence(0),
+    _num_pending_events(0),
+    _service_running(false),
+    _service_interval(0.0),
+    _service_queue(nullptr),
+    _shards_running(false),
+    _shard_interval(0.0),
+    _next_shard(0) {
     _client_connection = 0;
     _is_client = false;
 
@@ -33,6 +160,42 @@ SteamNetworkManager::SteamNetworkManager() {
     if (_interface == nullptr) {
         steam_cat.error() << "Failed to get SteamNetworkingSockets interface." << std::endl;
     }
+
+    std::lock_guard<std::mutex> guard(_instances_lock);
+    _id = _next_id++;
+    _instances[_id] = this;
+}
+
+////////////////////////////////////////////////////////////////////
+//     Function: SteamNetworkManager::~SteamNetworkManager
+//       Access: Published, Virtual
+//  Description: Stops the service and shard threads, if they are
+//               running, and stops routing status callbacks to this
+//               instance.  The GIL, which Python holds while
+//               destroying the manager, is released while the
+//               threads are joined, since one of them may be waiting
+//               for it in a server socket's accept callback.
+////////////////////////////////////////////////////////////////////
+SteamNetworkManager::~SteamNetworkManager() {
+    PyThreadState *thread_state = nullptr;
+    if (Py_IsInitialized() && PyGILState_Check()) {
+        thread_state = PyEval_SaveThread();
+    }
+    stop_service_thread();
+    stop_shard_threads();
+    if (thread_state != nullptr) {
+        PyEval_RestoreThread(thread_state);
+    }
+
+    for (pmap<SteamNetworkListenSocketHandle, ServerPolicy>::iterator it = _servers.begin(); it != _servers.end(); ++it) {
+        Py_XDECREF(it->second._accept_callback);
+    }
+
+    std::lock_guard<std::mutex> guard(_instances_lock);
+    _instances.erase(_id);
+    if (_global_ptr == this) {
+        _global_ptr = nullptr;
+    }
 }
 
 ////////////////////////////////////////////////////////////////////
@@ -66,10 +229,10 @@ SteamNetworkListenSocketHandle SteamNetworkManager::create_ip_socket(int port) {
     local_addr.Clear();
     local_addr.m_port = static_cast<uint16>(port);
 
-    SteamNetworkingConfigValue_t opt;
-    opt.SetPtr(k_ESteamNetworkingConfig_Callback_ConnectionStatusChanged, (void *)OnSteamNetConnectionStatusChanged);
+    SteamNetworkingConfigValue_t opts[num_connection_options];
+    get_connection_options(opts);
 
-    HSteamListenSocket listen_socket = _interface->CreateListenSocketIP(local_addr, 1, &opt);
+    HSteamListenSocket listen_socket = _interface->CreateListenSocketIP(local_addr, num_connection_options, opts);
     return static_cast<SteamNetworkListenSocketHandle>(listen_socket);
 }
 
@@ -85,13 +248,93 @@ SteamNetworkListenSocketHandle SteamNetworkManager::create_steam_id_socket(int p
         return INVALID_STEAM_NETWORK_LISTEN_SOCKET_HANDLE;
     }
 
-    SteamNetworkingConfigValue_t opt;
-    opt.SetPtr(k_ESteamNetworkingConfig_Callback_ConnectionStatusChanged, (void *)OnSteamNetConnectionStatusChanged);
+    SteamNetworkingConfigValue_t opts[num_connection_options];
+    get_connection_options(opts);
 
-    HSteamListenSocket listen_socket = _interface->CreateListenSocketP2P(port, 1, &opt);
+    HSteamListenSocket listen_socket = _interface->CreateListenSocketP2P(port, num_connection_options, opts);
     return static_cast<SteamNetworkListenSocketHandle>(listen_socket);
 }
 
+////////////////////////////////////////////////////////////////////
+//     Function: SteamNetworkManager::create_ip_server
+//       Access: Published
+//  Description: Creates a listen socket on the given local port
+//               whose incoming connections are accepted natively,
+//               inside the status callback, instead of waiting for
+//               Python to call accept_connection.  Each accepted
+//               connection is assigned to poll_group, unless it is
+//               the invalid handle, and reported by a single
+//               T_accepted event in place of its Connecting state
+//               change.
+//
+//               Once max_clients connections are open, further ones
+//               are closed and reported as T_rejected; 0 means no
+//               limit.  accept_callback, if given, is called with a
+//               dict holding the connection, listen_socket,
+//               remote_steam_id and address of each connection that
+//               would be accepted, and refuses it by returning a
+//               false value.  It may be called from the service or
+//               shard threads, holding up every other status
+//               change, so it must not block.  It runs with no lock
+//               held, so it may create or destroy managers; if it
+//               destroys this one, the connection is ignored.
+////////////////////////////////////////////////////////////////////
+SteamNetworkListenSocketHandle SteamNetworkManager::create_ip_server(int port, SteamNetworkPollGroupHandle poll_group,
+                                                                     int max_clients, PyObject *accept_callback) {
+    return create_server(port, false, poll_group, max_clients, accept_callback);
+}
+
+////////////////////////////////////////////////////////////////////
+//     Function: SteamNetworkManager::create_steam_id_server
+//       Access: Published
+//  Description: P2P version of create_ip_server, listening on the
+//               given virtual port.
+////////////////////////////////////////////////////////////////////
+SteamNetworkListenSocketHandle SteamNetworkManager::create_steam_id_server(int port, SteamNetworkPollGroupHandle poll_group,
+                                                                           int max_clients, PyObject *accept_callback) {
+    return create_server(port, true, poll_group, max_clients, accept_callback);
+}
+
+////////////////////////////////////////////////////////////////////
+//     Function: SteamNetworkManager::close_listen_socket
+//       Access: Published
+//  Description: Closes a listen socket, and with it every connection
+//               accepted on it, dropping its accept policy if it is
+//               a server socket.  Returns true on success.
+////////////////////////////////////////////////////////////////////
+bool SteamNetworkManager::close_listen_socket(SteamNetworkListenSocketHandle listen_socket) {
+    PyObject *accept_callback = nullptr;
+    {
+        std::lock_guard<std::mutex> guard(_servers_lock);
+        pmap<SteamNetworkListenSocketHandle, ServerPolicy>::iterator it = _servers.find(listen_socket);
+        if (it != _servers.end()) {
+            accept_callback = it->second._accept_callback;
+            _servers.erase(it);
+        }
+    }
+    Py_XDECREF(accept_callback);
+
+    if (_interface == nullptr) return false;
+    return _interface->CloseListenSocket(listen_socket);
+}
+
+////////////////////////////////////////////////////////////////////
+//     Function: SteamNetworkManager::get_num_server_clients
+//       Access: Published
+//  Description: Returns the number of connections a server socket
+//               has accepted that have not dropped or been closed,
+//               which is what max_clients is checked against.
+//               Returns 0 for other listen sockets.
+////////////////////////////////////////////////////////////////////
+size_t SteamNetworkManager::get_num_server_clients(SteamNetworkListenSocketHandle listen_socket) const {
+    std::lock_guard<std::mutex> guard(_servers_lock);
+    pmap<SteamNetworkListenSocketHandle, ServerPolicy>::const_iterator it = _servers.find(listen_socket);
+    if (it == _servers.end()) {
+        return 0;
+    }
+    return it->second._clients.size();
+}
+
 ////////////////////////////////////////////////////////////////////
 //     Function: SteamNetworkManager::connect_by_ip_address
 //       Access: Published
@@ -109,10 +352,10 @@ SteamNetworkConnectionHandle SteamNetworkManager::connect_by_ip_address(const Ne
     steam_addr.ParseString(address.get_ip_string().c_str());
     steam_addr.m_port = address.get_port();
 
-    SteamNetworkingConfigValue_t opt;
-    opt.SetPtr(k_ESteamNetworkingConfig_Callback_ConnectionStatusChanged, (void *)OnSteamNetConnectionStatusChanged);
+    SteamNetworkingConfigValue_t opts[num_connection_options];
+    get_connection_options(opts);
 
-    SteamNetworkConnectionHandle handle = _interface->ConnectByIPAddress(steam_addr, 1, &opt);
+    SteamNetworkConnectionHandle handle = _interface->ConnectByIPAddress(steam_addr, num_connection_options, opts);
     if (handle == k_HSteamNetConnection_Invalid) {
         steam_cat.error() << "Failed to connect by IP address." << std::endl;
         return INVALID_STEAM_NETWORK_CONNECTION_HANDLE;
@@ -138,10 +381,10 @@ SteamNetworkConnectionHandle SteamNetworkManager::connect_by_steam_id(const std:
     SteamNetworkingIdentity identity;
     identity.SetSteamID64(strtoull(steam_id.c_str(), nullptr, 10));
 
-    SteamNetworkingConfigValue_t opt;
-    opt.SetPtr(k_ESteamNetworkingConfig_Callback_ConnectionStatusChanged, (void *)OnSteamNetConnectionStatusChanged);
+    SteamNetworkingConfigValue_t opts[num_connection_options];
+    get_connection_options(opts);
 
-    SteamNetworkConnectionHandle handle = _interface->ConnectP2P(identity, 0, 1, &opt);
+    SteamNetworkConnectionHandle handle = _interface->ConnectP2P(identity, 0, num_connection_options, opts);
     if (handle == k_HSteamNetConnection_Invalid) {
         steam_cat.error() << "Failed to connect by Steam ID." << std::endl;
         return INVALID_STEAM_NETWORK_CONNECTION_HANDLE;
@@ -152,6 +395,52 @@ SteamNetworkConnectionHandle SteamNetworkManager::connect_by_steam_id(const std:
     return handle;
 }
 
+////////////////////////////////////////////////////////////////////
+//     Function: SteamNetworkManager::create_socket_pair
+//       Access: Published
+//  Description: Creates a pair of connections that talk directly to
+//               each other within this process.  With
+//               use_network_loopback, messages go through the full
+//               packet path over the loopback device; otherwise
+//               they are handed across in memory.  Both ends are
+//               wired into this manager like any other connection
+//               and a synthetic Connected event is queued for each,
+//               under the client event queue.  Returns a tuple of
+//               the two connection handles, or None on failure.
+////////////////////////////////////////////////////////////////////
+PyObject *SteamNetworkManager::create_socket_pair(bool use_network_loopback) {
+    if (_interface == nullptr) {
+        steam_cat.error() << "SteamNetworkingSockets interface not initialised." << std::endl;
+        Py_RETURN_NONE;
+    }
+
+    HSteamNetConnection connection1 = k_HSteamNetConnection_Invalid;
+    HSteamNetConnection connection2 = k_HSteamNetConnection_Invalid;
+    if (!_interface->CreateSocketPair(&connection1, &connection2, use_network_loopback, nullptr, nullptr)) {
+        steam_cat.error() << "Failed to create socket pair." << std::endl;
+        Py_RETURN_NONE;
+    }
+
+    // Socket pairs are created already connected, without options, so
+    // apply ours afterwards and report the connect ourselves.
+    HSteamNetConnection connections[2] = { connection1, connection2 };
+    for (HSteamNetConnection connection : connections) {
+        apply_connection_options(static_cast<SteamNetworkConnectionHandle>(connection));
+        add_connection_entry(static_cast<SteamNetworkConnectionHandle>(connection));
+
+        SteamNetworkEventRecord record;
+        record._connection = static_cast<uint32_t>(connection);
+        record._listen_socket = static_cast<uint32_t>(INVALID_STEAM_NETWORK_LISTEN_SOCKET_HANDLE);
+        record._old_state = static_cast<int32_t>(k_ESteamNetworkingConnectionState_None);
+        record._state = static_cast<int32_t>(k_ESteamNetworkingConnectionState_Connected);
+        record._end_reason = 0;
+        record._type = SteamNetworkEvent::T_state_changed;
+        queue_event(record);
+    }
+
+    return Py_BuildValue("(II)", (unsigned int)connection1, (unsigned int)connection2);
+}
+
 ////////////////////////////////////////////////////////////////////
 //     Function: SteamNetworkManager::get_connection_info
 //       Access: Published
@@ -167,169 +456,2604 @@ bool SteamNetworkManager::get_connection_info(SteamNetworkConnectionHandle conne
         return false;
     }
 
+    info.set_connection(connection);
     info.set_listen_socket(static_cast<SteamNetworkListenSocketHandle>(native_info.m_hListenSocket));
     info.set_state(native_info.m_eState);
     info.set_end_reason(native_info.m_eEndReason);
+    info.set_remote_steam_id(native_info.m_identityRemote.GetSteamID64());
+
+    NetAddress address;
+    ip_addr_to_net_address(native_info.m_addrRemote, address);
+    info.set_net_address(address);
+
+    std::lock_guard<std::mutex> guard(_connections_lock);
+    ConnectionTable::const_iterator it = _connections.find(connection);
+    if (it != _connections.end()) {
+        info.set_connect_time(it->second.get_connect_time());
+        info.set_user_data(it->second.get_user_data());
+    } else {
+        info.set_connect_time(0.0);
+        info.set_user_data(0);
+    }
     return true;
 }
 
 ////////////////////////////////////////////////////////////////////
-//     Function: SteamNetworkManager::close_connection
+//     Function: SteamNetworkManager::lookup_connection
 //       Access: Published
-//  Description: Closes the given connection gracefully.
+//  Description: Copies the connection table entry for the given
+//               connection into info, without querying Steam.  The
+//               entry is kept up to date by the status callback, so
+//               it reflects the state as of the last run_callbacks.
+//               Returns false if the connection is not in the table.
 ////////////////////////////////////////////////////////////////////
-void SteamNetworkManager::close_connection(SteamNetworkConnectionHandle connection) {
-    if (_interface == nullptr) return;
-    _interface->CloseConnection(connection, 0, nullptr, false);
+bool SteamNetworkManager::lookup_connection(SteamNetworkConnectionHandle connection, SteamNetworkConnectionInfo &info) const {
+    std::lock_guard<std::mutex> guard(_connections_lock);
+    ConnectionTable::const_iterator it = _connections.find(connection);
+    if (it == _connections.end()) {
+        return false;
+    }
+    info = it->second;
+    return true;
 }
 
 ////////////////////////////////////////////////////////////////////
-//     Function: SteamNetworkManager::accept_connection
+//     Function: SteamNetworkManager::has_connection
 //       Access: Published
-//  Description: Accepts an incoming connection that has been
-//               signalled via a connection status callback.
+//  Description: Returns true if the connection is in the connection
+//               table.
 ////////////////////////////////////////////////////////////////////
-void SteamNetworkManager::accept_connection(SteamNetworkConnectionHandle connection) {
-    if (_interface == nullptr) return;
-    _interface->AcceptConnection(connection);
+bool SteamNetworkManager::has_connection(SteamNetworkConnectionHandle connection) const {
+    std::lock_guard<std::mutex> guard(_connections_lock);
+    return _connections.find(connection) != _connections.end();
 }
 
 ////////////////////////////////////////////////////////////////////
-//     Function: SteamNetworkManager::receive_message_on_connection
+//     Function: SteamNetworkManager::set_connection_user_data
 //       Access: Published
-//  Description: Receives the next pending message on the given
-//               connection and populates the supplied
-//               SteamNetworkMessage.  Returns true when a message
-//               was received.
+//  Description: Attaches an application-defined value, such as a
+//               player or session id, to the connection's table
+//               entry.  This is separate from Steam's own connection
+//               user data, which the manager uses to route
+//               callbacks.  Returns false if the connection is not
+//               in the table.
 ////////////////////////////////////////////////////////////////////
-bool SteamNetworkManager::receive_message_on_connection(SteamNetworkConnectionHandle connection, SteamNetworkMessage &message) {
-    if (_interface == nullptr) return false;
-
-    SteamNetworkingMessage_t *pMsg = nullptr;
-    int count = _interface->ReceiveMessagesOnConnection(connection, &pMsg, 1);
-    if (count <= 0 || pMsg == nullptr) {
+bool SteamNetworkManager::set_connection_user_data(SteamNetworkConnectionHandle connection, int64_t user_data) {
+    std::lock_guard<std::mutex> guard(_connections_lock);
+    ConnectionTable::iterator it = _connections.find(connection);
+    if (it == _connections.end()) {
         return false;
     }
+    it->second.set_user_data(user_data);
+    return true;
+}
+
+////////////////////////////////////////////////////////////////////
+//     Function: SteamNetworkManager::get_connection_user_data
+//       Access: Published
+//  Description: Returns the value attached with
+//               set_connection_user_data, or 0 if none.
+////////////////////////////////////////////////////////////////////
+int64_t SteamNetworkManager::get_connection_user_data(SteamNetworkConnectionHandle connection) const {
+    std::lock_guard<std::mutex> guard(_connections_lock);
+    ConnectionTable::const_iterator it = _connections.find(connection);
+    if (it == _connections.end()) {
+        return 0;
+    }
+    return it->second.get_user_data();
+}
 
-    Datagram dg(pMsg->m_pData, pMsg->m_cbSize);
-    message.set_datagram(std::move(dg));
-    message.set_connection(static_cast<SteamNetworkConnectionHandle>(pMsg->m_conn));
-    pMsg->Release();
+////////////////////////////////////////////////////////////////////
+//     Function: SteamNetworkManager::get_num_connections
+//       Access: Published
+//  Description: Returns the number of connections in the connection
+//               table.
+////////////////////////////////////////////////////////////////////
+size_t SteamNetworkManager::get_num_connections() const {
+    std::lock_guard<std::mutex> guard(_connections_lock);
+    return _connections.size();
+}
+
+////////////////////////////////////////////////////////////////////
+//     Function: SteamNetworkManager::get_connection_table
+//       Access: Published
+//  Description: Returns a copy of the whole connection table.
+////////////////////////////////////////////////////////////////////
+PT(SteamNetworkConnectionTable) SteamNetworkManager::get_connection_table() const {
+    PT(SteamNetworkConnectionTable) table = new SteamNetworkConnectionTable;
+
+    std::lock_guard<std::mutex> guard(_connections_lock);
+    table->_connections.reserve(_connections.size());
+    for (const ConnectionTable::value_type &entry : _connections) {
+        table->_connections.push_back(new SteamNetworkConnectionInfo(entry.second));
+    }
+    return table;
+}
+
+////////////////////////////////////////////////////////////////////
+//     Function: SteamNetworkManager::get_local_time
+//       Access: Published, Static
+//  Description: Returns Steam's local timestamp in seconds; the
+//               clock that connection connect times are taken from.
+////////////////////////////////////////////////////////////////////
+double SteamNetworkManager::get_local_time() {
+    ISteamNetworkingUtils *utils = SteamNetworkingUtils();
+    if (utils == nullptr) {
+        steam_cat.error() << "SteamNetworkingUtils interface not initialised." << std::endl;
+        return 0.0;
+    }
+    return static_cast<double>(utils->GetLocalTimestamp()) / 1000000.0;
+}
+
+////////////////////////////////////////////////////////////////////
+//     Function: SteamNetworkManager::set_connection_compression
+//       Access: Published
+//  Description: Enables or disables payload compression on the
+//               connection.  While enabled, send_datagram compresses
+//               payloads of at least threshold bytes with zlib at
+//               the given level, and every payload carries a
+//               one-byte header saying whether it is compressed.
+//               Every send path frames the payload this way, and
+//               every receive path strips the header and
+//               decompresses before the message is handed out, the
+//               batches, buffers and service queues included, so
+//               both ends must enable compression.  Returns false if
+//               compression is unavailable in this build.
+////////////////////////////////////////////////////////////////////
+bool SteamNetworkManager::set_connection_compression(SteamNetworkConnectionHandle connection, bool enabled,
+                                                     size_t threshold, int level) {
+    std::lock_guard<std::mutex> guard(_compression_lock);
+    if (!enabled) {
+        _compression.erase(connection);
+        return true;
+    }
+#ifdef HAVE_ZLIB
+    CompressionSettings &settings = _compression[connection];
+    settings._threshold = threshold;
+    settings._level = level;
     return true;
+#else
+    steam_cat.error() << "Payload compression requires Panda3D to be built with zlib." << std::endl;
+    return false;
+#endif
 }
 
 ////////////////////////////////////////////////////////////////////
-//     Function: SteamNetworkManager::receive_message_on_poll_group
+//     Function: SteamNetworkManager::get_connection_compression
 //       Access: Published
-//  Description: Receives the next pending message on the given
-//               poll group and populates the supplied
-//               SteamNetworkMessage.  Returns true when a message
-//               was received.
+//  Description: Returns true if compression is enabled on the
+//               connection.
 ////////////////////////////////////////////////////////////////////
-bool SteamNetworkManager::receive_message_on_poll_group(SteamNetworkPollGroupHandle poll_group, SteamNetworkMessage &message) {
+bool SteamNetworkManager::get_connection_compression(SteamNetworkConnectionHandle connection) const {
+    std::lock_guard<std::mutex> guard(_compression_lock);
+    return _compression.find(connection) != _compression.end();
+}
+
+////////////////////////////////////////////////////////////////////
+//     Function: SteamNetworkManager::get_compression_stats
+//       Access: Published
+//  Description: Returns a copy of the compression counters
+//               accumulated since the manager was created or last
+//               reset.
+////////////////////////////////////////////////////////////////////
+SteamNetworkCompressionStats SteamNetworkManager::get_compression_stats() const {
+    std::lock_guard<std::mutex> guard(_compression_lock);
+    return _compression_stats;
+}
+
+////////////////////////////////////////////////////////////////////
+//     Function: SteamNetworkManager::reset_compression_stats
+//       Access: Published
+////////////////////////////////////////////////////////////////////
+void SteamNetworkManager::reset_compression_stats() {
+    std::lock_guard<std::mutex> guard(_compression_lock);
+    _compression_stats = SteamNetworkCompressionStats();
+}
+
+////////////////////////////////////////////////////////////////////
+//     Function: SteamNetworkManager::set_fake_network_conditions
+//       Access: Published, Static
+//  Description: Simulates the given packet loss, lag, reordering
+//               and duplication on all traffic.  Pass a default
+//               SteamNetworkFakeConditions to turn the simulation
+//               off.  Only affects traffic that actually goes
+//               through the packet path, so not socket pairs
+//               created without network loopback.  Returns true if
+//               every value was accepted.
+////////////////////////////////////////////////////////////////////
+bool SteamNetworkManager::set_fake_network_conditions(const SteamNetworkFakeConditions &conditions) {
+    return apply_fake_conditions(k_ESteamNetworkingConfig_Global, 0, conditions);
+}
+
+////////////////////////////////////////////////////////////////////
+//     Function: SteamNetworkManager::set_connection_fake_network_conditions
+//       Access: Published
+//  Description: Simulates the given network conditions on a single
+//               connection only.  Returns false if any value was
+//               rejected, e.g. by a Steam runtime that only allows
+//               some of them globally.
+////////////////////////////////////////////////////////////////////
+bool SteamNetworkManager::set_connection_fake_network_conditions(SteamNetworkConnectionHandle connection,
+                                                                 const SteamNetworkFakeConditions &conditions) {
+    return apply_fake_conditions(k_ESteamNetworkingConfig_Connection, static_cast<intptr_t>(connection), conditions);
+}
+
+////////////////////////////////////////////////////////////////////
+//     Function: SteamNetworkManager::get_connection_status
+//       Access: Published
+//  Description: Fills in a SteamNetworkConnectionStatus with the
+//               real-time ping, quality, throughput and queue state
+//               of the given connection.  Returns true on success.
+////////////////////////////////////////////////////////////////////
+bool SteamNetworkManager::get_connection_status(SteamNetworkConnectionHandle connection, SteamNetworkConnectionStatus &status) {
     if (_interface == nullptr) return false;
 
-    SteamNetworkingMessage_t *pMsg = nullptr;
-    int count = _interface->ReceiveMessagesOnPollGroup(poll_group, &pMsg, 1);
-    if (count <= 0 || pMsg == nullptr) {
+    SteamNetConnectionRealTimeStatus_t native_status;
+    if (_interface->GetConnectionRealTimeStatus(connection, &native_status, 0, nullptr) != k_EResultOK) {
         return false;
     }
 
-    Datagram dg(pMsg->m_pData, pMsg->m_cbSize);
-    message.set_datagram(std::move(dg));
-    message.set_connection(static_cast<SteamNetworkConnectionHandle>(pMsg->m_conn));
-    pMsg->Release();
+    SteamNetworkConnectionStatusRecord record;
+    record.set(connection, native_status);
+    status.set_record(record);
     return true;
 }
 
 ////////////////////////////////////////////////////////////////////
-//     Function: SteamNetworkManager::create_poll_group
+//     Function: SteamNetworkManager::get_connection_statuses
 //       Access: Published
-//  Description: Creates a new poll group and returns its handle.
+//  Description: Captures the real-time status of every connection
+//               in the group into a single batch.  Connections
+//               whose status cannot be read are skipped.
 ////////////////////////////////////////////////////////////////////
-SteamNetworkPollGroupHandle SteamNetworkManager::create_poll_group() {
-    if (_interface == nullptr) return INVALID_STEAM_NETWORK_POLL_GROUP_HANDLE;
-    return static_cast<SteamNetworkPollGroupHandle>(_interface->CreatePollGroup());
+PT(SteamNetworkConnectionStatusBatch) SteamNetworkManager::get_connection_statuses(const SteamNetworkConnectionGroup &connections) {
+    PT(SteamNetworkConnectionStatusBatch) batch = new SteamNetworkConnectionStatusBatch;
+    if (_interface == nullptr) return batch;
+
+    size_t num_connections = connections.get_num_connections();
+    batch->_records.reserve(num_connections);
+
+    SteamNetConnectionRealTimeStatus_t native_status;
+    for (size_t i = 0; i < num_connections; ++i) {
+        SteamNetworkConnectionHandle connection = connections.get_connection(i);
+        if (_interface->GetConnectionRealTimeStatus(connection, &native_status, 0, nullptr) != k_EResultOK) {
+            continue;
+        }
+        batch->_records.push_back(SteamNetworkConnectionStatusRecord());
+        batch->_records.back().set(connection, native_status);
+    }
+    return batch;
 }
 
 ////////////////////////////////////////////////////////////////////
-//     Function: SteamNetworkManager::set_connection_poll_group
+//     Function: SteamNetworkManager::get_poll_group_status
 //       Access: Published
-//  Description: Assigns a connection to the given poll group so
-//               messages can be received via
-//               receive_message_on_poll_group.
+//  Description: Captures the real-time status of every connection
+//               assigned to the given poll group.
 ////////////////////////////////////////////////////////////////////
-void SteamNetworkManager::set_connection_poll_group(SteamNetworkConnectionHandle connection, SteamNetworkPollGroupHandle poll_group) {
+PT(SteamNetworkConnectionStatusBatch) SteamNetworkManager::get_poll_group_status(SteamNetworkPollGroupHandle poll_group) {
+    std::lock_guard<std::mutex> guard(_poll_groups_lock);
+    pmap<SteamNetworkPollGroupHandle, PT(SteamNetworkConnectionGroup)>::const_iterator it = _poll_groups.find(poll_group);
+    if (it == _poll_groups.end()) {
+        return new SteamNetworkConnectionStatusBatch;
+    }
+    return get_connection_statuses(*it->second);
+}
+
+////////////////////////////////////////////////////////////////////
+//     Function: SteamNetworkManager::close_connection
+//       Access: Published
+//  Description: Closes the given connection gracefully.
+////////////////////////////////////////////////////////////////////
+void SteamNetworkManager::close_connection(SteamNetworkConnectionHandle connection) {
     if (_interface == nullptr) return;
-    _interface->SetConnectionPollGroup(connection, poll_group);
+    {
+        std::lock_guard<std::mutex> guard(_poll_groups_lock);
+        remove_from_poll_group(connection);
+    }
+    {
+        std::lock_guard<std::mutex> guard(_snapshots_lock);
+        _snapshots.erase(connection);
+    }
+    {
+        std::lock_guard<std::mutex> guard(_compression_lock);
+        _compression.erase(connection);
+    }
+    {
+        std::lock_guard<std::mutex> guard(_connections_lock);
+        _connections.erase(connection);
+    }
+    {
+        std::lock_guard<std::mutex> guard(_watermarks_lock);
+        _watermarks.erase(connection);
+    }
+    {
+        std::lock_guard<std::mutex> guard(_servers_lock);
+        for (pmap<SteamNetworkListenSocketHandle, ServerPolicy>::iterator it = _servers.begin(); it != _servers.end(); ++it) {
+            it->second._clients.erase(connection);
+        }
+    }
+    _interface->CloseConnection(connection, 0, nullptr, false);
 }
 
 ////////////////////////////////////////////////////////////////////
-//     Function: SteamNetworkManager::send_datagram
+//     Function: SteamNetworkManager::accept_connection
 //       Access: Published
-//  Description: Sends a datagram to the specified connection with
-//               the given send flags (reliable, unreliable, etc.).
+//  Description: Accepts an incoming connection that has been
+//               signalled via a connection status callback.
 ////////////////////////////////////////////////////////////////////
-void SteamNetworkManager::send_datagram(SteamNetworkConnectionHandle connection, const Datagram &dg, int send_flags) {
+void SteamNetworkManager::accept_connection(SteamNetworkConnectionHandle connection) {
     if (_interface == nullptr) return;
-    _interface->SendMessageToConnection(connection, dg.get_data(), dg.get_length(), send_flags, nullptr);
+    _interface->AcceptConnection(connection);
 }
 
 ////////////////////////////////////////////////////////////////////
-//     Function: SteamNetworkManager::send_datagram (broadcast)
+//     Function: SteamNetworkManager::flush_connection
 //       Access: Published
-//  Description: Sends a datagram to the current client connection
-//               (set by connect_by_ip_address / connect_by_steam_id).
+//  Description: Sends any messages on the connection that are
+//               still waiting out the Nagle delay immediately.
+//               Returns true on success.
 ////////////////////////////////////////////////////////////////////
-void SteamNetworkManager::send_datagram(const Datagram &dg, int send_flags) {
-    if (_interface == nullptr || _client_connection == 0) return;
-    _interface->SendMessageToConnection(_client_connection, dg.get_data(), dg.get_length(), send_flags, nullptr);
+bool SteamNetworkManager::flush_connection(SteamNetworkConnectionHandle connection) {
+    if (_interface == nullptr) return false;
+    return _interface->FlushMessagesOnConnection(connection) == k_EResultOK;
 }
 
 ////////////////////////////////////////////////////////////////////
-//     Function: SteamNetworkManager::run_callbacks
+//     Function: SteamNetworkManager::get_pending_bytes
 //       Access: Published
-//  Description: Pumps the networking callbacks.  Should be called
-//               once per frame.
+//  Description: Returns the number of bytes queued on the
+//               connection that Steam has not yet put on the wire,
+//               reliable and unreliable together, or -1 if the
+//               connection is invalid.
 ////////////////////////////////////////////////////////////////////
-void SteamNetworkManager::run_callbacks() {
-    if (_interface != nullptr) {
-        _interface->RunCallbacks();
+int64_t SteamNetworkManager::get_pending_bytes(SteamNetworkConnectionHandle connection) {
+    if (_interface == nullptr) return -1;
+
+    SteamNetConnectionRealTimeStatus_t native_status;
+    if (_interface->GetConnectionRealTimeStatus(connection, &native_status, 0, nullptr) != k_EResultOK) {
+        return -1;
     }
+    return static_cast<int64_t>(native_status.m_cbPendingReliable) + native_status.m_cbPendingUnreliable;
 }
 
 ////////////////////////////////////////////////////////////////////
-//     Function: SteamNetworkManager::get_next_event
+//     Function: SteamNetworkManager::set_send_watermarks
 //       Access: Published
-//  Description: Returns and removes the oldest queued connection
-//               state-change event, or nullptr if the queue is
-//               empty.
+//  Description: Enables writable/unwritable events for the
+//               connection.  Once a send leaves high or more bytes
+//               pending, or is refused with k_EResultLimitExceeded,
+//               the connection becomes unwritable and a T_unwritable
+//               event is queued.  Once the pending bytes fall to low
+//               or below, a T_writable event follows.  Producers
+//               such as asset streaming should pause between the
+//               two.  high should stay below the connection's
+//               SendBufferSize, so the event arrives before sends
+//               start failing.
 ////////////////////////////////////////////////////////////////////
-PT(SteamNetworkEvent) SteamNetworkManager::get_next_event() {
-    if (_events.empty()) {
-        return nullptr;
+void SteamNetworkManager::set_send_watermarks(SteamNetworkConnectionHandle connection, size_t high, size_t low) {
+    nassertv(low <= high);
+
+    std::lock_guard<std::mutex> guard(_watermarks_lock);
+    pmap<SteamNetworkConnectionHandle, SendWatermarks>::iterator it = _watermarks.find(connection);
+    if (it == _watermarks.end()) {
+        SendWatermarks &watermarks = _watermarks[connection];
+        watermarks._high = high;
+        watermarks._low = low;
+        watermarks._writable = true;
+    } else {
+        it->second._high = high;
+        it->second._low = low;
     }
-    PT(SteamNetworkEvent) event = _events.front();
-    _events.pop_front();
-    return event;
 }
 
 ////////////////////////////////////////////////////////////////////
-//     Function: SteamNetworkManager::OnSteamNetConnectionStatusChanged
-//       Access: Public, Static
-//  Description: Static callback invoked by Steam when a connection
-//               changes state.  Queues a SteamNetworkEvent on the
-//               global manager.
+//     Function: SteamNetworkManager::clear_send_watermarks
+//       Access: Published
+//  Description: Stops raising writable/unwritable events for the
+//               connection.
 ////////////////////////////////////////////////////////////////////
-void SteamNetworkManager::OnSteamNetConnectionStatusChanged(SteamNetConnectionStatusChangedCallback_t *pInfo) {
-    if (_global_ptr == nullptr) return;
+void SteamNetworkManager::clear_send_watermarks(SteamNetworkConnectionHandle connection) {
+    std::lock_guard<std::mutex> guard(_watermarks_lock);
+    _watermarks.erase(connection);
+}
 
-    PT(SteamNetworkEvent) event = new SteamNetworkEvent(
-        static_cast<SteamNetworkConnectionHandle>(pInfo->m_hConn),
-        static_cast<int>(pInfo->m_eOldState),
-        static_cast<int>(pInfo->m_info.m_eState)
-    );
-    _global_ptr->_events.push_back(event);
+////////////////////////////////////////////////////////////////////
+//     Function: SteamNetworkManager::is_connection_writable
+//       Access: Published
+//  Description: Returns false between a T_unwritable event and the
+//               following T_writable event.  Always true for
+//               connections without send watermarks.
+////////////////////////////////////////////////////////////////////
+bool SteamNetworkManager::is_connection_writable(SteamNetworkConnectionHandle connection) const {
+    std::lock_guard<std::mutex> guard(_watermarks_lock);
+    pmap<SteamNetworkConnectionHandle, SendWatermarks>::const_iterator it = _watermarks.find(connection);
+    return it == _watermarks.end() || it->second._writable;
+}
+
+////////////////////////////////////////////////////////////////////
+//     Function: SteamNetworkManager::configure_connection_lanes
+//       Access: Published
+//  Description: Declares the lanes of a connection.  Each lane has
+//               its own reliable stream, so a large transfer on one
+//               lane does not hold up messages on another.
+//               priorities is a sequence of ints, one per lane;
+//               lower numbers are serviced first.  weights is an
+//               optional sequence of the same length that splits
+//               bandwidth between lanes of equal priority.
+//               Returns true on success.
+////////////////////////////////////////////////////////////////////
+bool SteamNetworkManager::configure_connection_lanes(SteamNetworkConnectionHandle connection, PyObject *priorities,
+                                                     PyObject *weights) {
+    if (_interface == nullptr) return false;
+
+    PyObject *priority_seq = PySequence_Fast(priorities, "priorities must be a sequence");
+    if (priority_seq == nullptr) {
+        return false;
+    }
+
+    Py_ssize_t num_lanes = PySequence_Fast_GET_SIZE(priority_seq);
+    pvector<int> lane_priorities(num_lanes);
+    for (Py_ssize_t i = 0; i < num_lanes; ++i) {
+        lane_priorities[i] = (int)PyLong_AsLong(PySequence_Fast_GET_ITEM(priority_seq, i));
+    }
+    Py_DECREF(priority_seq);
+    if (PyErr_Occurred()) {
+        return false;
+    }
+
+    pvector<uint16> lane_weights;
+    if (weights != nullptr && weights != Py_None) {
+        PyObject *weight_seq = PySequence_Fast(weights, "weights must be a sequence");
+        if (weight_seq == nullptr) {
+            return false;
+        }
+        if (PySequence_Fast_GET_SIZE(weight_seq) != num_lanes) {
+            Py_DECREF(weight_seq);
+            PyErr_SetString(PyExc_ValueError, "weights must have one entry per lane");
+            return false;
+        }
+        lane_weights.resize(num_lanes);
+        for (Py_ssize_t i = 0; i < num_lanes; ++i) {
+            lane_weights[i] = (uint16)PyLong_AsLong(PySequence_Fast_GET_ITEM(weight_seq, i));
+        }
+        Py_DECREF(weight_seq);
+        if (PyErr_Occurred()) {
+            return false;
+        }
+    }
+
+    EResult result = _interface->ConfigureConnectionLanes(connection, static_cast<int>(num_lanes),
+                                                          lane_priorities.data(),
+                                                          lane_weights.empty() ? nullptr : lane_weights.data());
+    if (result != k_EResultOK) {
+        steam_cat.error() << "Failed to configure " << num_lanes << " lanes on connection "
+                          << connection << " (EResult " << result << ")." << std::endl;
+        return false;
+    }
+    return true;
+}
+
+////////////////////////////////////////////////////////////////////
+//     Function: SteamNetworkManager::set_connection_config_int32
+//       Access: Published
+//  Description: Sets an integer configuration value, such as
+//               k_ESteamNetworkingConfig_SendRateMax or
+//               k_ESteamNetworkingConfig_NagleTime, on a single
+//               connection.  Returns true on success.
+////////////////////////////////////////////////////////////////////
+bool SteamNetworkManager::set_connection_config_int32(SteamNetworkConnectionHandle connection, int config_value, int value) {
+    ISteamNetworkingUtils *utils = SteamNetworkingUtils();
+    if (utils == nullptr) {
+        steam_cat.error() << "SteamNetworkingUtils interface not initialised." << std::endl;
+        return false;
+    }
+    return utils->SetConnectionConfigValueInt32(connection, static_cast<ESteamNetworkingConfigValue>(config_value), value);
+}
+
+////////////////////////////////////////////////////////////////////
+//     Function: SteamNetworkManager::set_connection_config_float
+//       Access: Published
+//  Description: Sets a floating-point configuration value on a
+//               single connection.  Returns true on success.
+////////////////////////////////////////////////////////////////////
+bool SteamNetworkManager::set_connection_config_float(SteamNetworkConnectionHandle connection, int config_value, float value) {
+    ISteamNetworkingUtils *utils = SteamNetworkingUtils();
+    if (utils == nullptr) {
+        steam_cat.error() << "SteamNetworkingUtils interface not initialised." << std::endl;
+        return false;
+    }
+    return utils->SetConnectionConfigValueFloat(connection, static_cast<ESteamNetworkingConfigValue>(config_value), value);
+}
+
+////////////////////////////////////////////////////////////////////
+//     Function: SteamNetworkManager::set_connection_config_string
+//       Access: Published
+//  Description: Sets a string configuration value on a single
+//               connection.  Returns true on success.
+////////////////////////////////////////////////////////////////////
+bool SteamNetworkManager::set_connection_config_string(SteamNetworkConnectionHandle connection, int config_value, const std::string &value) {
+    ISteamNetworkingUtils *utils = SteamNetworkingUtils();
+    if (utils == nullptr) {
+        steam_cat.error() << "SteamNetworkingUtils interface not initialised." << std::endl;
+        return false;
+    }
+    return utils->SetConnectionConfigValueString(connection, static_cast<ESteamNetworkingConfigValue>(config_value), value.c_str());
+}
+
+////////////////////////////////////////////////////////////////////
+//     Function: SteamNetworkManager::set_global_config_int32
+//       Access: Published, Static
+//  Description: Sets an integer configuration value globally.  The
+//               value applies to sockets and connections created
+//               afterwards that do not override it.  Returns true
+//               on success.
+////////////////////////////////////////////////////////////////////
+bool SteamNetworkManager::set_global_config_int32(int config_value, int value) {
+    ISteamNetworkingUtils *utils = SteamNetworkingUtils();
+    if (utils == nullptr) {
+        steam_cat.error() << "SteamNetworkingUtils interface not initialised." << std::endl;
+        return false;
+    }
+    return utils->SetGlobalConfigValueInt32(static_cast<ESteamNetworkingConfigValue>(config_value), value);
+}
+
+////////////////////////////////////////////////////////////////////
+//     Function: SteamNetworkManager::set_global_config_float
+//       Access: Published, Static
+//  Description: Sets a floating-point configuration value globally.
+//               Returns true on success.
+////////////////////////////////////////////////////////////////////
+bool SteamNetworkManager::set_global_config_float(int config_value, float value) {
+    ISteamNetworkingUtils *utils = SteamNetworkingUtils();
+    if (utils == nullptr) {
+        steam_cat.error() << "SteamNetworkingUtils interface not initialised." << std::endl;
+        return false;
+    }
+    return utils->SetGlobalConfigValueFloat(static_cast<ESteamNetworkingConfigValue>(config_value), value);
+}
+
+////////////////////////////////////////////////////////////////////
+//     Function: SteamNetworkManager::set_global_config_string
+//       Access: Published, Static
+//  Description: Sets a string configuration value globally.
+//               Returns true on success.
+////////////////////////////////////////////////////////////////////
+bool SteamNetworkManager::set_global_config_string(int config_value, const std::string &value) {
+    ISteamNetworkingUtils *utils = SteamNetworkingUtils();
+    if (utils == nullptr) {
+        steam_cat.error() << "SteamNetworkingUtils interface not initialised." << std::endl;
+        return false;
+    }
+    return utils->SetGlobalConfigValueString(static_cast<ESteamNetworkingConfigValue>(config_value), value.c_str());
+}
+
+////////////////////////////////////////////////////////////////////
+//     Function: SteamNetworkManager::receive_message_on_connection
+//       Access: Published
+//  Description: Receives the next pending message on the given
+//               connection and populates the supplied
+//               SteamNetworkMessage.  Returns true when a message
+//               was received.
+////////////////////////////////////////////////////////////////////
+bool SteamNetworkManager::receive_message_on_connection(SteamNetworkConnectionHandle connection, SteamNetworkMessage &message) {
+    if (_interface == nullptr) return false;
+
+    SteamNetworkingMessage_t *pMsg = nullptr;
+    int count = receive_on_connection(connection, &pMsg, 1);
+    if (count <= 0 || pMsg == nullptr) {
+        return false;
+    }
+
+    read_message(pMsg, message);
+    pMsg->Release();
+    return true;
+}
+
+////////////////////////////////////////////////////////////////////
+//     Function: SteamNetworkManager::receive_message_on_poll_group
+//       Access: Published
+//  Description: Receives the next pending message on the given
+//               poll group and populates the supplied
+//               SteamNetworkMessage.  Returns true when a message
+//               was received.
+////////////////////////////////////////////////////////////////////
+bool SteamNetworkManager::receive_message_on_poll_group(SteamNetworkPollGroupHandle poll_group, SteamNetworkMessage &message) {
+    if (_interface == nullptr) return false;
+
+    SteamNetworkingMessage_t *pMsg = nullptr;
+    int count = receive_on_poll_group(poll_group, &pMsg, 1);
+    if (count <= 0 || pMsg == nullptr) {
+        return false;
+    }
+
+    read_message(pMsg, message);
+    pMsg->Release();
+    return true;
+}
+
+////////////////////////////////////////////////////////////////////
+//     Function: SteamNetworkManager::receive_messages_on_connection
+//       Access: Published
+//  Description: Receives up to max_messages pending messages on the
+//               given connection with a single native call.  The
+//               returned batch may be empty, but is never null.
+////////////////////////////////////////////////////////////////////
+PT(SteamNetworkMessageBatch) SteamNetworkManager::receive_messages_on_connection(SteamNetworkConnectionHandle connection, int max_messages) {
+    PT(SteamNetworkMessageBatch) batch = new SteamNetworkMessageBatch;
+    if (_interface == nullptr || max_messages <= 0) return batch;
+
+    batch->_messages.resize(max_messages);
+    int count = receive_on_connection(connection, batch->_messages.data(), max_messages);
+    batch->_messages.resize(count > 0 ? count : 0);
+    return batch;
+}
+
+////////////////////////////////////////////////////////////////////
+//     Function: SteamNetworkManager::receive_messages_on_poll_group
+//       Access: Published
+//  Description: Receives up to max_messages pending messages on the
+//               given poll group with a single native call.  The
+//               returned batch may be empty, but is never null.
+////////////////////////////////////////////////////////////////////
+PT(SteamNetworkMessageBatch) SteamNetworkManager::receive_messages_on_poll_group(SteamNetworkPollGroupHandle poll_group, int max_messages) {
+    PT(SteamNetworkMessageBatch) batch = new SteamNetworkMessageBatch;
+    if (_interface == nullptr || max_messages <= 0) return batch;
+
+    batch->_messages.resize(max_messages);
+    int count = receive_on_poll_group(poll_group, batch->_messages.data(), max_messages);
+    batch->_messages.resize(count > 0 ? count : 0);
+    return batch;
+}
+
+////////////////////////////////////////////////////////////////////
+//     Function: SteamNetworkManager::receive_buffer_on_connection
+//       Access: Published
+//  Description: Receives the next pending message on the given
+//               connection without copying its payload.  Returns
+//               nullptr when no message is waiting.
+////////////////////////////////////////////////////////////////////
+PT(SteamNetworkMessageBuffer) SteamNetworkManager::receive_buffer_on_connection(SteamNetworkConnectionHandle connection) {
+    if (_interface == nullptr) return nullptr;
+
+    SteamNetworkingMessage_t *pMsg = nullptr;
+    int count = receive_on_connection(connection, &pMsg, 1);
+    if (count <= 0 || pMsg == nullptr) {
+        return nullptr;
+    }
+
+    return new SteamNetworkMessageBuffer(pMsg);
+}
+
+////////////////////////////////////////////////////////////////////
+//     Function: SteamNetworkManager::receive_buffer_on_poll_group
+//       Access: Published
+//  Description: Receives the next pending message on the given
+//               poll group without copying its payload.  Returns
+//               nullptr when no message is waiting.
+////////////////////////////////////////////////////////////////////
+PT(SteamNetworkMessageBuffer) SteamNetworkManager::receive_buffer_on_poll_group(SteamNetworkPollGroupHandle poll_group) {
+    if (_interface == nullptr) return nullptr;
+
+    SteamNetworkingMessage_t *pMsg = nullptr;
+    int count = receive_on_poll_group(poll_group, &pMsg, 1);
+    if (count <= 0 || pMsg == nullptr) {
+        return nullptr;
+    }
+
+    return new SteamNetworkMessageBuffer(pMsg);
+}
+
+////////////////////////////////////////////////////////////////////
+//     Function: SteamNetworkManager::acquire_message
+//       Access: Published
+//  Description: Returns an empty message from the pool, or a new
+//               one if the pool is empty.  Pass it back to
+//               release_message once it has been processed so its
+//               storage can be reused.
+////////////////////////////////////////////////////////////////////
+PT(SteamNetworkMessage) SteamNetworkManager::acquire_message() {
+    if (_message_pool.empty()) {
+        return new SteamNetworkMessage;
+    }
+    PT(SteamNetworkMessage) message = std::move(_message_pool.back());
+    _message_pool.pop_back();
+    message->set_in_pool(false);
+    return message;
+}
+
+////////////////////////////////////////////////////////////////////
+//     Function: SteamNetworkManager::release_message
+//       Access: Published
+//  Description: Returns a message to the pool.  The message must
+//               not be used afterwards.  Releasing a message that is
+//               already in the pool is an error.  A message that is
+//               still referenced anywhere besides the caller is left
+//               alone rather than reset and handed out again, and
+//               messages beyond max_pooled_messages are simply
+//               dropped.
+////////////////////////////////////////////////////////////////////
+void SteamNetworkManager::release_message(SteamNetworkMessage *message) {
+    nassertv(message != nullptr);
+    nassertv(!message->is_in_pool());
+
+    // The caller's reference must be the only one.
+    if (message->get_ref_count() != 1 || _message_pool.size() >= _max_pooled_messages) {
+        return;
+    }
+    message->reset();
+    message->set_in_pool(true);
+    _message_pool.push_back(message);
+}
+
+////////////////////////////////////////////////////////////////////
+//     Function: SteamNetworkManager::receive_pooled_message_on_connection
+//       Access: Published
+//  Description: Receives the next pending message on the connection
+//               into a message from the pool.  Returns None when no
+//               message is pending.
+////////////////////////////////////////////////////////////////////
+PT(SteamNetworkMessage) SteamNetworkManager::receive_pooled_message_on_connection(SteamNetworkConnectionHandle connection) {
+    if (_interface == nullptr) return nullptr;
+
+    SteamNetworkingMessage_t *pMsg = nullptr;
+    int count = receive_on_connection(connection, &pMsg, 1);
+    if (count <= 0 || pMsg == nullptr) {
+        return nullptr;
+    }
+
+    PT(SteamNetworkMessage) message = acquire_message();
+    read_message(pMsg, *message);
+    pMsg->Release();
+    return message;
+}
+
+////////////////////////////////////////////////////////////////////
+//     Function: SteamNetworkManager::receive_pooled_message_on_poll_group
+//       Access: Published
+//  Description: Receives the next pending message on the poll group
+//               into a message from the pool.  Returns None when no
+//               message is pending.
+////////////////////////////////////////////////////////////////////
+PT(SteamNetworkMessage) SteamNetworkManager::receive_pooled_message_on_poll_group(SteamNetworkPollGroupHandle poll_group) {
+    if (_interface == nullptr) return nullptr;
+
+    SteamNetworkingMessage_t *pMsg = nullptr;
+    int count = receive_on_poll_group(poll_group, &pMsg, 1);
+    if (count <= 0 || pMsg == nullptr) {
+        return nullptr;
+    }
+
+    PT(SteamNetworkMessage) message = acquire_message();
+    read_message(pMsg, *message);
+    pMsg->Release();
+    return message;
+}
+
+////////////////////////////////////////////////////////////////////
+//     Function: SteamNetworkManager::set_max_pooled_messages
+//       Access: Published
+//  Description: Sets how many released messages the pool keeps.
+////////////////////////////////////////////////////////////////////
+void SteamNetworkManager::set_max_pooled_messages(size_t max_messages) {
+    _max_pooled_messages = max_messages;
+    while (_message_pool.size() > max_messages) {
+        _message_pool.back()->set_in_pool(false);
+        _message_pool.pop_back();
+    }
+}
+
+////////////////////////////////////////////////////////////////////
+//     Function: SteamNetworkManager::get_max_pooled_messages
+//       Access: Published
+////////////////////////////////////////////////////////////////////
+size_t SteamNetworkManager::get_max_pooled_messages() const {
+    return _max_pooled_messages;
+}
+
+////////////////////////////////////////////////////////////////////
+//     Function: SteamNetworkManager::get_num_pooled_messages
+//       Access: Published
+//  Description: Returns the number of messages waiting in the pool.
+////////////////////////////////////////////////////////////////////
+size_t SteamNetworkManager::get_num_pooled_messages() const {
+    return _message_pool.size();
+}
+
+////////////////////////////////////////////////////////////////////
+//     Function: SteamNetworkManager::create_poll_group
+//       Access: Published
+//  Description: Creates a new poll group and returns its handle.
+////////////////////////////////////////////////////////////////////
+SteamNetworkPollGroupHandle SteamNetworkManager::create_poll_group() {
+    if (_interface == nullptr) return INVALID_STEAM_NETWORK_POLL_GROUP_HANDLE;
+
+    SteamNetworkPollGroupHandle poll_group = static_cast<SteamNetworkPollGroupHandle>(_interface->CreatePollGroup());
+    if (poll_group != INVALID_STEAM_NETWORK_POLL_GROUP_HANDLE) {
+        std::lock_guard<std::mutex> guard(_poll_groups_lock);
+        _poll_groups[poll_group] = new SteamNetworkConnectionGroup;
+    }
+    return poll_group;
+}
+
+////////////////////////////////////////////////////////////////////
+//     Function: SteamNetworkManager::set_connection_poll_group
+//       Access: Published
+//  Description: Assigns a connection to the given poll group so
+//               messages can be received via
+//               receive_message_on_poll_group.
+////////////////////////////////////////////////////////////////////
+void SteamNetworkManager::set_connection_poll_group(SteamNetworkConnectionHandle connection, SteamNetworkPollGroupHandle poll_group) {
+    if (_interface == nullptr) return;
+    if (!_interface->SetConnectionPollGroup(connection, poll_group)) {
+        return;
+    }
+
+    std::lock_guard<std::mutex> guard(_poll_groups_lock);
+    remove_from_poll_group(connection);
+
+    pmap<SteamNetworkPollGroupHandle, PT(SteamNetworkConnectionGroup)>::iterator it = _poll_groups.find(poll_group);
+    if (it != _poll_groups.end()) {
+        it->second->add_connection(connection);
+        _connection_poll_groups[connection] = poll_group;
+    }
+}
+
+////////////////////////////////////////////////////////////////////
+//     Function: SteamNetworkManager::get_poll_group_connections
+//       Access: Published
+//  Description: Returns the live set of connections assigned to the
+//               given poll group, or nullptr if the poll group was
+//               not created by this manager.  The returned group is
+//               updated in place as connections join and leave,
+//               including by server sockets accepting connections;
+//               do not iterate it on one thread while another thread
+//               pumps the callbacks.
+////////////////////////////////////////////////////////////////////
+PT(SteamNetworkConnectionGroup) SteamNetworkManager::get_poll_group_connections(SteamNetworkPollGroupHandle poll_group) const {
+    std::lock_guard<std::mutex> guard(_poll_groups_lock);
+    pmap<SteamNetworkPollGroupHandle, PT(SteamNetworkConnectionGroup)>::const_iterator it = _poll_groups.find(poll_group);
+    if (it == _poll_groups.end()) {
+        return nullptr;
+    }
+    return it->second;
+}
+
+////////////////////////////////////////////////////////////////////
+//     Function: SteamNetworkManager::remove_from_poll_group
+//       Access: Private
+//  Description: Drops the connection from whichever poll group
+//               connection set it is currently tracked in.  The
+//               caller must hold _poll_groups_lock.
+////////////////////////////////////////////////////////////////////
+void SteamNetworkManager::remove_from_poll_group(SteamNetworkConnectionHandle connection) {
+    pmap<SteamNetworkConnectionHandle, SteamNetworkPollGroupHandle>::iterator it = _connection_poll_groups.find(connection);
+    if (it == _connection_poll_groups.end()) {
+        return;
+    }
+
+    pmap<SteamNetworkPollGroupHandle, PT(SteamNetworkConnectionGroup)>::iterator git = _poll_groups.find(it->second);
+    if (git != _poll_groups.end()) {
+        git->second->remove_connection(connection);
+    }
+    _connection_poll_groups.erase(it);
+}
+
+////////////////////////////////////////////////////////////////////
+//     Function: SteamNetworkManager::send_datagram
+//       Access: Published
+//  Description: Sends a datagram to the specified connection with
+//               the given send flags (reliable, unreliable, etc.)
+//               on the given lane.  Lanes other than 0 must first
+//               be declared with configure_connection_lanes.
+//               Returns the message number Steam assigned, or a
+//               negated EResult on failure.
+////////////////////////////////////////////////////////////////////
+int64_t SteamNetworkManager::send_datagram(SteamNetworkConnectionHandle connection, const Datagram &dg, int send_flags, int lane) {
+    if (_interface == nullptr) return -k_EResultNoConnection;
+
+    CompressionSettings settings;
+    if (get_compression(connection, settings)) {
+        Datagram framed;
+        frame_payload(settings, dg.get_data(), dg.get_length(), framed);
+        return send_framed_datagram(connection, framed, send_flags, lane);
+    }
+    return send_framed_datagram(connection, dg, send_flags, lane);
+}
+
+////////////////////////////////////////////////////////////////////
+//     Function: SteamNetworkManager::send_framed_datagram
+//       Access: Private
+//  Description: Sends the datagram as-is, after any compression
+//               framing has been applied.
+////////////////////////////////////////////////////////////////////
+int64_t SteamNetworkManager::send_framed_datagram(SteamNetworkConnectionHandle connection, const Datagram &dg, int send_flags, int lane) {
+    if (lane == 0) {
+        int64 message_number = 0;
+        EResult result = _interface->SendMessageToConnection(connection, dg.get_data(), dg.get_length(), send_flags, &message_number);
+        int64_t sent = result == k_EResultOK ? message_number : -result;
+        check_backpressure(connection, sent);
+        return sent;
+    }
+
+    // SendMessageToConnection always uses the default lane; anything
+    // else has to go through SendMessages with m_idxLane set.
+    ISteamNetworkingUtils *utils = SteamNetworkingUtils();
+    if (utils == nullptr) {
+        steam_cat.error() << "SteamNetworkingUtils interface not initialised." << std::endl;
+        return -k_EResultFail;
+    }
+
+    SteamNetworkingMessage_t *msg = utils->AllocateMessage(static_cast<int>(dg.get_length()));
+    if (msg == nullptr) {
+        return -k_EResultFail;
+    }
+    if (dg.get_length() > 0) {
+        memcpy(msg->m_pData, dg.get_data(), dg.get_length());
+    }
+    msg->m_conn = static_cast<HSteamNetConnection>(connection);
+    msg->m_nFlags = send_flags;
+    msg->m_idxLane = static_cast<uint16>(lane);
+
+    int64 result = 0;
+    _interface->SendMessages(1, &msg, &result);
+    check_backpressure(connection, result);
+    return result;
+}
+
+////////////////////////////////////////////////////////////////////
+//     Function: SteamNetworkManager::send_datagram (broadcast)
+//       Access: Published
+//  Description: Sends a datagram to the current client connection
+//               (set by connect_by_ip_address / connect_by_steam_id).
+//               Returns the message number, or a negated EResult.
+////////////////////////////////////////////////////////////////////
+int64_t SteamNetworkManager::send_datagram(const Datagram &dg, int send_flags) {
+    if (_interface == nullptr || _client_connection == 0) return -k_EResultNoConnection;
+    return send_datagram(_client_connection, dg, send_flags);
+}
+
+////////////////////////////////////////////////////////////////////
+//     Function: SteamNetworkManager::send_message
+//       Access: Published
+//  Description: Hands the message written into the builder to Steam
+//               without copying it, leaving the builder empty.  On a
+//               connection with compression enabled the payload is
+//               sent through send_datagram instead, since it has to
+//               be reframed anyway.  Returns the message number, or
+//               a negated EResult; the message is released on
+//               failure.
+////////////////////////////////////////////////////////////////////
+int64_t SteamNetworkManager::send_message(SteamNetworkMessageBuilder &builder) {
+    SteamNetworkingMessage_t *msg = builder.release_message();
+    if (msg == nullptr) {
+        return -k_EResultInvalidParam;
+    }
+    if (_interface == nullptr) {
+        msg->Release();
+        return -k_EResultNoConnection;
+    }
+
+    SteamNetworkConnectionHandle connection = static_cast<SteamNetworkConnectionHandle>(msg->m_conn);
+    CompressionSettings settings;
+    if (get_compression(connection, settings)) {
+        Datagram dg(msg->m_pData, static_cast<size_t>(msg->m_cbSize));
+        int send_flags = msg->m_nFlags;
+        int lane = msg->m_idxLane;
+        msg->Release();
+        return send_datagram(connection, dg, send_flags, lane);
+    }
+
+    int64 result = 0;
+    _interface->SendMessages(1, &msg, &result);
+    check_backpressure(connection, result);
+    return result;
+}
+
+////////////////////////////////////////////////////////////////////
+//     Function: SteamNetworkManager::send_messages
+//       Access: Published
+//  Description: Submits every message queued in the batch with a
+//               single SendMessages call.  Steam takes ownership of
+//               the messages; the batch is left empty and records a
+//               message number (or negated EResult) per message.
+//               Messages for connections with compression enabled
+//               are framed first.  Returns the number of messages
+//               that were accepted.
+////////////////////////////////////////////////////////////////////
+int SteamNetworkManager::send_messages(SteamNetworkSendBatch &batch) {
+    if (_interface == nullptr || batch._messages.empty()) return 0;
+
+    int count = static_cast<int>(batch._messages.size());
+    pvector<SteamNetworkConnectionHandle> targets;
+    targets.reserve(count);
+    bool dropped = false;
+    for (SteamNetworkingMessage_t *&msg : batch._messages) {
+        targets.push_back(static_cast<SteamNetworkConnectionHandle>(msg->m_conn));
+        msg = frame_message(msg);
+        dropped = dropped || msg == nullptr;
+    }
+
+    batch._results.resize(count);
+    if (!dropped) {
+        _interface->SendMessages(count, batch._messages.data(), batch._results.data());
+    } else {
+        // Send what could be framed, and fail the rest.
+        pvector<SteamNetworkingMessage_t *> messages;
+        for (SteamNetworkingMessage_t *msg : batch._messages) {
+            if (msg != nullptr) {
+                messages.push_back(msg);
+            }
+        }
+        pvector<int64> results(messages.size());
+        _interface->SendMessages(static_cast<int>(messages.size()), messages.data(), results.data());
+        for (int i = 0, j = 0; i < count; ++i) {
+            batch._results[i] = batch._messages[i] != nullptr ? results[j++] : -k_EResultFail;
+        }
+    }
+    batch._messages.clear();
+
+    int sent = 0;
+    for (int i = 0; i < count; ++i) {
+        if (batch._results[i] > 0) {
+            ++sent;
+        }
+        check_backpressure(targets[i], batch._results[i]);
+    }
+    return sent;
+}
+
+////////////////////////////////////////////////////////////////////
+//     Function: SteamNetworkManager::flush_tick_channel
+//       Access: Published
+//  Description: Sends the records packed into the channel this tick
+//               as one message per max_message_size worth of data,
+//               with a single SendMessages call, and empties the
+//               channel.  On a connection with compression enabled
+//               each message is framed like send_datagram's.
+//               Returns the number of messages Steam accepted, which
+//               is less than the channel's num_messages if any send
+//               failed.
+//
+//               The flush is all or nothing: if the networking
+//               interfaces are unavailable or any message cannot be
+//               allocated, the error is logged, nothing is sent, the
+//               channel is left as it was so it can be flushed again
+//               or cleared, and -1 is returned.
+////////////////////////////////////////////////////////////////////
+int SteamNetworkManager::flush_tick_channel(SteamNetworkTickChannel &channel) {
+    if (channel._num_messages == 0) {
+        return 0;
+    }
+
+    ISteamNetworkingUtils *utils = SteamNetworkingUtils();
+    if (_interface == nullptr || utils == nullptr) {
+        steam_cat.error() << "Networking interfaces not initialised; tick channel not flushed." << std::endl;
+        return -1;
+    }
+
+    CompressionSettings settings;
+    bool compressed = get_compression(channel._connection, settings);
+
+    pvector<SteamNetworkingMessage_t *> messages;
+    messages.reserve(channel._num_messages);
+    for (size_t i = 0; i < channel._num_messages; ++i) {
+        Datagram framed;
+        if (compressed) {
+            frame_payload(settings, channel._messages[i].get_data(), channel._messages[i].get_length(), framed);
+        }
+        const Datagram &packed = compressed ? framed : channel._messages[i];
+        SteamNetworkingMessage_t *msg = utils->AllocateMessage(static_cast<int>(packed.get_length()));
+        if (msg == nullptr) {
+            steam_cat.error() << "Failed to allocate a " << packed.get_length()
+                              << "-byte message; tick channel not flushed." << std::endl;
+            for (SteamNetworkingMessage_t *allocated : messages) {
+                allocated->Release();
+            }
+            return -1;
+        }
+        memcpy(msg->m_pData, packed.get_data(), packed.get_length());
+        msg->m_conn = static_cast<HSteamNetConnection>(channel._connection);
+        msg->m_nFlags = channel._send_flags;
+        msg->m_idxLane = static_cast<uint16>(channel._lane);
+        messages.push_back(msg);
+    }
+    SteamNetworkConnectionHandle connection = channel._connection;
+    channel.clear();
+
+    pvector<int64> results(messages.size());
+    _interface->SendMessages(static_cast<int>(messages.size()), messages.data(), results.data());
+
+    int sent = 0;
+    for (int64 result : results) {
+        if (result > 0) {
+            ++sent;
+        }
+        check_backpressure(connection, result);
+    }
+    return sent;
+}
+
+////////////////////////////////////////////////////////////////////
+//     Function: SteamNetworkManager::send_snapshot
+//       Access: Published
+//  Description: Sends a snapshot of the given state to the
+//               connection.  Once the client has acknowledged a
+//               snapshot with ack_snapshot, only the words that
+//               changed since that snapshot are sent; until then the
+//               full state is.  The client rebuilds the state with a
+//               SteamNetworkSnapshotDecoder.  Returns the message
+//               number, which identifies the snapshot in acks, or a
+//               negated EResult on failure.
+////////////////////////////////////////////////////////////////////
+int64_t SteamNetworkManager::send_snapshot(SteamNetworkConnectionHandle connection, const Datagram &state,
+                                           int send_flags, int lane) {
+    // Held across the send, so the history records snapshots to one
+    // connection in the order their message numbers were assigned.
+    std::lock_guard<std::mutex> guard(_snapshots_lock);
+    SnapshotHistory &history = _snapshots[connection];
+
+    Datagram message;
+    if (history._baseline_number > 0) {
+        Datagram delta = SteamNetworkSnapshotDelta::encode(history._baseline, state);
+        message.add_uint8(SteamNetworkSnapshotDelta::K_delta);
+        message.add_int64(history._baseline_number);
+        message.append_data(delta.get_data(), delta.get_length());
+    } else {
+        message.add_uint8(SteamNetworkSnapshotDelta::K_full);
+        message.append_data(state.get_data(), state.get_length());
+    }
+
+    int64_t message_number = send_datagram(connection, message, send_flags, lane);
+    if (message_number > 0) {
+        history._sent.push_back(std::make_pair(message_number, state));
+        while (history._sent.size() > max_snapshot_history) {
+            history._sent.pop_front();
+        }
+    }
+    return message_number;
+}
+
+////////////////////////////////////////////////////////////////////
+//     Function: SteamNetworkManager::ack_snapshot
+//       Access: Published
+//  Description: Records that the client has received the snapshot
+//               with the given message number, making it the
+//               baseline for future deltas.  Returns false if the
+//               snapshot is unknown or older than the current
+//               baseline.
+////////////////////////////////////////////////////////////////////
+bool SteamNetworkManager::ack_snapshot(SteamNetworkConnectionHandle connection, int64_t message_number) {
+    std::lock_guard<std::mutex> guard(_snapshots_lock);
+    pmap<SteamNetworkConnectionHandle, SnapshotHistory>::iterator it = _snapshots.find(connection);
+    if (it == _snapshots.end()) return false;
+
+    SnapshotHistory &history = it->second;
+    if (message_number <= history._baseline_number) return false;
+
+    while (!history._sent.empty() && history._sent.front().first < message_number) {
+        history._sent.pop_front();
+    }
+    if (history._sent.empty() || history._sent.front().first != message_number) {
+        return false;
+    }
+
+    history._baseline_number = message_number;
+    history._baseline = history._sent.front().second;
+    history._sent.pop_front();
+    return true;
+}
+
+////////////////////////////////////////////////////////////////////
+//     Function: SteamNetworkManager::reset_snapshots
+//       Access: Published
+//  Description: Forgets the connection's baseline, so the next
+//               snapshot is sent in full.
+////////////////////////////////////////////////////////////////////
+void SteamNetworkManager::reset_snapshots(SteamNetworkConnectionHandle connection) {
+    std::lock_guard<std::mutex> guard(_snapshots_lock);
+    _snapshots.erase(connection);
+}
+
+////////////////////////////////////////////////////////////////////
+//     Function: SteamNetworkManager::broadcast_datagram
+//       Access: Published
+//  Description: Sends the datagram to every connection in the group
+//               except exclude.  The payload is copied once into a
+//               shared, reference-counted buffer that all of the
+//               outgoing messages point at, and the messages are
+//               submitted with a single SendMessages call.
+//               Connections with compression enabled share a second
+//               buffer holding the framed payload, which is
+//               compressed once with the settings of the first such
+//               connection.  Returns the number of connections the
+//               message was queued for.
+////////////////////////////////////////////////////////////////////
+int SteamNetworkManager::broadcast_datagram(const SteamNetworkConnectionGroup &connections, const Datagram &dg,
+                                            int send_flags, SteamNetworkConnectionHandle exclude, int lane) {
+    if (_interface == nullptr || connections.get_num_connections() == 0) return 0;
+
+    ISteamNetworkingUtils *utils = SteamNetworkingUtils();
+    if (utils == nullptr) {
+        steam_cat.error() << "SteamNetworkingUtils interface not initialised." << std::endl;
+        return 0;
+    }
+
+    // Index 0 is the plain payload, index 1 the framed one; each is
+    // only built once a connection needs it.
+    SharedPayload *payloads[2] = { nullptr, nullptr };
+    int ref_counts[2] = { 0, 0 };
+
+    size_t num_connections = connections.get_num_connections();
+    pvector<SteamNetworkingMessage_t *> messages;
+    pvector<SteamNetworkConnectionHandle> targets;
+    messages.reserve(num_connections);
+    targets.reserve(num_connections);
+    for (size_t i = 0; i < num_connections; ++i) {
+        SteamNetworkConnectionHandle connection = connections.get_connection(i);
+        if (connection == exclude) {
+            continue;
+        }
+
+        CompressionSettings settings;
+        int kind = get_compression(connection, settings) ? 1 : 0;
+        if (payloads[kind] == nullptr) {
+            if (kind == 0) {
+                payloads[kind] = new_shared_payload(dg.get_data(), dg.get_length());
+            } else {
+                Datagram framed;
+                frame_payload(settings, dg.get_data(), dg.get_length(), framed);
+                payloads[kind] = new_shared_payload(framed.get_data(), framed.get_length());
+            }
+            if (payloads[kind] == nullptr) {
+                continue;
+            }
+        }
+
+        SteamNetworkingMessage_t *msg = utils->AllocateMessage(0);
+        if (msg == nullptr) {
+            continue;
+        }
+        msg->m_pData = payloads[kind]->get_data();
+        msg->m_cbSize = static_cast<int>(payloads[kind]->_size);
+        msg->m_pfnFreeData = free_shared_payload;
+        msg->m_conn = static_cast<HSteamNetConnection>(connection);
+        msg->m_nFlags = send_flags;
+        msg->m_idxLane = static_cast<uint16>(lane);
+        messages.push_back(msg);
+        targets.push_back(connection);
+        ++ref_counts[kind];
+    }
+
+    // Every message holds one reference; the last release frees it.
+    for (int kind = 0; kind < 2; ++kind) {
+        if (payloads[kind] == nullptr) {
+            continue;
+        }
+        if (ref_counts[kind] == 0) {
+            payloads[kind]->~SharedPayload();
+            free(payloads[kind]);
+        } else {
+            payloads[kind]->_ref_count.store(ref_counts[kind]);
+        }
+    }
+
+    if (messages.empty()) {
+        return 0;
+    }
+
+    pvector<int64> results(messages.size());
+    _interface->SendMessages(static_cast<int>(messages.size()), messages.data(), results.data());
+
+    int sent = 0;
+    for (size_t i = 0; i < results.size(); ++i) {
+        if (results[i] > 0) {
+            ++sent;
+        }
+        check_backpressure(targets[i], results[i]);
+    }
+    return sent;
+}
+
+////////////////////////////////////////////////////////////////////
+//     Function: SteamNetworkManager::broadcast_datagram
+//       Access: Published
+//  Description: Sends the datagram to every connection currently
+//               assigned to the given poll group, except exclude.
+////////////////////////////////////////////////////////////////////
+int SteamNetworkManager::broadcast_datagram(SteamNetworkPollGroupHandle poll_group, const Datagram &dg,
+                                            int send_flags, SteamNetworkConnectionHandle exclude, int lane) {
+    std::lock_guard<std::mutex> guard(_poll_groups_lock);
+    pmap<SteamNetworkPollGroupHandle, PT(SteamNetworkConnectionGroup)>::const_iterator it = _poll_groups.find(poll_group);
+    if (it == _poll_groups.end()) {
+        steam_cat.error() << "Poll group " << poll_group << " was not created by this manager." << std::endl;
+        return 0;
+    }
+    return broadcast_datagram(*it->second, dg, send_flags, exclude, lane);
+}
+
+////////////////////////////////////////////////////////////////////
+//     Function: SteamNetworkManager::run_callbacks
+//       Access: Published
+//  Description: Pumps the networking callbacks and raises writable
+//               events for connections that have drained below
+//               their low send watermark.  Should be called once
+//               per frame.
+////////////////////////////////////////////////////////////////////
+void SteamNetworkManager::run_callbacks() {
+    if (_interface != nullptr) {
+        _interface->RunCallbacks();
+        update_backpressure();
+    }
+}
+
+////////////////////////////////////////////////////////////////////
+//     Function: SteamNetworkManager::get_next_event
+//       Access: Published
+//  Description: Returns and removes the oldest queued connection
+//               state-change event across all queues, or nullptr if
+//               there are none.
+////////////////////////////////////////////////////////////////////
+PT(SteamNetworkEvent) SteamNetworkManager::get_next_event() {
+    std::lock_guard<std::mutex> guard(_events_lock);
+    if (_num_pending_events == 0) {
+        return nullptr;
+    }
+
+    EventQueue *oldest = nullptr;
+    for (EventQueues::iterator it = _event_queues.begin(); it != _event_queues.end(); ++it) {
+        if (!it->second.empty() &&
+            (oldest == nullptr || it->second.front()._sequence < oldest->front()._sequence)) {
+            oldest = &it->second;
+        }
+    }
+
+    const SteamNetworkEventRecord &record = oldest->front()._record;
+    PT(SteamNetworkEvent) event = new SteamNetworkEvent(
+        record._connection, record._old_state, record._state,
+        record._listen_socket, record._end_reason,
+        static_cast<SteamNetworkEvent::Type>(record._type));
+    oldest->pop_front();
+    --_num_pending_events;
+    return event;
+}
+
+////////////////////////////////////////////////////////////////////
+//     Function: SteamNetworkManager::get_num_pending_events
+//       Access: Published
+//  Description: Returns the number of queued events across all
+//               queues.
+////////////////////////////////////////////////////////////////////
+size_t SteamNetworkManager::get_num_pending_events() const {
+    std::lock_guard<std::mutex> guard(_events_lock);
+    return _num_pending_events;
+}
+
+////////////////////////////////////////////////////////////////////
+//     Function: SteamNetworkManager::drain_events
+//       Access: Published
+//  Description: Removes every queued event, from all listen sockets
+//               and client connections, and returns them in the
+//               order they occurred.
+////////////////////////////////////////////////////////////////////
+PT(SteamNetworkEventBatch) SteamNetworkManager::drain_events() {
+    pvector<QueuedEvent> events;
+    {
+        std::lock_guard<std::mutex> guard(_events_lock);
+        events.reserve(_num_pending_events);
+        for (EventQueues::iterator it = _event_queues.begin(); it != _event_queues.end(); ++it) {
+            events.insert(events.end(), it->second.begin(), it->second.end());
+            it->second.clear();
+        }
+        _num_pending_events = 0;
+    }
+
+    std::sort(events.begin(), events.end(), [](const QueuedEvent &a, const QueuedEvent &b) {
+        return a._sequence < b._sequence;
+    });
+
+    PT(SteamNetworkEventBatch) batch = new SteamNetworkEventBatch;
+    batch->_records.reserve(events.size());
+    for (const QueuedEvent &event : events) {
+        batch->_records.push_back(event._record);
+    }
+    return batch;
+}
+
+////////////////////////////////////////////////////////////////////
+//     Function: SteamNetworkManager::drain_events
+//       Access: Published
+//  Description: Removes and returns only the events for connections
+//               accepted on the given listen socket, leaving all
+//               other queues untouched.
+////////////////////////////////////////////////////////////////////
+PT(SteamNetworkEventBatch) SteamNetworkManager::drain_events(SteamNetworkListenSocketHandle listen_socket) {
+    PT(SteamNetworkEventBatch) batch = new SteamNetworkEventBatch;
+
+    std::lock_guard<std::mutex> guard(_events_lock);
+    EventQueues::iterator it = _event_queues.find(listen_socket);
+    if (it == _event_queues.end()) {
+        return batch;
+    }
+
+    batch->_records.reserve(it->second.size());
+    for (const QueuedEvent &event : it->second) {
+        batch->_records.push_back(event._record);
+    }
+    _num_pending_events -= it->second.size();
+    it->second.clear();
+    return batch;
+}
+
+////////////////////////////////////////////////////////////////////
+//     Function: SteamNetworkManager::drain_client_events
+//       Access: Published
+//  Description: Removes and returns only the events for outgoing
+//               connections made by connect_by_ip_address or
+//               connect_by_steam_id.
+////////////////////////////////////////////////////////////////////
+PT(SteamNetworkEventBatch) SteamNetworkManager::drain_client_events() {
+    return drain_events(INVALID_STEAM_NETWORK_LISTEN_SOCKET_HANDLE);
+}
+
+////////////////////////////////////////////////////////////////////
+//     Function: SteamNetworkManager::queue_event
+//       Access: Private
+//  Description: Appends an event to the queue for its listen socket.
+//               May be called from any thread.
+////////////////////////////////////////////////////////////////////
+void SteamNetworkManager::queue_event(const SteamNetworkEventRecord &record) {
+    std::lock_guard<std::mutex> guard(_events_lock);
+    QueuedEvent event;
+    event._sequence = _next_event_sequence++;
+    event._record = record;
+    _event_queues[record._listen_socket].push_back(event);
+    ++_num_pending_events;
+}
+
+////////////////////////////////////////////////////////////////////
+//     Function: SteamNetworkManager::queue_writable_event
+//       Access: Private
+//  Description: Queues a T_writable or T_unwritable event for the
+//               connection, under the same listen socket as its
+//               state changes.
+////////////////////////////////////////////////////////////////////
+void SteamNetworkManager::queue_writable_event(SteamNetworkConnectionHandle connection, bool writable) {
+    SteamNetConnectionInfo_t native_info;
+    if (_interface == nullptr || !_interface->GetConnectionInfo(connection, &native_info)) {
+        return;
+    }
+
+    SteamNetworkEventRecord record;
+    record._connection = static_cast<uint32_t>(connection);
+    record._listen_socket = static_cast<uint32_t>(native_info.m_hListenSocket);
+    record._old_state = static_cast<int32_t>(native_info.m_eState);
+    record._state = static_cast<int32_t>(native_info.m_eState);
+    record._end_reason = 0;
+    record._type = writable ? SteamNetworkEvent::T_writable : SteamNetworkEvent::T_unwritable;
+    queue_event(record);
+}
+
+////////////////////////////////////////////////////////////////////
+//     Function: SteamNetworkManager::check_backpressure
+//       Access: Private
+//  Description: Called after every send with its result.  Marks the
+//               connection unwritable if it has send watermarks and
+//               the send was refused for lack of buffer space or
+//               left it at or above its high watermark.
+////////////////////////////////////////////////////////////////////
+void SteamNetworkManager::check_backpressure(SteamNetworkConnectionHandle connection, int64_t result) {
+    std::lock_guard<std::mutex> guard(_watermarks_lock);
+    if (_watermarks.empty()) return;
+
+    pmap<SteamNetworkConnectionHandle, SendWatermarks>::iterator it = _watermarks.find(connection);
+    if (it == _watermarks.end() || !it->second._writable) {
+        return;
+    }
+
+    if (result != -k_EResultLimitExceeded) {
+        if (result <= 0) {
+            return;
+        }
+        int64_t pending = get_pending_bytes(connection);
+        if (pending < 0 || static_cast<size_t>(pending) < it->second._high) {
+            return;
+        }
+    }
+
+    it->second._writable = false;
+    queue_writable_event(connection, false);
+}
+
+////////////////////////////////////////////////////////////////////
+//     Function: SteamNetworkManager::update_backpressure
+//       Access: Private
+//  Description: Marks every unwritable connection whose pending
+//               bytes have fallen to its low watermark writable
+//               again.  Called wherever the callbacks are pumped.
+////////////////////////////////////////////////////////////////////
+void SteamNetworkManager::update_backpressure() {
+    std::lock_guard<std::mutex> guard(_watermarks_lock);
+    for (pmap<SteamNetworkConnectionHandle, SendWatermarks>::iterator it = _watermarks.begin();
+         it != _watermarks.end(); ++it) {
+        if (it->second._writable) {
+            continue;
+        }
+        int64_t pending = get_pending_bytes(it->first);
+        if (pending >= 0 && static_cast<size_t>(pending) <= it->second._low) {
+            it->second._writable = true;
+            queue_writable_event(it->first, true);
+        }
+    }
+}
+
+////////////////////////////////////////////////////////////////////
+//     Function: SteamNetworkManager::OnSteamNetConnectionStatusChanged
+//       Access: Public, Static
+//  Description: Static callback invoked by Steam when a connection
+//               changes state.  The owning manager is looked up by
+//               the id in the connection user data, which every
+//               socket and connection created by a manager is tagged
+//               with, and the event is queued on it.  Untagged
+//               connections fall back to the global manager; those
+//               of a manager that has since been destroyed are
+//               ignored.
+//               Connections arriving on a server socket are
+//               accepted or rejected here, before the event is
+//               queued.  A server's accept callback is called with
+//               no lock held, and the manager is looked up again
+//               afterwards, since the callback, or another thread
+//               while this one waited for the GIL, may have
+//               destroyed it.
+////////////////////////////////////////////////////////////////////
+void SteamNetworkManager::OnSteamNetConnectionStatusChanged(SteamNetConnectionStatusChangedCallback_t *pInfo) {
+    int64_t id = pInfo->m_info.m_nUserData;
+
+    SteamNetworkEventRecord record;
+    record._connection = static_cast<uint32_t>(pInfo->m_hConn);
+    record._listen_socket = static_cast<uint32_t>(pInfo->m_info.m_hListenSocket);
+    record._old_state = static_cast<int32_t>(pInfo->m_eOldState);
+    record._state = static_cast<int32_t>(pInfo->m_info.m_eState);
+    record._end_reason = static_cast<int32_t>(pInfo->m_info.m_eEndReason);
+    record._type = SteamNetworkEvent::T_state_changed;
+
+    bool accepted = true;
+    {
+        // Held while the manager is used, so it cannot be destroyed
+        // by another thread in the meantime.
+        std::lock_guard<std::mutex> guard(_instances_lock);
+        SteamNetworkManager *manager = find_instance(id);
+        if (manager == nullptr) return;
+
+        manager->update_connection_table(pInfo);
+        if (!manager->wants_accept_callback(pInfo)) {
+            manager->apply_server_policy(pInfo, accepted, record);
+            manager->queue_event(record);
+            return;
+        }
+    }
+
+    accepted = call_accept_callback(id, pInfo);
+
+    std::lock_guard<std::mutex> guard(_instances_lock);
+    SteamNetworkManager *manager = find_instance(id);
+    if (manager == nullptr) return;
+
+    manager->apply_server_policy(pInfo, accepted, record);
+    manager->queue_event(record);
+}
+
+////////////////////////////////////////////////////////////////////
+//     Function: SteamNetworkManager::find_instance
+//       Access: Private, Static
+//  Description: Returns the live manager with the given id, the
+//               global manager for an untagged id of 0, or nullptr.
+//               The caller must hold _instances_lock.
+////////////////////////////////////////////////////////////////////
+SteamNetworkManager *SteamNetworkManager::find_instance(int64_t id) {
+    if (id <= 0) {
+        return _global_ptr;
+    }
+    pmap<int64_t, SteamNetworkManager *>::const_iterator it = _instances.find(id);
+    if (it == _instances.end()) {
+        return nullptr;
+    }
+    return it->second;
+}
+
+////////////////////////////////////////////////////////////////////
+//     Function: SteamNetworkManager::update_connection_table
+//       Access: Private
+//  Description: Brings the connection's table entry in line with a
+//               status change, adding it on first sight and removing
+//               it once Steam has forgotten the connection.  The
+//               connect time is stamped when the connection first
+//               reaches the Connected state.
+////////////////////////////////////////////////////////////////////
+void SteamNetworkManager::update_connection_table(const SteamNetConnectionStatusChangedCallback_t *info) {
+    SteamNetworkConnectionHandle connection = static_cast<SteamNetworkConnectionHandle>(info->m_hConn);
+    const SteamNetConnectionInfo_t &native_info = info->m_info;
+
+    std::lock_guard<std::mutex> guard(_connections_lock);
+    if (native_info.m_eState == k_ESteamNetworkingConnectionState_None) {
+        _connections.erase(connection);
+        return;
+    }
+
+    SteamNetworkConnectionInfo &entry = _connections[connection];
+    entry.set_connection(connection);
+    entry.set_listen_socket(static_cast<SteamNetworkListenSocketHandle>(native_info.m_hListenSocket));
+    entry.set_state(native_info.m_eState);
+    entry.set_end_reason(native_info.m_eEndReason);
+    entry.set_remote_steam_id(native_info.m_identityRemote.GetSteamID64());
+
+    NetAddress address;
+    ip_addr_to_net_address(native_info.m_addrRemote, address);
+    entry.set_net_address(address);
+
+    if (native_info.m_eState == k_ESteamNetworkingConnectionState_Connected && entry.get_connect_time() == 0.0) {
+        entry.set_connect_time(get_local_time());
+    }
+}
+
+////////////////////////////////////////////////////////////////////
+//     Function: SteamNetworkManager::add_connection_entry
+//       Access: Private
+//  Description: Adds a table entry for a connection that was created
+//               already connected, and so never passes through the
+//               status callback on its way up.
+////////////////////////////////////////////////////////////////////
+void SteamNetworkManager::add_connection_entry(SteamNetworkConnectionHandle connection) {
+    SteamNetConnectionInfo_t native_info;
+    if (_interface == nullptr || !_interface->GetConnectionInfo(connection, &native_info)) {
+        return;
+    }
+
+    SteamNetConnectionStatusChangedCallback_t info;
+    info.m_hConn = connection;
+    info.m_info = native_info;
+    info.m_info.m_eState = k_ESteamNetworkingConnectionState_Connected;
+    info.m_eOldState = k_ESteamNetworkingConnectionState_None;
+    update_connection_table(&info);
+}
+
+////////////////////////////////////////////////////////////////////
+//     Function: SteamNetworkManager::create_server
+//       Access: Private
+//  Description: Creates the listen socket for create_ip_server or
+//               create_steam_id_server and registers its accept
+//               policy.  _servers_lock is held from before the
+//               socket exists until the policy is in place, so the
+//               status callback, which takes it to look the policy
+//               up, cannot see a connection on the socket without
+//               its policy, even while a service or shard thread
+//               pumps the callbacks.
+////////////////////////////////////////////////////////////////////
+SteamNetworkListenSocketHandle SteamNetworkManager::create_server(int port, bool steam_id,
+                                                                  SteamNetworkPollGroupHandle poll_group, int max_clients,
+                                                                  PyObject *accept_callback) {
+    if (accept_callback != nullptr && accept_callback != Py_None && !PyCallable_Check(accept_callback)) {
+        PyErr_SetString(PyExc_TypeError, "accept_callback must be callable");
+        return INVALID_STEAM_NETWORK_LISTEN_SOCKET_HANDLE;
+    }
+
+    if (poll_group != INVALID_STEAM_NETWORK_POLL_GROUP_HANDLE && get_poll_group_connections(poll_group) == nullptr) {
+        steam_cat.error() << "Poll group " << poll_group << " was not created by this manager." << std::endl;
+        return INVALID_STEAM_NETWORK_LISTEN_SOCKET_HANDLE;
+    }
+
+    std::lock_guard<std::mutex> guard(_servers_lock);
+    SteamNetworkListenSocketHandle listen_socket = steam_id ? create_steam_id_socket(port) : create_ip_socket(port);
+    if (listen_socket == INVALID_STEAM_NETWORK_LISTEN_SOCKET_HANDLE) {
+        return INVALID_STEAM_NETWORK_LISTEN_SOCKET_HANDLE;
+    }
+
+    ServerPolicy policy;
+    policy._poll_group = poll_group;
+    policy._max_clients = std::max(max_clients, 0);
+    policy._accept_callback = nullptr;
+    if (accept_callback != nullptr && accept_callback != Py_None) {
+        Py_INCREF(accept_callback);
+        policy._accept_callback = accept_callback;
+    }
+    _servers[listen_socket] = policy;
+    return listen_socket;
+}
+
+////////////////////////////////////////////////////////////////////
+//     Function: SteamNetworkManager::wants_accept_callback
+//       Access: Private
+//  Description: Returns true if the connection is new, arrived on a
+//               server socket with an accept callback, and would be
+//               accepted, so the callback must be asked first.
+////////////////////////////////////////////////////////////////////
+bool SteamNetworkManager::wants_accept_callback(const SteamNetConnectionStatusChangedCallback_t *info) const {
+    if (info->m_info.m_eState != k_ESteamNetworkingConnectionState_Connecting ||
+        info->m_eOldState != k_ESteamNetworkingConnectionState_None) {
+        return false;
+    }
+
+    std::lock_guard<std::mutex> guard(_servers_lock);
+    SteamNetworkListenSocketHandle listen_socket = static_cast<SteamNetworkListenSocketHandle>(info->m_info.m_hListenSocket);
+    pmap<SteamNetworkListenSocketHandle, ServerPolicy>::const_iterator it = _servers.find(listen_socket);
+    if (it == _servers.end() || it->second._accept_callback == nullptr) {
+        return false;
+    }
+
+    // A full server is refused without calling into Python.
+    const ServerPolicy &policy = it->second;
+    return policy._max_clients == 0 || policy._clients.size() < static_cast<size_t>(policy._max_clients);
+}
+
+////////////////////////////////////////////////////////////////////
+//     Function: SteamNetworkManager::apply_server_policy
+//       Access: Private
+//  Description: Called from the status callback.  If the connection
+//               is new and arrived on a server socket, accepts it
+//               and assigns it to the server's poll group, or closes
+//               it if the server is full or accepted is false, and
+//               turns record into the matching T_accepted or
+//               T_rejected event.  Otherwise only notes connections
+//               of server sockets that have dropped.
+////////////////////////////////////////////////////////////////////
+void SteamNetworkManager::apply_server_policy(const SteamNetConnectionStatusChangedCallback_t *info, bool accepted,
+                                              SteamNetworkEventRecord &record) {
+    SteamNetworkListenSocketHandle listen_socket = static_cast<SteamNetworkListenSocketHandle>(info->m_info.m_hListenSocket);
+    if (listen_socket == INVALID_STEAM_NETWORK_LISTEN_SOCKET_HANDLE) {
+        return;
+    }
+    SteamNetworkConnectionHandle connection = static_cast<SteamNetworkConnectionHandle>(info->m_hConn);
+    ESteamNetworkingConnectionState state = info->m_info.m_eState;
+
+    SteamNetworkPollGroupHandle poll_group = INVALID_STEAM_NETWORK_POLL_GROUP_HANDLE;
+    {
+        std::lock_guard<std::mutex> guard(_servers_lock);
+        pmap<SteamNetworkListenSocketHandle, ServerPolicy>::iterator it = _servers.find(listen_socket);
+        if (it == _servers.end()) {
+            // Not a server socket, or closed by the accept callback.
+            return;
+        }
+        ServerPolicy &policy = it->second;
+
+        if (state != k_ESteamNetworkingConnectionState_Connecting ||
+            info->m_eOldState != k_ESteamNetworkingConnectionState_None) {
+            if (state != k_ESteamNetworkingConnectionState_FindingRoute &&
+                state != k_ESteamNetworkingConnectionState_Connected) {
+                policy._clients.erase(connection);
+            }
+            return;
+        }
+
+        // Checked even after the accept callback, which ran unlocked.
+        if (policy._max_clients > 0 && policy._clients.size() >= static_cast<size_t>(policy._max_clients)) {
+            reject_connection(connection, "Server is full", record);
+            return;
+        }
+        if (!accepted) {
+            reject_connection(connection, "Rejected by server", record);
+            return;
+        }
+        policy._clients.insert(connection);
+        poll_group = policy._poll_group;
+    }
+
+    if (_interface->AcceptConnection(connection) != k_EResultOK) {
+        // The peer gave up already; its state change follows.
+        std::lock_guard<std::mutex> guard(_servers_lock);
+        pmap<SteamNetworkListenSocketHandle, ServerPolicy>::iterator it = _servers.find(listen_socket);
+        if (it != _servers.end()) {
+            it->second._clients.erase(connection);
+        }
+        return;
+    }
+    if (poll_group != INVALID_STEAM_NETWORK_POLL_GROUP_HANDLE) {
+        set_connection_poll_group(connection, poll_group);
+    }
+    record._type = SteamNetworkEvent::T_accepted;
+}
+
+////////////////////////////////////////////////////////////////////
+//     Function: SteamNetworkManager::call_accept_callback
+//       Access: Private, Static
+//  Description: Asks the accept callback of the server socket the
+//               connection arrived on whether to accept it.  Takes
+//               the GIL, since the status callback may be running on
+//               the service or shard threads, and only then looks
+//               the manager up by id, briefly, to take a reference
+//               to the callback; the callback itself runs with no
+//               lock held, so it may create or destroy managers.  A
+//               callback that raises refuses the connection.
+////////////////////////////////////////////////////////////////////
+bool SteamNetworkManager::call_accept_callback(int64_t id, const SteamNetConnectionStatusChangedCallback_t *info) {
+    SteamNetworkListenSocketHandle listen_socket = static_cast<SteamNetworkListenSocketHandle>(info->m_info.m_hListenSocket);
+    PyGILState_STATE gil_state = PyGILState_Ensure();
+
+    PyObject *callback = nullptr;
+    {
+        std::lock_guard<std::mutex> guard(_instances_lock);
+        SteamNetworkManager *manager = find_instance(id);
+        if (manager != nullptr) {
+            std::lock_guard<std::mutex> servers_guard(manager->_servers_lock);
+            pmap<SteamNetworkListenSocketHandle, ServerPolicy>::iterator it = manager->_servers.find(listen_socket);
+            if (it != manager->_servers.end()) {
+                callback = it->second._accept_callback;
+                Py_XINCREF(callback);
+            }
+        }
+    }
+
+    bool accepted = true;
+    if (callback != nullptr) {
+        char address[SteamNetworkingIPAddr::k_cchMaxString] = "";
+        if (!info->m_info.m_addrRemote.IsIPv6AllZeros()) {
+            info->m_info.m_addrRemote.ToString(address, sizeof(address), true);
+        }
+
+        PyObject *dict = PyDict_New();
+        PyObject *val;
+        val = PyLong_FromUnsignedLong(static_cast<unsigned long>(info->m_hConn));
+        PyDict_SetItemString(dict, "connection", val);
+        Py_DECREF(val);
+        val = PyLong_FromUnsignedLong(static_cast<unsigned long>(listen_socket));
+        PyDict_SetItemString(dict, "listen_socket", val);
+        Py_DECREF(val);
+        val = PyLong_FromUnsignedLongLong(info->m_info.m_identityRemote.GetSteamID64());
+        PyDict_SetItemString(dict, "remote_steam_id", val);
+        Py_DECREF(val);
+        val = PyUnicode_FromString(address);
+        PyDict_SetItemString(dict, "address", val);
+        Py_DECREF(val);
+
+        PyObject *ret = PyObject_CallFunctionObjArgs(callback, dict, NULL);
+        if (ret == nullptr) {
+            PyErr_Print();
+            accepted = false;
+        } else {
+            int result = PyObject_IsTrue(ret);
+            if (result < 0) {
+                PyErr_Print();
+            }
+            accepted = (result > 0);
+            Py_DECREF(ret);
+        }
+        Py_DECREF(dict);
+        Py_DECREF(callback);
+    }
+
+    PyGILState_Release(gil_state);
+    return accepted;
+}
+
+////////////////////////////////////////////////////////////////////
+//     Function: SteamNetworkManager::reject_connection
+//       Access: Private
+//  Description: Closes a connection a server socket refused and
+//               turns record into its T_rejected event.
+////////////////////////////////////////////////////////////////////
+void SteamNetworkManager::reject_connection(SteamNetworkConnectionHandle connection, const char *reason,
+                                            SteamNetworkEventRecord &record) {
+    _interface->CloseConnection(connection, k_ESteamNetConnectionEnd_App_Generic, reason, false);
+    {
+        std::lock_guard<std::mutex> guard(_connections_lock);
+        _connections.erase(connection);
+    }
+    record._state = k_ESteamNetworkingConnectionState_None;
+    record._end_reason = k_ESteamNetConnectionEnd_App_Generic;
+    record._type = SteamNetworkEvent::T_rejected;
+}
+
+////////////////////////////////////////////////////////////////////
+//     Function: SteamNetworkManager::read_message
+//       Access: Private
+//  Description: Fills in a SteamNetworkMessage from a received
+//               Steam message, which receive_on_connection or
+//               receive_on_poll_group has already unframed.
+////////////////////////////////////////////////////////////////////
+void SteamNetworkManager::read_message(SteamNetworkingMessage_t *msg, SteamNetworkMessage &message) {
+    message.set_connection(static_cast<SteamNetworkConnectionHandle>(msg->m_conn));
+    message.set_lane(msg->m_idxLane);
+    message.set_message_number(msg->m_nMessageNumber);
+    message.set_remote_steam_id(msg->m_identityPeer.GetSteamID64());
+    message.set_channel(0);
+    message.assign_data(msg->m_pData, static_cast<size_t>(msg->m_cbSize));
+}
+
+////////////////////////////////////////////////////////////////////
+//     Function: SteamNetworkManager::receive_on_connection
+//       Access: Private
+//  Description: Receives up to max_messages messages on the
+//               connection, with the compression framing removed.
+//               Every receive path goes through here or
+//               receive_on_poll_group.  Returns the number of
+//               messages received.
+////////////////////////////////////////////////////////////////////
+int SteamNetworkManager::receive_on_connection(SteamNetworkConnectionHandle connection,
+                                               SteamNetworkingMessage_t **messages, int max_messages) {
+    int count = _interface->ReceiveMessagesOnConnection(connection, messages, max_messages);
+    for (int i = 0; i < count; ++i) {
+        messages[i] = unframe_message(messages[i]);
+    }
+    return std::max(count, 0);
+}
+
+////////////////////////////////////////////////////////////////////
+//     Function: SteamNetworkManager::receive_on_poll_group
+//       Access: Private
+//  Description: Receives up to max_messages messages on the poll
+//               group, with the compression framing removed.
+//               Returns the number of messages received.
+////////////////////////////////////////////////////////////////////
+int SteamNetworkManager::receive_on_poll_group(SteamNetworkPollGroupHandle poll_group,
+                                               SteamNetworkingMessage_t **messages, int max_messages) {
+    int count = _interface->ReceiveMessagesOnPollGroup(poll_group, messages, max_messages);
+    for (int i = 0; i < count; ++i) {
+        messages[i] = unframe_message(messages[i]);
+    }
+    return std::max(count, 0);
+}
+
+////////////////////////////////////////////////////////////////////
+//     Function: SteamNetworkManager::get_compression
+//       Access: Private
+//  Description: Copies the connection's compression settings into
+//               settings.  Returns false if the connection does not
+//               use compression.
+////////////////////////////////////////////////////////////////////
+bool SteamNetworkManager::get_compression(SteamNetworkConnectionHandle connection, CompressionSettings &settings) const {
+    std::lock_guard<std::mutex> guard(_compression_lock);
+    if (_compression.empty()) {
+        return false;
+    }
+    pmap<SteamNetworkConnectionHandle, CompressionSettings>::const_iterator it = _compression.find(connection);
+    if (it == _compression.end()) {
+        return false;
+    }
+    settings = it->second;
+    return true;
+}
+
+////////////////////////////////////////////////////////////////////
+//     Function: SteamNetworkManager::frame_payload
+//       Access: Private
+//  Description: Appends the payload to framed behind a compression
+//               header, compressing it first if it is at least the
+//               threshold size and zlib makes it smaller.
+////////////////////////////////////////////////////////////////////
+void SteamNetworkManager::frame_payload(const CompressionSettings &settings, const void *data, size_t length,
+                                        Datagram &framed) {
+#ifdef HAVE_ZLIB
+    if (length >= settings._threshold) {
+        std::chrono::steady_clock::time_point start = std::chrono::steady_clock::now();
+        std::string packed = compress_string(std::string(static_cast<const char *>(data), length), settings._level);
+        double elapsed = std::chrono::duration<double>(std::chrono::steady_clock::now() - start).count();
+
+        std::lock_guard<std::mutex> guard(_compression_lock);
+        _compression_stats._compress_time += elapsed;
+        if (!packed.empty() && packed.size() < length) {
+            framed.add_uint8(CH_zlib);
+            framed.append_data(packed.data(), packed.size());
+            _compression_stats._bytes_in += length;
+            _compression_stats._bytes_out += packed.size();
+            ++_compression_stats._num_compressed;
+            return;
+        }
+    }
+#endif
+
+    framed.add_uint8(CH_raw);
+    if (length > 0) {
+        framed.append_data(data, length);
+    }
+    std::lock_guard<std::mutex> guard(_compression_lock);
+    ++_compression_stats._num_uncompressed;
+}
+
+////////////////////////////////////////////////////////////////////
+//     Function: SteamNetworkManager::frame_message
+//       Access: Private
+//  Description: Returns an outgoing Steam message ready to be
+//               passed to SendMessages.  On a connection with
+//               compression enabled, that is a framed copy, and msg
+//               is released; otherwise it is msg itself.  Returns
+//               nullptr, having released msg, if the copy could not
+//               be allocated.
+////////////////////////////////////////////////////////////////////
+SteamNetworkingMessage_t *SteamNetworkManager::frame_message(SteamNetworkingMessage_t *msg) {
+    CompressionSettings settings;
+    if (!get_compression(static_cast<SteamNetworkConnectionHandle>(msg->m_conn), settings)) {
+        return msg;
+    }
+
+    Datagram framed;
+    frame_payload(settings, msg->m_pData, static_cast<size_t>(msg->m_cbSize), framed);
+
+    ISteamNetworkingUtils *utils = SteamNetworkingUtils();
+    SteamNetworkingMessage_t *copy = utils != nullptr ? utils->AllocateMessage(static_cast<int>(framed.get_length())) : nullptr;
+    if (copy != nullptr) {
+        memcpy(copy->m_pData, framed.get_data(), framed.get_length());
+        copy->m_conn = msg->m_conn;
+        copy->m_nFlags = msg->m_nFlags;
+        copy->m_idxLane = msg->m_idxLane;
+        copy->m_nUserData = msg->m_nUserData;
+    }
+    msg->Release();
+    return copy;
+}
+
+////////////////////////////////////////////////////////////////////
+//     Function: SteamNetworkManager::unframe_message
+//       Access: Private
+//  Description: Removes the compression framing from a message
+//               received on a connection with compression enabled,
+//               returning the message to hand out in its place.  An
+//               uncompressed payload is shifted down in place; a
+//               compressed one is inflated into a new Steam message
+//               carrying the same metadata, and msg is released.  A
+//               malformed payload is logged and left empty.
+////////////////////////////////////////////////////////////////////
+SteamNetworkingMessage_t *SteamNetworkManager::unframe_message(SteamNetworkingMessage_t *msg) {
+    SteamNetworkConnectionHandle connection = static_cast<SteamNetworkConnectionHandle>(msg->m_conn);
+    CompressionSettings settings;
+    if (!get_compression(connection, settings)) {
+        return msg;
+    }
+
+    unsigned char *data = static_cast<unsigned char *>(msg->m_pData);
+    size_t length = static_cast<size_t>(msg->m_cbSize);
+    if (length >= 1 && data[0] == CH_raw) {
+        memmove(data, data + 1, length - 1);
+        msg->m_cbSize = static_cast<int>(length - 1);
+        return msg;
+    }
+
+#ifdef HAVE_ZLIB
+    if (length >= 1 && data[0] == CH_zlib) {
+        std::chrono::steady_clock::time_point start = std::chrono::steady_clock::now();
+        std::string unpacked = decompress_string(std::string(reinterpret_cast<const char *>(data + 1), length - 1));
+        double elapsed = std::chrono::duration<double>(std::chrono::steady_clock::now() - start).count();
+        {
+            std::lock_guard<std::mutex> guard(_compression_lock);
+            _compression_stats._decompress_time += elapsed;
+            ++_compression_stats._num_decompressed;
+        }
+
+        ISteamNetworkingUtils *utils = SteamNetworkingUtils();
+        SteamNetworkingMessage_t *copy = nullptr;
+        if (!unpacked.empty() && utils != nullptr) {
+            copy = utils->AllocateMessage(static_cast<int>(unpacked.size()));
+        }
+        if (copy != nullptr) {
+            memcpy(copy->m_pData, unpacked.data(), unpacked.size());
+            copy->m_conn = msg->m_conn;
+            copy->m_identityPeer = msg->m_identityPeer;
+            copy->m_nConnUserData = msg->m_nConnUserData;
+            copy->m_usecTimeReceived = msg->m_usecTimeReceived;
+            copy->m_nMessageNumber = msg->m_nMessageNumber;
+            copy->m_nChannel = msg->m_nChannel;
+            copy->m_nFlags = msg->m_nFlags;
+            copy->m_nUserData = msg->m_nUserData;
+            copy->m_idxLane = msg->m_idxLane;
+            msg->Release();
+            return copy;
+        }
+    }
+#endif
+
+    steam_cat.error() << "Dropping malformed compressed message on connection " << connection << "." << std::endl;
+    msg->m_cbSize = 0;
+    return msg;
+}
+
+////////////////////////////////////////////////////////////////////
+//     Function: SteamNetworkManager::get_connection_options
+//       Access: Private
+//  Description: Fills in the num_connection_options config values
+//               applied to every listen socket and connection this
+//               manager creates: the status callback, and this
+//               manager's id as the connection user data so the
+//               callback can route events back to it.
+//               Connections accepted on a listen socket inherit
+//               both values.
+////////////////////////////////////////////////////////////////////
+void SteamNetworkManager::get_connection_options(SteamNetworkingConfigValue_t *options) const {
+    options[0].SetPtr(k_ESteamNetworkingConfig_Callback_ConnectionStatusChanged, (void *)OnSteamNetConnectionStatusChanged);
+    options[1].SetInt64(k_ESteamNetworkingConfig_ConnectionUserData, _id);
+}
+
+////////////////////////////////////////////////////////////////////
+//     Function: SteamNetworkManager::apply_connection_options
+//       Access: Private
+//  Description: Applies the options from get_connection_options to
+//               a connection that was created without them.
+////////////////////////////////////////////////////////////////////
+void SteamNetworkManager::apply_connection_options(SteamNetworkConnectionHandle connection) const {
+    ISteamNetworkingUtils *utils = SteamNetworkingUtils();
+    if (utils == nullptr) {
+        steam_cat.error() << "SteamNetworkingUtils interface not initialised." << std::endl;
+        return;
+    }
+
+    SteamNetworkingConfigValue_t opts[num_connection_options];
+    get_connection_options(opts);
+    for (int i = 0; i < num_connection_options; ++i) {
+        utils->SetConfigValue(opts[i].m_eValue, k_ESteamNetworkingConfig_Connection,
+                              static_cast<intptr_t>(connection), opts[i].m_eDataType, &opts[i].m_val);
+    }
+}
+
+////////////////////////////////////////////////////////////////////
+//     Function: SteamNetworkManager::start_service_thread
+//       Access: Published
+//  Description: Starts a background thread that pumps the
+//               networking callbacks and drains every service poll
+//               group into a lock-free queue every interval seconds,
+//               independently of the frame rate.  Connection events
+//               are still read with get_next_event(), and messages
+//               with drain_service_messages().  queue_size bounds the
+//               number of messages held between drains; when it
+//               fills up, the remaining messages wait inside Steam.
+//               Returns false if the thread is already running.
+////////////////////////////////////////////////////////////////////
+bool SteamNetworkManager::start_service_thread(double interval, int queue_size) {
+    if (_interface == nullptr) {
+        steam_cat.error() << "SteamNetworkingSockets interface not initialised." << std::endl;
+        return false;
+    }
+    if (_service_running.load()) {
+        steam_cat.warning() << "Service thread is already running." << std::endl;
+        return false;
+    }
+
+    _service_interval = std::max(interval, 0.0);
+    _service_queue = new SteamNetworkRing<SteamNetworkingMessage_t *>(std::max(queue_size, 1));
+    _service_running.store(true);
+    _service_thread = std::thread(&SteamNetworkManager::service_thread_main, this);
+    return true;
+}
+
+////////////////////////////////////////////////////////////////////
+//     Function: SteamNetworkManager::stop_service_thread
+//       Access: Published
+//  Description: Stops the service thread and waits for it to exit,
+//               with the GIL released, since the thread may be
+//               running a server socket's accept callback.  Messages
+//               that were queued but not yet drained are released.
+////////////////////////////////////////////////////////////////////
+void SteamNetworkManager::stop_service_thread() {
+    if (!_service_running.exchange(false)) {
+        return;
+    }
+    _service_thread.join();
+
+    SteamNetworkingMessage_t *msg = nullptr;
+    while (_service_queue->pop(msg)) {
+        msg->Release();
+    }
+    delete _service_queue;
+    _service_queue = nullptr;
+}
+
+////////////////////////////////////////////////////////////////////
+//     Function: SteamNetworkManager::is_service_thread_running
+//       Access: Published
+////////////////////////////////////////////////////////////////////
+bool SteamNetworkManager::is_service_thread_running() const {
+    return _service_running.load();
+}
+
+////////////////////////////////////////////////////////////////////
+//     Function: SteamNetworkManager::add_service_poll_group
+//       Access: Published
+//  Description: Adds a poll group to the set drained by the service
+//               thread.  May be called while the thread is running.
+////////////////////////////////////////////////////////////////////
+void SteamNetworkManager::add_service_poll_group(SteamNetworkPollGroupHandle poll_group) {
+    std::lock_guard<std::mutex> guard(_service_lock);
+    if (std::find(_service_poll_groups.begin(), _service_poll_groups.end(), poll_group) == _service_poll_groups.end()) {
+        _service_poll_groups.push_back(poll_group);
+    }
+}
+
+////////////////////////////////////////////////////////////////////
+//     Function: SteamNetworkManager::remove_service_poll_group
+//       Access: Published
+//  Description: Stops the service thread from draining the given
+//               poll group.
+////////////////////////////////////////////////////////////////////
+void SteamNetworkManager::remove_service_poll_group(SteamNetworkPollGroupHandle poll_group) {
+    std::lock_guard<std::mutex> guard(_service_lock);
+    _service_poll_groups.erase(
+        std::remove(_service_poll_groups.begin(), _service_poll_groups.end(), poll_group),
+        _service_poll_groups.end());
+}
+
+////////////////////////////////////////////////////////////////////
+//     Function: SteamNetworkManager::drain_service_messages
+//       Access: Published
+//  Description: Moves up to max_messages messages collected by the
+//               service thread into a batch.  Must be called from a
+//               single thread, normally the main thread.  The batch
+//               is empty if the thread is not running.
+////////////////////////////////////////////////////////////////////
+PT(SteamNetworkMessageBatch) SteamNetworkManager::drain_service_messages(int max_messages) {
+    PT(SteamNetworkMessageBatch) batch = new SteamNetworkMessageBatch;
+    if (_service_queue == nullptr || max_messages <= 0) return batch;
+
+    size_t available = std::min(_service_queue->get_size(), static_cast<size_t>(max_messages));
+    batch->_messages.reserve(available);
+
+    SteamNetworkingMessage_t *msg = nullptr;
+    while (batch->_messages.size() < static_cast<size_t>(max_messages) && _service_queue->pop(msg)) {
+        batch->_messages.push_back(msg);
+    }
+    return batch;
+}
+
+////////////////////////////////////////////////////////////////////
+//     Function: SteamNetworkManager::service_thread_main
+//       Access: Private
+//  Description: Body of the service thread.  Only touches Python
+//               through a server socket's accept callback, which
+//               takes the GIL.
+////////////////////////////////////////////////////////////////////
+void SteamNetworkManager::service_thread_main() {
+    pvector<SteamNetworkPollGroupHandle> poll_groups;
+    std::chrono::microseconds interval(static_cast<long long>(_service_interval * 1000000.0));
+
+    while (_service_running.load(std::memory_order_acquire)) {
+        _interface->RunCallbacks();
+        update_backpressure();
+
+        {
+            std::lock_guard<std::mutex> guard(_service_lock);
+            poll_groups = _service_poll_groups;
+        }
+
+        for (SteamNetworkPollGroupHandle poll_group : poll_groups) {
+            receive_into_ring(poll_group, *_service_queue);
+        }
+
+        std::this_thread::sleep_for(interval);
+    }
+}
+
+////////////////////////////////////////////////////////////////////
+//     Function: SteamNetworkManager::receive_into_ring
+//       Access: Private
+//  Description: Moves as many messages from the poll group into the
+//               queue as it has room for.  Returns the number moved.
+//               Must only be called from the queue's producer thread.
+////////////////////////////////////////////////////////////////////
+int SteamNetworkManager::receive_into_ring(SteamNetworkPollGroupHandle poll_group,
+                                           SteamNetworkRing<SteamNetworkingMessage_t *> &queue) {
+    static const int max_batch = 256;
+    SteamNetworkingMessage_t *messages[max_batch];
+
+    int total = 0;
+    while (true) {
+        size_t space = queue.get_capacity() - queue.get_size();
+        int wanted = static_cast<int>(std::min(space, static_cast<size_t>(max_batch)));
+        if (wanted <= 0) {
+            break;
+        }
+
+        int count = receive_on_poll_group(poll_group, messages, wanted);
+        for (int i = 0; i < count; ++i) {
+            queue.push(messages[i]);
+        }
+        total += std::max(count, 0);
+        if (count < wanted) {
+            break;
+        }
+    }
+    return total;
+}
+
+////////////////////////////////////////////////////////////////////
+//     Function: SteamNetworkManager::start_shard_threads
+//       Access: Published
+//  Description: Creates num_shards poll groups, each drained by its
+//               own worker thread into its own lock-free queue every
+//               interval seconds.  Connections are spread over the
+//               shards with assign_connection_to_shard, and each
+//               shard's messages are read with drain_shard_messages,
+//               so a server can hand every shard to a different
+//               consumer thread.  The first worker also pumps the
+//               networking callbacks.  queue_size bounds the number
+//               of messages each shard holds between drains.
+//               Returns false if the shards are already running.
+////////////////////////////////////////////////////////////////////
+bool SteamNetworkManager::start_shard_threads(int num_shards, double interval, int queue_size) {
+    if (_interface == nullptr) {
+        steam_cat.error() << "SteamNetworkingSockets interface not initialised." << std::endl;
+        return false;
+    }
+    if (_shards_running.load()) {
+        steam_cat.warning() << "Shard threads are already running." << std::endl;
+        return false;
+    }
+    nassertr(num_shards > 0, false);
+
+    pvector<PT(ServiceShard)> shards;
+    for (int i = 0; i < num_shards; ++i) {
+        SteamNetworkPollGroupHandle poll_group = create_poll_group();
+        if (poll_group == INVALID_STEAM_NETWORK_POLL_GROUP_HANDLE) {
+            steam_cat.error() << "Failed to create poll group for shard " << i << "." << std::endl;
+            for (ServiceShard *shard : shards) {
+                destroy_poll_group(shard->_poll_group);
+            }
+            return false;
+        }
+        shards.push_back(new ServiceShard(poll_group, static_cast<size_t>(std::max(queue_size, 1))));
+    }
+
+    _shard_interval = std::max(interval, 0.0);
+    _next_shard.store(0);
+    _shards_running.store(true);
+    for (size_t i = 0; i < shards.size(); ++i) {
+        shards[i]->_thread = std::thread(&SteamNetworkManager::shard_thread_main, this, shards[i].p(), i == 0);
+    }
+
+    std::lock_guard<std::mutex> guard(_shards_lock);
+    _shards.swap(shards);
+    return true;
+}
+
+////////////////////////////////////////////////////////////////////
+//     Function: SteamNetworkManager::stop_shard_threads
+//       Access: Published
+//  Description: Stops the shard threads and waits for them to exit,
+//               then destroys the shard poll groups; connections
+//               assigned to them are left without a poll group.
+//               Threads waiting in wait_for_shard_messages wake up
+//               and return.  Messages that were queued but not yet
+//               drained are released once no thread is waiting on
+//               or draining their shard.  The GIL is released while
+//               waiting, as for stop_service_thread.
+////////////////////////////////////////////////////////////////////
+void SteamNetworkManager::stop_shard_threads() {
+    if (!_shards_running.exchange(false)) {
+        return;
+    }
+
+    pvector<PT(ServiceShard)> shards;
+    {
+        std::lock_guard<std::mutex> guard(_shards_lock);
+        _shards.swap(shards);
+    }
+
+    for (ServiceShard *shard : shards) {
+        {
+            std::lock_guard<std::mutex> guard(shard->_wait_lock);
+            shard->_stopped = true;
+        }
+        shard->_wait_cvar.notify_all();
+        shard->_thread.join();
+        destroy_poll_group(shard->_poll_group);
+    }
+}
+
+////////////////////////////////////////////////////////////////////
+//     Function: SteamNetworkManager::get_num_shards
+//       Access: Published
+//  Description: Returns the number of running shards, or 0.
+////////////////////////////////////////////////////////////////////
+int SteamNetworkManager::get_num_shards() const {
+    std::lock_guard<std::mutex> guard(_shards_lock);
+    return static_cast<int>(_shards.size());
+}
+
+////////////////////////////////////////////////////////////////////
+//     Function: SteamNetworkManager::get_shard_poll_group
+//       Access: Published
+//  Description: Returns the poll group drained by the given shard.
+////////////////////////////////////////////////////////////////////
+SteamNetworkPollGroupHandle SteamNetworkManager::get_shard_poll_group(int shard) const {
+    PT(ServiceShard) service_shard = get_shard(shard);
+    nassertr(service_shard != nullptr, INVALID_STEAM_NETWORK_POLL_GROUP_HANDLE);
+    return service_shard->_poll_group;
+}
+
+////////////////////////////////////////////////////////////////////
+//     Function: SteamNetworkManager::assign_connection_to_shard
+//       Access: Published
+//  Description: Moves the connection into the next shard in
+//               round-robin order.  Returns the shard index, or -1
+//               if the shards are not running.
+////////////////////////////////////////////////////////////////////
+int SteamNetworkManager::assign_connection_to_shard(SteamNetworkConnectionHandle connection) {
+    return assign_shard(connection, _next_shard.fetch_add(1));
+}
+
+////////////////////////////////////////////////////////////////////
+//     Function: SteamNetworkManager::assign_connection_to_shard
+//       Access: Published
+//  Description: Moves the connection into the shard selected by
+//               hashing key, so connections with the same key, such
+//               as the players of one match, always land on the same
+//               shard.  Returns the shard index, or -1 if the shards
+//               are not running.
+////////////////////////////////////////////////////////////////////
+int SteamNetworkManager::assign_connection_to_shard(SteamNetworkConnectionHandle connection, uint64_t key) {
+    // splitmix64 finaliser, so sequential keys spread evenly.
+    key ^= key >> 30;
+    key *= 0xbf58476d1ce4e5b9ULL;
+    key ^= key >> 27;
+    key *= 0x94d049bb133111ebULL;
+    key ^= key >> 31;
+
+    return assign_shard(connection, key);
+}
+
+////////////////////////////////////////////////////////////////////
+//     Function: SteamNetworkManager::get_connection_shard
+//       Access: Published
+//  Description: Returns the shard the connection is assigned to, or
+//               -1 if it is not in any shard.
+////////////////////////////////////////////////////////////////////
+int SteamNetworkManager::get_connection_shard(SteamNetworkConnectionHandle connection) const {
+    SteamNetworkPollGroupHandle poll_group;
+    {
+        std::lock_guard<std::mutex> guard(_poll_groups_lock);
+        pmap<SteamNetworkConnectionHandle, SteamNetworkPollGroupHandle>::const_iterator it = _connection_poll_groups.find(connection);
+        if (it == _connection_poll_groups.end()) {
+            return -1;
+        }
+        poll_group = it->second;
+    }
+
+    std::lock_guard<std::mutex> guard(_shards_lock);
+    for (size_t i = 0; i < _shards.size(); ++i) {
+        if (_shards[i]->_poll_group == poll_group) {
+            return static_cast<int>(i);
+        }
+    }
+    return -1;
+}
+
+////////////////////////////////////////////////////////////////////
+//     Function: SteamNetworkManager::wait_for_shard_messages
+//       Access: Published
+//  Description: Blocks for up to timeout seconds until the shard has
+//               messages waiting.  The GIL is released while
+//               waiting, so one Python thread per shard can sleep
+//               here without holding up the others.  Returns true
+//               if there are messages to drain, and false on timeout
+//               or once the shards are stopped.
+////////////////////////////////////////////////////////////////////
+bool SteamNetworkManager::wait_for_shard_messages(int shard, double timeout) {
+    PT(ServiceShard) service_shard = get_shard(shard);
+    nassertr(service_shard != nullptr, false);
+
+    std::unique_lock<std::mutex> lock(service_shard->_wait_lock);
+    std::chrono::microseconds duration(static_cast<long long>(std::max(timeout, 0.0) * 1000000.0));
+    return service_shard->_wait_cvar.wait_for(lock, duration, [&service_shard] {
+        return service_shard->_queue.get_size() > 0 || service_shard->_stopped;
+    }) && !service_shard->_stopped;
+}
+
+////////////////////////////////////////////////////////////////////
+//     Function: SteamNetworkManager::drain_shard_messages
+//       Access: Published
+//  Description: Moves up to max_messages messages collected by the
+//               given shard's worker into a batch.  Each shard must
+//               be drained from a single thread, but different
+//               shards may be drained from different threads.
+////////////////////////////////////////////////////////////////////
+PT(SteamNetworkMessageBatch) SteamNetworkManager::drain_shard_messages(int shard, int max_messages) {
+    PT(SteamNetworkMessageBatch) batch = new SteamNetworkMessageBatch;
+    PT(ServiceShard) service_shard = get_shard(shard);
+    nassertr(service_shard != nullptr, batch);
+    if (max_messages <= 0) return batch;
+
+    SteamNetworkRing<SteamNetworkingMessage_t *> &queue = service_shard->_queue;
+    size_t available = std::min(queue.get_size(), static_cast<size_t>(max_messages));
+    batch->_messages.reserve(available);
+
+    SteamNetworkingMessage_t *msg = nullptr;
+    while (batch->_messages.size() < static_cast<size_t>(max_messages) && queue.pop(msg)) {
+        batch->_messages.push_back(msg);
+    }
+    return batch;
+}
+
+////////////////////////////////////////////////////////////////////
+//     Function: SteamNetworkManager::get_shard
+//       Access: Private
+//  Description: Returns the given running shard, or nullptr if
+//               there is no such shard.
+////////////////////////////////////////////////////////////////////
+PT(SteamNetworkManager::ServiceShard) SteamNetworkManager::get_shard(int shard) const {
+    std::lock_guard<std::mutex> guard(_shards_lock);
+    if (shard < 0 || static_cast<size_t>(shard) >= _shards.size()) {
+        return nullptr;
+    }
+    return _shards[shard];
+}
+
+////////////////////////////////////////////////////////////////////
+//     Function: SteamNetworkManager::assign_shard
+//       Access: Private
+//  Description: Moves the connection into shard key modulo the
+//               number of shards.  Returns the shard index, or -1 if
+//               the shards are not running.
+////////////////////////////////////////////////////////////////////
+int SteamNetworkManager::assign_shard(SteamNetworkConnectionHandle connection, uint64_t key) {
+    int shard;
+    SteamNetworkPollGroupHandle poll_group;
+    {
+        std::lock_guard<std::mutex> guard(_shards_lock);
+        if (_shards.empty()) {
+            return -1;
+        }
+        shard = static_cast<int>(key % _shards.size());
+        poll_group = _shards[shard]->_poll_group;
+    }
+    set_connection_poll_group(connection, poll_group);
+    return shard;
+}
+
+////////////////////////////////////////////////////////////////////
+//     Function: SteamNetworkManager::destroy_poll_group
+//       Access: Private
+//  Description: Destroys a poll group created by create_poll_group
+//               and forgets which connections were assigned to it.
+////////////////////////////////////////////////////////////////////
+void SteamNetworkManager::destroy_poll_group(SteamNetworkPollGroupHandle poll_group) {
+    _interface->DestroyPollGroup(static_cast<HSteamNetPollGroup>(poll_group));
+
+    std::lock_guard<std::mutex> guard(_poll_groups_lock);
+    pmap<SteamNetworkPollGroupHandle, PT(SteamNetworkConnectionGroup)>::iterator it = _poll_groups.find(poll_group);
+    if (it == _poll_groups.end()) {
+        return;
+    }
+    const SteamNetworkConnectionGroup &connections = *it->second;
+    for (size_t i = 0; i < connections.get_num_connections(); ++i) {
+        _connection_poll_groups.erase(connections.get_connection(i));
+    }
+    _poll_groups.erase(it);
+}
+
+////////////////////////////////////////////////////////////////////
+//     Function: SteamNetworkManager::ServiceShard::~ServiceShard
+//       Access: Private
+//  Description: Releases the messages still queued.  Runs once the
+//               worker has exited and the last thread waiting on or
+//               draining the shard has let go of it.
+////////////////////////////////////////////////////////////////////
+SteamNetworkManager::ServiceShard::~ServiceShard() {
+    SteamNetworkingMessage_t *msg = nullptr;
+    while (_queue.pop(msg)) {
+        msg->Release();
+    }
+}
+
+////////////////////////////////////////////////////////////////////
+//     Function: SteamNetworkManager::shard_thread_main
+//       Access: Private
+//  Description: Body of a shard worker thread.  Only the first
+//               worker, which pumps the callbacks, touches Python,
+//               through a server socket's accept callback, which
+//               takes the GIL.
+////////////////////////////////////////////////////////////////////
+void SteamNetworkManager::shard_thread_main(ServiceShard *shard, bool run_callbacks) {
+    std::chrono::microseconds interval(static_cast<long long>(_shard_interval * 1000000.0));
+
+    while (_shards_running.load(std::memory_order_acquire)) {
+        if (run_callbacks) {
+            _interface->RunCallbacks();
+            update_backpressure();
+        }
+
+        if (receive_into_ring(shard->_poll_group, shard->_queue) > 0) {
+            {
+                std::lock_guard<std::mutex> guard(shard->_wait_lock);
+            }
+            shard->_wait_cvar.notify_one();
+        }
+
+        std::this_thread::sleep_for(interval);
+    }
 }
 
 #endif // CPPPARSER
\ No newline at end of file
@@ -10,6 +10,12 @@
 
 #ifndef CPPPARSER
 #include <steam/isteamnetworkingsockets.h>
+#include "steamNetworkRing.h"
+#include <atomic>
+#include <condition_variable>
+#include <mutex>
+#include <thread>
+#include <unordered_map>
 #endif
 
 #include "referenceCount.h"
@@ -18,13 +24,27 @@
 #include "netAddress.h"
 #include "datagramIterator.h"
 #include "pdeque.h"
+#include "pmap.h"
+#include "pset.h"
+#include "pvector.h"
 #include "register_type.h"
+#include "steamNetworkCompressionStats.h"
+#include "steamNetworkConnectionGroup.h"
+#include "steamNetworkConnectionInfo.h"
+#include "steamNetworkConnectionStatus.h"
+#include "steamNetworkConnectionTable.h"
 #include "steamNetworkEvent.h"
+#include "steamNetworkEventBatch.h"
+#include "steamNetworkFakeConditions.h"
+#include "steamNetworkMessageBatch.h"
+#include "steamNetworkMessage.h"
+#include "steamNetworkMessageBuffer.h"
+#include "steamNetworkMessageBuilder.h"
+#include "steamNetworkSendBatch.h"
+#include "steamNetworkSnapshot.h"
+#include "steamNetworkTickChannel.h"
 #include "typedObject.h"
 
-class SteamNetworkConnectionInfo;
-class SteamNetworkMessage;
-
 ////////////////////////////////////////////////////////////////////
 //       Class : SteamNetworkManager
 // Description : Responsible for managing Steam GameSockets connections 
@@ -38,28 +58,116 @@ public:
 
 PUBLISHED:
     SteamNetworkManager();
-    virtual ~SteamNetworkManager() = default;
+    virtual ~SteamNetworkManager();
     static SteamNetworkManager *get_global_ptr();
 
     SteamNetworkListenSocketHandle create_ip_socket(int port);
     SteamNetworkListenSocketHandle create_steam_id_socket(int port);
+    SteamNetworkListenSocketHandle create_ip_server(int port, SteamNetworkPollGroupHandle poll_group,
+                                                    int max_clients = 0, PyObject *accept_callback = nullptr);
+    SteamNetworkListenSocketHandle create_steam_id_server(int port, SteamNetworkPollGroupHandle poll_group,
+                                                          int max_clients = 0, PyObject *accept_callback = nullptr);
+    bool close_listen_socket(SteamNetworkListenSocketHandle listen_socket);
+    size_t get_num_server_clients(SteamNetworkListenSocketHandle listen_socket) const;
     SteamNetworkConnectionHandle connect_by_ip_address(const NetAddress &address);
     SteamNetworkConnectionHandle connect_by_steam_id(const std::string &steam_id);
+    PyObject *create_socket_pair(bool use_network_loopback = false);
     bool get_connection_info(SteamNetworkConnectionHandle connection, SteamNetworkConnectionInfo &info);
+    bool lookup_connection(SteamNetworkConnectionHandle connection, SteamNetworkConnectionInfo &info) const;
+    bool has_connection(SteamNetworkConnectionHandle connection) const;
+    bool set_connection_user_data(SteamNetworkConnectionHandle connection, int64_t user_data);
+    int64_t get_connection_user_data(SteamNetworkConnectionHandle connection) const;
+    size_t get_num_connections() const;
+    PT(SteamNetworkConnectionTable) get_connection_table() const;
+    static double get_local_time();
+    bool get_connection_status(SteamNetworkConnectionHandle connection, SteamNetworkConnectionStatus &status);
+    PT(SteamNetworkConnectionStatusBatch) get_connection_statuses(const SteamNetworkConnectionGroup &connections);
+    PT(SteamNetworkConnectionStatusBatch) get_poll_group_status(SteamNetworkPollGroupHandle poll_group);
     void close_connection(SteamNetworkConnectionHandle connection);
     void accept_connection(SteamNetworkConnectionHandle connection);
+    bool flush_connection(SteamNetworkConnectionHandle connection);
+    int64_t get_pending_bytes(SteamNetworkConnectionHandle connection);
+    void set_send_watermarks(SteamNetworkConnectionHandle connection, size_t high, size_t low);
+    void clear_send_watermarks(SteamNetworkConnectionHandle connection);
+    bool is_connection_writable(SteamNetworkConnectionHandle connection) const;
+    bool configure_connection_lanes(SteamNetworkConnectionHandle connection, PyObject *priorities,
+                                    PyObject *weights = nullptr);
+
+    bool set_connection_config_int32(SteamNetworkConnectionHandle connection, int config_value, int value);
+    bool set_connection_config_float(SteamNetworkConnectionHandle connection, int config_value, float value);
+    bool set_connection_config_string(SteamNetworkConnectionHandle connection, int config_value, const std::string &value);
+    static bool set_global_config_int32(int config_value, int value);
+    static bool set_global_config_float(int config_value, float value);
+    static bool set_global_config_string(int config_value, const std::string &value);
+
+    bool set_connection_compression(SteamNetworkConnectionHandle connection, bool enabled,
+                                    size_t threshold = 256, int level = 6);
+    bool get_connection_compression(SteamNetworkConnectionHandle connection) const;
+    SteamNetworkCompressionStats get_compression_stats() const;
+    void reset_compression_stats();
+
+    static bool set_fake_network_conditions(const SteamNetworkFakeConditions &conditions);
+    bool set_connection_fake_network_conditions(SteamNetworkConnectionHandle connection,
+                                                const SteamNetworkFakeConditions &conditions);
 
     bool receive_message_on_connection(SteamNetworkConnectionHandle connection, SteamNetworkMessage &message);
     bool receive_message_on_poll_group(SteamNetworkPollGroupHandle poll_group, SteamNetworkMessage &message);
+    PT(SteamNetworkMessageBatch) receive_messages_on_connection(SteamNetworkConnectionHandle connection, int max_messages = 256);
+    PT(SteamNetworkMessageBatch) receive_messages_on_poll_group(SteamNetworkPollGroupHandle poll_group, int max_messages = 256);
+    PT(SteamNetworkMessageBuffer) receive_buffer_on_connection(SteamNetworkConnectionHandle connection);
+    PT(SteamNetworkMessageBuffer) receive_buffer_on_poll_group(SteamNetworkPollGroupHandle poll_group);
+
+    PT(SteamNetworkMessage) acquire_message();
+    void release_message(SteamNetworkMessage *message);
+    PT(SteamNetworkMessage) receive_pooled_message_on_connection(SteamNetworkConnectionHandle connection);
+    PT(SteamNetworkMessage) receive_pooled_message_on_poll_group(SteamNetworkPollGroupHandle poll_group);
+    void set_max_pooled_messages(size_t max_messages);
+    size_t get_max_pooled_messages() const;
+    size_t get_num_pooled_messages() const;
 
     SteamNetworkPollGroupHandle create_poll_group();
     void set_connection_poll_group(SteamNetworkConnectionHandle connection, SteamNetworkPollGroupHandle poll_group);
+    PT(SteamNetworkConnectionGroup) get_poll_group_connections(SteamNetworkPollGroupHandle poll_group) const;
 
-    void send_datagram(SteamNetworkConnectionHandle connection, const Datagram &dg, int send_flags);
-    void send_datagram(const Datagram &dg, int send_flags);
+    int64_t send_datagram(SteamNetworkConnectionHandle connection, const Datagram &dg, int send_flags, int lane = 0);
+    int64_t send_datagram(const Datagram &dg, int send_flags);
+    int64_t send_message(SteamNetworkMessageBuilder &builder);
+    int send_messages(SteamNetworkSendBatch &batch);
+    int flush_tick_channel(SteamNetworkTickChannel &channel);
+
+    int64_t send_snapshot(SteamNetworkConnectionHandle connection, const Datagram &state, int send_flags, int lane = 0);
+    bool ack_snapshot(SteamNetworkConnectionHandle connection, int64_t message_number);
+    void reset_snapshots(SteamNetworkConnectionHandle connection);
+    int broadcast_datagram(const SteamNetworkConnectionGroup &connections, const Datagram &dg, int send_flags,
+                           SteamNetworkConnectionHandle exclude = INVALID_STEAM_NETWORK_CONNECTION_HANDLE,
+                           int lane = 0);
+    int broadcast_datagram(SteamNetworkPollGroupHandle poll_group, const Datagram &dg, int send_flags,
+                           SteamNetworkConnectionHandle exclude = INVALID_STEAM_NETWORK_CONNECTION_HANDLE,
+                           int lane = 0);
 
     void run_callbacks();
     PT(SteamNetworkEvent) get_next_event();
+    size_t get_num_pending_events() const;
+    PT(SteamNetworkEventBatch) drain_events();
+    PT(SteamNetworkEventBatch) drain_events(SteamNetworkListenSocketHandle listen_socket);
+    PT(SteamNetworkEventBatch) drain_client_events();
+
+    bool start_service_thread(double interval = 0.001, int queue_size = 16384);
+    BLOCKING void stop_service_thread();
+    bool is_service_thread_running() const;
+    void add_service_poll_group(SteamNetworkPollGroupHandle poll_group);
+    void remove_service_poll_group(SteamNetworkPollGroupHandle poll_group);
+    PT(SteamNetworkMessageBatch) drain_service_messages(int max_messages = 4096);
+
+    bool start_shard_threads(int num_shards, double interval = 0.001, int queue_size = 16384);
+    BLOCKING void stop_shard_threads();
+    int get_num_shards() const;
+    SteamNetworkPollGroupHandle get_shard_poll_group(int shard) const;
+    int assign_connection_to_shard(SteamNetworkConnectionHandle connection);
+    int assign_connection_to_shard(SteamNetworkConnectionHandle connection, uint64_t key);
+    int get_connection_shard(SteamNetworkConnectionHandle connection) const;
+    BLOCKING bool wait_for_shard_messages(int shard, double timeout);
+    PT(SteamNetworkMessageBatch) drain_shard_messages(int shard, int max_messages = 4096);
 
 public:
     static TypeHandle get_class_type() {
@@ -78,13 +186,196 @@ public:
         return get_class_type();
     }
 
+private:
+  void remove_from_poll_group(SteamNetworkConnectionHandle connection);
+  int64_t send_framed_datagram(SteamNetworkConnectionHandle connection, const Datagram &dg, int send_flags, int lane);
+  void service_thread_main();
+  int assign_shard(SteamNetworkConnectionHandle connection, uint64_t key);
+  void destroy_poll_group(SteamNetworkPollGroupHandle poll_group);
+
+#ifndef CPPPARSER
+  struct QueuedEvent {
+    uint64_t _sequence;
+    SteamNetworkEventRecord _record;
+  };
+  typedef pdeque<QueuedEvent> EventQueue;
+  typedef pmap<SteamNetworkListenSocketHandle, EventQueue> EventQueues;
+
+  void queue_event(const SteamNetworkEventRecord &record);
+  void queue_writable_event(SteamNetworkConnectionHandle connection, bool writable);
+  void check_backpressure(SteamNetworkConnectionHandle connection, int64_t result);
+  void update_backpressure();
+  void update_connection_table(const SteamNetConnectionStatusChangedCallback_t *info);
+  void add_connection_entry(SteamNetworkConnectionHandle connection);
+  void read_message(SteamNetworkingMessage_t *msg, SteamNetworkMessage &message);
+  int receive_on_connection(SteamNetworkConnectionHandle connection, SteamNetworkingMessage_t **messages, int max_messages);
+  int receive_on_poll_group(SteamNetworkPollGroupHandle poll_group, SteamNetworkingMessage_t **messages, int max_messages);
+
+  // Accept policy of a listen socket created by create_ip_server or
+  // create_steam_id_server.  _clients holds the connections it
+  // accepted that have not dropped yet.
+  struct ServerPolicy {
+    SteamNetworkPollGroupHandle _poll_group;
+    int _max_clients;
+    PyObject *_accept_callback;
+    pset<SteamNetworkConnectionHandle> _clients;
+  };
+  SteamNetworkListenSocketHandle create_server(int port, bool steam_id, SteamNetworkPollGroupHandle poll_group,
+                                               int max_clients, PyObject *accept_callback);
+  bool wants_accept_callback(const SteamNetConnectionStatusChangedCallback_t *info) const;
+  void apply_server_policy(const SteamNetConnectionStatusChangedCallback_t *info, bool accepted,
+                           SteamNetworkEventRecord &record);
+  static bool call_accept_callback(int64_t id, const SteamNetConnectionStatusChangedCallback_t *info);
+  static SteamNetworkManager *find_instance(int64_t id);
+  void reject_connection(SteamNetworkConnectionHandle connection, const char *reason, SteamNetworkEventRecord &record);
+
+  // Payload compression settings of a connection that opted in.
+  // Every payload on such a connection starts with a one-byte
+  // CompressionHeader.
+  struct CompressionSettings {
+    size_t _threshold;
+    int _level;
+  };
+  enum CompressionHeader {
+    CH_raw = 0,
+    CH_zlib = 1,
+  };
+  bool get_compression(SteamNetworkConnectionHandle connection, CompressionSettings &settings) const;
+  void frame_payload(const CompressionSettings &settings, const void *data, size_t length, Datagram &framed);
+  SteamNetworkingMessage_t *frame_message(SteamNetworkingMessage_t *msg);
+  SteamNetworkingMessage_t *unframe_message(SteamNetworkingMessage_t *msg);
+
+  // Snapshots sent to one connection.  _baseline is the newest
+  // snapshot the client acknowledged; _sent holds the unacknowledged
+  // ones, oldest first.
+  struct SnapshotHistory {
+    SnapshotHistory() : _baseline_number(0) {}
+    int64_t _baseline_number;
+    Datagram _baseline;
+    pdeque<std::pair<int64_t, Datagram> > _sent;
+  };
+  static const size_t max_snapshot_history = 64;
+
+  // One poll group drained by its own worker thread.  The worker is
+  // the only producer of _queue; whichever thread drains the shard is
+  // its only consumer.  Threads waiting on or draining a shard hold a
+  // reference to it, so stopping the shards never frees one under
+  // them; whatever is still queued is released with the last
+  // reference.
+  struct ServiceShard : public ReferenceCount {
+    ServiceShard(SteamNetworkPollGroupHandle poll_group, size_t queue_size) :
+      _poll_group(poll_group), _queue(queue_size), _stopped(false) {}
+    ~ServiceShard();
+    SteamNetworkPollGroupHandle _poll_group;
+    SteamNetworkRing<SteamNetworkingMessage_t *> _queue;
+    std::thread _thread;
+    std::mutex _wait_lock;
+    std::condition_variable _wait_cvar;
+    bool _stopped;
+  };
+  PT(ServiceShard) get_shard(int shard) const;
+  void shard_thread_main(ServiceShard *shard, bool run_callbacks);
+  int receive_into_ring(SteamNetworkPollGroupHandle poll_group, SteamNetworkRing<SteamNetworkingMessage_t *> &queue);
+
+  // Send watermarks of a connection that opted in to writable /
+  // unwritable events.
+  struct SendWatermarks {
+    size_t _high;
+    size_t _low;
+    bool _writable;
+  };
+
+  static const int num_connection_options = 2;
+  void get_connection_options(SteamNetworkingConfigValue_t *options) const;
+  void apply_connection_options(SteamNetworkConnectionHandle connection) const;
+#endif
+
 private:
   static TypeHandle _type_handle;
-  pdeque<PT(SteamNetworkEvent)> _events;
+  pmap<SteamNetworkPollGroupHandle, PT(SteamNetworkConnectionGroup)> _poll_groups;
+  pmap<SteamNetworkConnectionHandle, SteamNetworkPollGroupHandle> _connection_poll_groups;
+#ifndef CPPPARSER
+  // Snapshot histories, guarded by _snapshots_lock.
+  pmap<SteamNetworkConnectionHandle, SnapshotHistory> _snapshots;
+  std::mutex _snapshots_lock;
+
+  // Compression settings and counters.  Payloads are unframed by
+  // whichever thread receives them, the service and shard threads
+  // included, so both are guarded by _compression_lock.  Nothing
+  // else is locked while it is held.
+  pmap<SteamNetworkConnectionHandle, CompressionSettings> _compression;
+  SteamNetworkCompressionStats _compression_stats;
+  mutable std::mutex _compression_lock;
+#endif
+
+  // Recycled messages handed out by acquire_message.
+  pvector<PT(SteamNetworkMessage)> _message_pool;
+  size_t _max_pooled_messages;
   static SteamNetworkManager *_global_ptr;
 
+#ifndef CPPPARSER
+  // Every live manager by id.  A manager tags its sockets and
+  // connections with its id, never reused, so a late callback for a
+  // destroyed manager's connection cannot reach a newer manager.
+  // _instances_lock is never held while waiting for the GIL or
+  // calling into Python.
+  static pmap<int64_t, SteamNetworkManager *> _instances;
+  static int64_t _next_id;
+  static std::mutex _instances_lock;
+  int64_t _id;
+#endif
+
 #ifndef CPPPARSER
   ISteamNetworkingSockets *_interface;
+
+  // Connection events, one queue per listen socket.  Client-side
+  // connections are queued under the invalid listen socket handle.
+  // Guarded by _events_lock, since the status callback may fill
+  // them from the service thread.
+  EventQueues _event_queues;
+  uint64_t _next_event_sequence;
+  size_t _num_pending_events;
+  mutable std::mutex _events_lock;
+
+  // Every live connection, keyed by handle.  Updated from the status
+  // callback, which may run on the service thread, so guarded by
+  // _connections_lock.
+  typedef std::unordered_map<SteamNetworkConnectionHandle, SteamNetworkConnectionInfo> ConnectionTable;
+  ConnectionTable _connections;
+  mutable std::mutex _connections_lock;
+
+  // Connections with send watermarks.  Checked after sends and by
+  // whichever thread pumps the callbacks, so guarded by
+  // _watermarks_lock.
+  pmap<SteamNetworkConnectionHandle, SendWatermarks> _watermarks;
+  mutable std::mutex _watermarks_lock;
+
+  // Server sockets and their accept policies.  Applied from the
+  // status callback, so guarded by _servers_lock, which
+  // create_server also holds while it creates the socket.
+  pmap<SteamNetworkListenSocketHandle, ServerPolicy> _servers;
+  mutable std::mutex _servers_lock;
+
+  // Guards _poll_groups and _connection_poll_groups, which server
+  // sockets update from the status callback.
+  mutable std::mutex _poll_groups_lock;
+
+  // Background networking thread.  The thread is the only producer
+  // and the main thread the only consumer of _service_queue.
+  std::thread _service_thread;
+  std::atomic<bool> _service_running;
+  double _service_interval;
+  SteamNetworkRing<SteamNetworkingMessage_t *> *_service_queue;
+  std::mutex _service_lock;
+  pvector<SteamNetworkPollGroupHandle> _service_poll_groups;
+
+  // Sharded service, see start_shard_threads.  _shards is guarded
+  // by _shards_lock, which is never held while taking another lock.
+  pvector<PT(ServiceShard)> _shards;
+  mutable std::mutex _shards_lock;
+  std::atomic<bool> _shards_running;
+  double _shard_interval;
+  std::atomic<uint64_t> _next_shard;
 #endif
 
   SteamNetworkConnectionHandle _client_connection;
@@ -9,6 +9,39 @@
 #include "steamConstants_bindings.h"
 #include "steamEnums_bindings.h"
 
+////////////////////////////////////////////////////////////////////
+//     Function: SteamNetworkMessage::Copy Constructor
+//       Access: Published
+//  Description: Copies the message.  The iterator is rebuilt over
+//               this message's own datagram, at the same position.
+////////////////////////////////////////////////////////////////////
+SteamNetworkMessage::SteamNetworkMessage(const SteamNetworkMessage &copy) :
+    ReferenceCount(),
+    _dg(copy._dg),
+    _dgi(_dg, copy._dgi.get_current_index()),
+    _connection(copy._connection),
+    _lane(copy._lane),
+    _message_number(copy._message_number),
+    _remote_steam_id(copy._remote_steam_id),
+    _channel(copy._channel),
+    _in_pool(false) {
+}
+
+////////////////////////////////////////////////////////////////////
+//     Function: SteamNetworkMessage::Copy Assignment Operator
+//       Access: Published
+////////////////////////////////////////////////////////////////////
+SteamNetworkMessage &SteamNetworkMessage::operator = (const SteamNetworkMessage &copy) {
+    _dg = copy._dg;
+    _dgi = DatagramIterator(_dg, copy._dgi.get_current_index());
+    _connection = copy._connection;
+    _lane = copy._lane;
+    _message_number = copy._message_number;
+    _remote_steam_id = copy._remote_steam_id;
+    _channel = copy._channel;
+    return *this;
+}
+
 ////////////////////////////////////////////////////////////////////
 //     Function: SteamNetworkMessage::set_datagram
 //       Access: Published
@@ -63,4 +96,138 @@ SteamNetworkConnectionHandle SteamNetworkMessage::get_connection() const {
     return _connection;
 }
 
+////////////////////////////////////////////////////////////////////
+//     Function: SteamNetworkMessage::set_lane
+//       Access: Published
+////////////////////////////////////////////////////////////////////
+void SteamNetworkMessage::set_lane(int lane) {
+    _lane = lane;
+}
+
+////////////////////////////////////////////////////////////////////
+//     Function: SteamNetworkMessage::get_lane
+//       Access: Published
+//  Description: Returns the lane the message was sent on.  Lanes
+//               are declared per connection with
+//               SteamNetworkManager::configure_connection_lanes.
+////////////////////////////////////////////////////////////////////
+int SteamNetworkMessage::get_lane() const {
+    return _lane;
+}
+
+////////////////////////////////////////////////////////////////////
+//     Function: SteamNetworkMessage::set_message_number
+//       Access: Published
+////////////////////////////////////////////////////////////////////
+void SteamNetworkMessage::set_message_number(int64_t message_number) {
+    _message_number = message_number;
+}
+
+////////////////////////////////////////////////////////////////////
+//     Function: SteamNetworkMessage::get_message_number
+//       Access: Published
+//  Description: Returns the message number the sender assigned to
+//               the message.  It matches the number the sender's
+//               send_datagram call returned.
+////////////////////////////////////////////////////////////////////
+int64_t SteamNetworkMessage::get_message_number() const {
+    return _message_number;
+}
+
+////////////////////////////////////////////////////////////////////
+//     Function: SteamNetworkMessage::set_remote_steam_id
+//       Access: Published
+////////////////////////////////////////////////////////////////////
+void SteamNetworkMessage::set_remote_steam_id(uint64_t steam_id) {
+    _remote_steam_id = steam_id;
+}
+
+////////////////////////////////////////////////////////////////////
+//     Function: SteamNetworkMessage::get_remote_steam_id
+//       Access: Published
+//  Description: Returns the Steam ID of the sender, for messages
+//               received through SteamNetworkMessagesManager.
+////////////////////////////////////////////////////////////////////
+uint64_t SteamNetworkMessage::get_remote_steam_id() const {
+    return _remote_steam_id;
+}
+
+////////////////////////////////////////////////////////////////////
+//     Function: SteamNetworkMessage::set_channel
+//       Access: Published
+////////////////////////////////////////////////////////////////////
+void SteamNetworkMessage::set_channel(int channel) {
+    _channel = channel;
+}
+
+////////////////////////////////////////////////////////////////////
+//     Function: SteamNetworkMessage::get_channel
+//       Access: Published
+//  Description: Returns the channel the message was received on, for
+//               messages received through
+//               SteamNetworkMessagesManager.
+////////////////////////////////////////////////////////////////////
+int SteamNetworkMessage::get_channel() const {
+    return _channel;
+}
+
+////////////////////////////////////////////////////////////////////
+//     Function: SteamNetworkMessage::assign_data
+//       Access: Public
+//  Description: Replaces the payload with a copy of the given bytes
+//               and resets the iterator.  The existing storage is
+//               reused when nothing else shares it; a datagram
+//               previously returned by get_datagram() keeps its own
+//               contents.
+////////////////////////////////////////////////////////////////////
+void SteamNetworkMessage::assign_data(const void *data, size_t size) {
+    PTA_uchar array = _dg.modify_array();
+
+    // One reference is ours and one is _dg's; any more means a copy
+    // of the datagram still points at this storage.
+    if (array.get_ref_count() > 2) {
+        array = PTA_uchar::empty_array(0, Datagram::get_class_type());
+        _dg.set_array(array);
+    }
+
+    const unsigned char *bytes = static_cast<const unsigned char *>(data);
+    array.v().assign(bytes, bytes + size);
+    _dgi = DatagramIterator(_dg);
+}
+
+////////////////////////////////////////////////////////////////////
+//     Function: SteamNetworkMessage::reset
+//       Access: Public
+//  Description: Clears everything but the payload storage, so the
+//               message can be recycled.
+////////////////////////////////////////////////////////////////////
+void SteamNetworkMessage::reset() {
+    assign_data(nullptr, 0);
+    _connection = INVALID_STEAM_NETWORK_CONNECTION_HANDLE;
+    _lane = 0;
+    _message_number = 0;
+    _remote_steam_id = 0;
+    _channel = 0;
+}
+
+////////////////////////////////////////////////////////////////////
+//     Function: SteamNetworkMessage::is_in_pool
+//       Access: Public
+//  Description: Returns true if the message is waiting in a
+//               SteamNetworkManager's message pool.
+////////////////////////////////////////////////////////////////////
+bool SteamNetworkMessage::is_in_pool() const {
+    return _in_pool;
+}
+
+////////////////////////////////////////////////////////////////////
+//     Function: SteamNetworkMessage::set_in_pool
+//       Access: Public
+//  Description: Called by SteamNetworkManager as the message enters
+//               or leaves its pool.
+////////////////////////////////////////////////////////////////////
+void SteamNetworkMessage::set_in_pool(bool in_pool) {
+    _in_pool = in_pool;
+}
+
 #endif  // CPPPARSER
\ No newline at end of file
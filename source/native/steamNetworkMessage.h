@@ -7,17 +7,26 @@
 #include "steamConstants_bindings.h"
 #include "steamPython_bindings.h"
 
+#include "referenceCount.h"
 #include "datagram.h"
 #include "datagramIterator.h"
 
 ////////////////////////////////////////////////////////////////////
 //       Class : SteamNetworkMessage
-// Description : Represents a Valve GameSockets message.
+// Description : Represents a Valve GameSockets message.  Filling a
+//               message reuses its payload storage unless a copy of
+//               its datagram is still held elsewhere, so a message
+//               that is received into repeatedly, or recycled
+//               through SteamNetworkManager's message pool, does
+//               not reallocate.
 ////////////////////////////////////////////////////////////////////
-class EXPORT_CLASS SteamNetworkMessage {
+class EXPORT_CLASS SteamNetworkMessage : public ReferenceCount {
 PUBLISHED:
   SteamNetworkMessage()
-    : _connection(INVALID_STEAM_NETWORK_CONNECTION_HANDLE) {}
+    : _connection(INVALID_STEAM_NETWORK_CONNECTION_HANDLE), _lane(0), _message_number(0),
+      _remote_steam_id(0), _channel(0), _in_pool(false) {}
+  SteamNetworkMessage(const SteamNetworkMessage &copy);
+  SteamNetworkMessage &operator = (const SteamNetworkMessage &copy);
   virtual ~SteamNetworkMessage() = default;
 
   void set_datagram(const Datagram &dg);
@@ -28,13 +37,42 @@ PUBLISHED:
   void set_connection(SteamNetworkConnectionHandle connection);
   SteamNetworkConnectionHandle get_connection() const;
 
+  void set_lane(int lane);
+  int get_lane() const;
+
+  void set_message_number(int64_t message_number);
+  int64_t get_message_number() const;
+
+  void set_remote_steam_id(uint64_t steam_id);
+  uint64_t get_remote_steam_id() const;
+
+  void set_channel(int channel);
+  int get_channel() const;
+
   MAKE_PROPERTY(dg, get_datagram, set_datagram);
   MAKE_PROPERTY(dgi, get_datagram_iterator);
   MAKE_PROPERTY(connection, get_connection, set_connection);
+  MAKE_PROPERTY(lane, get_lane, set_lane);
+  MAKE_PROPERTY(message_number, get_message_number, set_message_number);
+  MAKE_PROPERTY(remote_steam_id, get_remote_steam_id, set_remote_steam_id);
+  MAKE_PROPERTY(channel, get_channel, set_channel);
+
+public:
+  void assign_data(const void *data, size_t size);
+  void reset();
+  bool is_in_pool() const;
+  void set_in_pool(bool in_pool);
 
 private:
   Datagram _dg;
   DatagramIterator _dgi;
   SteamNetworkConnectionHandle _connection;
+  int _lane;
+  int64_t _message_number;
+  uint64_t _remote_steam_id;
+  int _channel;
+
+  // True while the message sits in SteamNetworkManager's pool.
+  bool _in_pool;
 };
 
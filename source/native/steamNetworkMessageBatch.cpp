@@ -0,0 +1,229 @@
+///
+// Copyright (c) 2026, Digital Descent, LLC. All rights reserved.
+//
+
+#include "steamNetworkMessageBatch.h"
+
+// Guard everything below from interrogate's parser.
+#ifndef CPPPARSER
+#include "steamConstants_bindings.h"
+#include "steamEnums_bindings.h"
+
+////////////////////////////////////////////////////////////////////
+//     Function: SteamNetworkMessageBatch::~SteamNetworkMessageBatch
+//       Access: Published, Virtual
+//  Description: Releases every Steam message still held by the
+//               batch.
+////////////////////////////////////////////////////////////////////
+SteamNetworkMessageBatch::~SteamNetworkMessageBatch() {
+    clear();
+    for (SteamNetworkingMessage_t *msg : _retired) {
+        msg->Release();
+    }
+}
+
+////////////////////////////////////////////////////////////////////
+//     Function: SteamNetworkMessageBatch::get_num_messages
+//       Access: Published
+//  Description: Returns the number of messages in the batch.
+////////////////////////////////////////////////////////////////////
+size_t SteamNetworkMessageBatch::get_num_messages() const {
+    return _messages.size();
+}
+
+////////////////////////////////////////////////////////////////////
+//     Function: SteamNetworkMessageBatch::get_message
+//       Access: Published
+//  Description: Returns a view of the nth message in the batch,
+//               without copying its payload.  The view is valid
+//               until the batch is cleared or refilled.
+////////////////////////////////////////////////////////////////////
+PT(SteamNetworkMessageView) SteamNetworkMessageBatch::get_message(size_t n) const {
+    nassertr(n < _messages.size(), nullptr);
+    return new SteamNetworkMessageView(this, n);
+}
+
+////////////////////////////////////////////////////////////////////
+//     Function: SteamNetworkMessageBatch::copy_message
+//       Access: Published
+//  Description: Copies the nth message into the given message,
+//               reusing its payload storage, for code that needs a
+//               SteamNetworkMessage that outlives the batch.
+//               Returns false if n is out of range.
+////////////////////////////////////////////////////////////////////
+bool SteamNetworkMessageBatch::copy_message(size_t n, SteamNetworkMessage &message) const {
+    nassertr(n < _messages.size(), false);
+
+    const SteamNetworkingMessage_t *msg = _messages[n];
+    const unsigned char *data;
+    size_t size;
+    get_payload(n, data, size);
+    message.assign_data(data, size);
+    message.set_connection(static_cast<SteamNetworkConnectionHandle>(msg->m_conn));
+    message.set_lane(msg->m_idxLane);
+    message.set_message_number(msg->m_nMessageNumber);
+    message.set_remote_steam_id(msg->m_identityPeer.GetSteamID64());
+    message.set_channel(msg->m_nChannel);
+    return true;
+}
+
+////////////////////////////////////////////////////////////////////
+//     Function: SteamNetworkMessageBatch::get_connection
+//       Access: Published
+//  Description: Returns the connection the nth message arrived on,
+//               without touching its payload.
+////////////////////////////////////////////////////////////////////
+SteamNetworkConnectionHandle SteamNetworkMessageBatch::get_connection(size_t n) const {
+    nassertr(n < _messages.size(), INVALID_STEAM_NETWORK_CONNECTION_HANDLE);
+    return static_cast<SteamNetworkConnectionHandle>(_messages[n]->m_conn);
+}
+
+////////////////////////////////////////////////////////////////////
+//     Function: SteamNetworkMessageBatch::get_lane
+//       Access: Published
+//  Description: Returns the lane the nth message was sent on.
+////////////////////////////////////////////////////////////////////
+int SteamNetworkMessageBatch::get_lane(size_t n) const {
+    nassertr(n < _messages.size(), 0);
+    return _messages[n]->m_idxLane;
+}
+
+////////////////////////////////////////////////////////////////////
+//     Function: SteamNetworkMessageBatch::get_remote_steam_id
+//       Access: Published
+//  Description: Returns the Steam ID of the nth message's sender.
+////////////////////////////////////////////////////////////////////
+uint64_t SteamNetworkMessageBatch::get_remote_steam_id(size_t n) const {
+    nassertr(n < _messages.size(), 0);
+    return _messages[n]->m_identityPeer.GetSteamID64();
+}
+
+////////////////////////////////////////////////////////////////////
+//     Function: SteamNetworkMessageBatch::get_channel
+//       Access: Published
+//  Description: Returns the channel the nth message was received on,
+//               for batches filled by SteamNetworkMessagesManager.
+////////////////////////////////////////////////////////////////////
+int SteamNetworkMessageBatch::get_channel(size_t n) const {
+    nassertr(n < _messages.size(), 0);
+    return _messages[n]->m_nChannel;
+}
+
+////////////////////////////////////////////////////////////////////
+//     Function: SteamNetworkMessageBatch::get_datagram
+//       Access: Published
+//  Description: Returns the nth message's payload.  It is copied on
+//               the first call only; later calls, and the message's
+//               view, share the same storage.
+////////////////////////////////////////////////////////////////////
+Datagram SteamNetworkMessageBatch::get_datagram(size_t n) const {
+    nassertr(n < _messages.size(), Datagram());
+    return get_cached_datagram(n);
+}
+
+////////////////////////////////////////////////////////////////////
+//     Function: SteamNetworkMessageBatch::get_total_size
+//       Access: Published
+//  Description: Returns the combined payload size of every message
+//               in the batch, in bytes.
+////////////////////////////////////////////////////////////////////
+size_t SteamNetworkMessageBatch::get_total_size() const {
+    size_t total = 0;
+    for (size_t i = 0; i < _messages.size(); ++i) {
+        const unsigned char *data;
+        size_t size;
+        get_payload(i, data, size);
+        total += size;
+    }
+    return total;
+}
+
+////////////////////////////////////////////////////////////////////
+//     Function: SteamNetworkMessageBatch::clear
+//       Access: Published
+//  Description: Releases all messages back to Steam and empties
+//               the batch, invalidating every view into it.
+//               Messages whose payload a view has exported as a
+//               buffer are kept until that buffer is released.
+////////////////////////////////////////////////////////////////////
+void SteamNetworkMessageBatch::clear() {
+    if (_num_exports > 0) {
+        _retired.insert(_retired.end(), _messages.begin(), _messages.end());
+    } else {
+        for (SteamNetworkingMessage_t *msg : _messages) {
+            msg->Release();
+        }
+    }
+    _messages.clear();
+    _datagrams.clear();
+    ++_generation;
+}
+
+////////////////////////////////////////////////////////////////////
+//     Function: SteamNetworkMessageBatch::size
+//       Access: Published
+//  Description: Python len() support; same as get_num_messages().
+////////////////////////////////////////////////////////////////////
+size_t SteamNetworkMessageBatch::size() const {
+    return _messages.size();
+}
+
+////////////////////////////////////////////////////////////////////
+//     Function: SteamNetworkMessageBatch::operator []
+//       Access: Published
+//  Description: Python indexing support; same as get_message().
+////////////////////////////////////////////////////////////////////
+PT(SteamNetworkMessageView) SteamNetworkMessageBatch::operator [] (size_t n) const {
+    return get_message(n);
+}
+
+////////////////////////////////////////////////////////////////////
+//     Function: SteamNetworkMessageBatch::get_payload
+//       Access: Private
+//  Description: Returns where the nth message's payload is stored.
+////////////////////////////////////////////////////////////////////
+void SteamNetworkMessageBatch::get_payload(size_t n, const unsigned char *&data, size_t &size) const {
+    const SteamNetworkingMessage_t *msg = _messages[n];
+    data = static_cast<const unsigned char *>(msg->m_pData);
+    size = static_cast<size_t>(msg->m_cbSize);
+}
+
+////////////////////////////////////////////////////////////////////
+//     Function: SteamNetworkMessageBatch::get_cached_datagram
+//       Access: Private
+//  Description: Returns the nth message's payload as a Datagram,
+//               copying it the first time it is asked for.
+////////////////////////////////////////////////////////////////////
+const Datagram &SteamNetworkMessageBatch::get_cached_datagram(size_t n) const {
+    if (_datagrams.size() != _messages.size()) {
+        _datagrams.resize(_messages.size());
+    }
+
+    const unsigned char *data;
+    size_t size;
+    get_payload(n, data, size);
+    Datagram &dg = _datagrams[n];
+    if (dg.get_length() != size) {
+        dg = Datagram(data, size);
+    }
+    return dg;
+}
+
+////////////////////////////////////////////////////////////////////
+//     Function: SteamNetworkMessageBatch::release_retired
+//       Access: Private
+//  Description: Called when a view's exported buffer is released.
+//               Frees the messages clear() held back once no buffer
+//               is left open.
+////////////////////////////////////////////////////////////////////
+void SteamNetworkMessageBatch::release_retired() const {
+    if (--_num_exports > 0) {
+        return;
+    }
+    for (SteamNetworkingMessage_t *msg : _retired) {
+        msg->Release();
+    }
+    _retired.clear();
+}
+
+#endif  // CPPPARSER
@@ -0,0 +1,80 @@
+///
+// Copyright (c) 2026, Digital Descent, LLC. All rights reserved.
+//
+
+#pragma once
+
+#include "steamConstants_bindings.h"
+#include "steamPython_bindings.h"
+
+#include "referenceCount.h"
+#include "pvector.h"
+#include "datagram.h"
+#include "steamNetworkMessage.h"
+#include "steamNetworkMessageView.h"
+
+////////////////////////////////////////////////////////////////////
+//       Class : SteamNetworkMessageBatch
+// Description : A batch of messages pulled from a connection or
+//               poll group with a single native receive call.  The
+//               batch owns the underlying Steam messages and
+//               releases them when it is destroyed.  Indexing or
+//               iterating over the batch returns a
+//               SteamNetworkMessageView per message, which reads the
+//               Steam message in place; payloads are only copied
+//               when a view's dg or dgi is read, and then only once.
+////////////////////////////////////////////////////////////////////
+class EXPORT_CLASS SteamNetworkMessageBatch : public ReferenceCount {
+PUBLISHED:
+  SteamNetworkMessageBatch() = default;
+  virtual ~SteamNetworkMessageBatch();
+
+  size_t get_num_messages() const;
+  PT(SteamNetworkMessageView) get_message(size_t n) const;
+  MAKE_SEQ(get_messages, get_num_messages, get_message);
+  bool copy_message(size_t n, SteamNetworkMessage &message) const;
+
+  SteamNetworkConnectionHandle get_connection(size_t n) const;
+  int get_lane(size_t n) const;
+  uint64_t get_remote_steam_id(size_t n) const;
+  int get_channel(size_t n) const;
+  Datagram get_datagram(size_t n) const;
+  size_t get_total_size() const;
+
+  void clear();
+
+  size_t size() const;
+  PT(SteamNetworkMessageView) operator [] (size_t n) const;
+
+  MAKE_SEQ_PROPERTY(messages, get_num_messages, get_message);
+  MAKE_PROPERTY(total_size, get_total_size);
+
+private:
+  SteamNetworkMessageBatch(const SteamNetworkMessageBatch &copy) = delete;
+  SteamNetworkMessageBatch &operator = (const SteamNetworkMessageBatch &copy) = delete;
+
+#ifndef CPPPARSER
+  void get_payload(size_t n, const unsigned char *&data, size_t &size) const;
+  const Datagram &get_cached_datagram(size_t n) const;
+  void release_retired() const;
+
+  pvector<SteamNetworkingMessage_t *> _messages;
+
+  // Payloads copied into Datagrams by get_datagram, indexed like
+  // _messages.
+  mutable pvector<Datagram> _datagrams;
+
+  // Bumped whenever the messages are released, so views into the
+  // old contents can tell they are stale.
+  uint64_t _generation = 0;
+
+  // Buffers exported by views, and the messages released by clear()
+  // while any were open, which are kept until the last one closes.
+  mutable int _num_exports = 0;
+  mutable pvector<SteamNetworkingMessage_t *> _retired;
+#endif
+
+  friend class SteamNetworkManager;
+  friend class SteamNetworkMessagesManager;
+  friend class SteamNetworkMessageView;
+};
@@ -0,0 +1,89 @@
+///
+// Copyright (c) 2026, Digital Descent, LLC. All rights reserved.
+//
+
+#include "steamNetworkMessageBuffer.h"
+
+// Guard everything below from interrogate's parser.
+#ifndef CPPPARSER
+#include "steamConstants_bindings.h"
+#include "steamEnums_bindings.h"
+
+////////////////////////////////////////////////////////////////////
+//     Function: SteamNetworkMessageBuffer::SteamNetworkMessageBuffer
+//       Access: Public
+//  Description: Takes ownership of the given Steam message.
+////////////////////////////////////////////////////////////////////
+SteamNetworkMessageBuffer::SteamNetworkMessageBuffer(SteamNetworkingMessage_t *message)
+    : _message(message) {
+}
+
+////////////////////////////////////////////////////////////////////
+//     Function: SteamNetworkMessageBuffer::~SteamNetworkMessageBuffer
+//       Access: Published, Virtual
+//  Description: Releases the Steam message.  Python keeps this
+//               object alive for as long as a memoryview of it
+//               exists, so the payload is never freed under a view.
+////////////////////////////////////////////////////////////////////
+SteamNetworkMessageBuffer::~SteamNetworkMessageBuffer() {
+    if (_message != nullptr) {
+        _message->Release();
+    }
+}
+
+////////////////////////////////////////////////////////////////////
+//     Function: SteamNetworkMessageBuffer::get_connection
+//       Access: Published
+////////////////////////////////////////////////////////////////////
+SteamNetworkConnectionHandle SteamNetworkMessageBuffer::get_connection() const {
+    return static_cast<SteamNetworkConnectionHandle>(_message->m_conn);
+}
+
+////////////////////////////////////////////////////////////////////
+//     Function: SteamNetworkMessageBuffer::get_size
+//       Access: Published
+//  Description: Returns the payload size in bytes.
+////////////////////////////////////////////////////////////////////
+size_t SteamNetworkMessageBuffer::get_size() const {
+    return static_cast<size_t>(_message->m_cbSize);
+}
+
+////////////////////////////////////////////////////////////////////
+//     Function: SteamNetworkMessageBuffer::get_message_number
+//       Access: Published
+//  Description: Returns the sender-assigned message number.
+////////////////////////////////////////////////////////////////////
+int64_t SteamNetworkMessageBuffer::get_message_number() const {
+    return _message->m_nMessageNumber;
+}
+
+////////////////////////////////////////////////////////////////////
+//     Function: SteamNetworkMessageBuffer::get_lane
+//       Access: Published
+//  Description: Returns the lane the message was sent on.
+////////////////////////////////////////////////////////////////////
+int SteamNetworkMessageBuffer::get_lane() const {
+    return _message->m_idxLane;
+}
+
+////////////////////////////////////////////////////////////////////
+//     Function: SteamNetworkMessageBuffer::get_datagram
+//       Access: Published
+//  Description: Returns a copy of the payload as a Datagram, for
+//               code that wants a DatagramIterator.
+////////////////////////////////////////////////////////////////////
+Datagram SteamNetworkMessageBuffer::get_datagram() const {
+    return Datagram(_message->m_pData, _message->m_cbSize);
+}
+
+////////////////////////////////////////////////////////////////////
+//     Function: SteamNetworkMessageBuffer::__getbuffer__
+//       Access: Published
+//  Description: Exposes the payload as a read-only, one-dimensional
+//               byte buffer without copying it.
+////////////////////////////////////////////////////////////////////
+int SteamNetworkMessageBuffer::__getbuffer__(PyObject *self, Py_buffer *view, int flags) const {
+    return PyBuffer_FillInfo(view, self, _message->m_pData, _message->m_cbSize, 1, flags);
+}
+
+#endif  // CPPPARSER
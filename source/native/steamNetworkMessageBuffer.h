@@ -0,0 +1,52 @@
+///
+// Copyright (c) 2026, Digital Descent, LLC. All rights reserved.
+//
+
+#pragma once
+
+#include "steamConstants_bindings.h"
+#include "steamPython_bindings.h"
+
+#include "referenceCount.h"
+#include "datagram.h"
+
+////////////////////////////////////////////////////////////////////
+//       Class : SteamNetworkMessageBuffer
+// Description : A received Valve GameSockets message that keeps the
+//               underlying Steam message alive instead of copying
+//               it into a Datagram.  The payload is exposed through
+//               the Python buffer protocol, so memoryview() and
+//               numpy.frombuffer() read it in place.  The Steam
+//               message is released when this object is destroyed.
+////////////////////////////////////////////////////////////////////
+class EXPORT_CLASS SteamNetworkMessageBuffer : public ReferenceCount {
+#ifndef CPPPARSER
+public:
+  explicit SteamNetworkMessageBuffer(SteamNetworkingMessage_t *message);
+#endif
+
+PUBLISHED:
+  virtual ~SteamNetworkMessageBuffer();
+
+  SteamNetworkConnectionHandle get_connection() const;
+  size_t get_size() const;
+  int64_t get_message_number() const;
+  int get_lane() const;
+  Datagram get_datagram() const;
+
+  int __getbuffer__(PyObject *self, Py_buffer *view, int flags) const;
+
+  MAKE_PROPERTY(connection, get_connection);
+  MAKE_PROPERTY(size, get_size);
+  MAKE_PROPERTY(message_number, get_message_number);
+  MAKE_PROPERTY(lane, get_lane);
+  MAKE_PROPERTY(dg, get_datagram);
+
+private:
+  SteamNetworkMessageBuffer(const SteamNetworkMessageBuffer &copy) = delete;
+  SteamNetworkMessageBuffer &operator = (const SteamNetworkMessageBuffer &copy) = delete;
+
+#ifndef CPPPARSER
+  SteamNetworkingMessage_t *_message;
+#endif
+};
@@ -0,0 +1,348 @@
+///
+// Copyright (c) 2026, Digital Descent, LLC. All rights reserved.
+//
+
+#include "steamNetworkMessageBuilder.h"
+
+// Guard everything below from interrogate's parser.
+#ifndef CPPPARSER
+#include "steamConstants_bindings.h"
+#include "steamEnums_bindings.h"
+#include <steam/isteamnetworkingutils.h>
+#include <string.h>
+
+namespace {
+
+////////////////////////////////////////////////////////////////////
+//     Function: write_le
+//  Description: Stores the low size bytes of value at data, least
+//               significant byte first, matching Datagram.
+////////////////////////////////////////////////////////////////////
+void write_le(unsigned char *data, uint64_t value, size_t size) {
+    for (size_t i = 0; i < size; ++i) {
+        data[i] = static_cast<unsigned char>(value >> (8 * i));
+    }
+}
+
+} // namespace
+
+////////////////////////////////////////////////////////////////////
+//     Function: SteamNetworkMessageBuilder::SteamNetworkMessageBuilder
+//       Access: Published
+//  Description: Allocates a Steam message of capacity bytes for the
+//               given connection.  The whole capacity is sent unless
+//               the length is reduced with set_length.  If Steam
+//               cannot allocate the message, is_valid() is false.
+////////////////////////////////////////////////////////////////////
+SteamNetworkMessageBuilder::SteamNetworkMessageBuilder(SteamNetworkConnectionHandle connection, size_t capacity,
+                                                       int send_flags, int lane) :
+    _message(nullptr),
+    _capacity(0),
+    _offset(0),
+    _num_exports(0) {
+    ISteamNetworkingUtils *utils = SteamNetworkingUtils();
+    if (utils == nullptr) {
+        steam_cat.error() << "SteamNetworkingUtils interface not initialised." << std::endl;
+        return;
+    }
+
+    _message = utils->AllocateMessage(static_cast<int>(capacity));
+    if (_message == nullptr) {
+        return;
+    }
+    _message->m_conn = static_cast<HSteamNetConnection>(connection);
+    _message->m_nFlags = send_flags;
+    _message->m_idxLane = static_cast<uint16>(lane);
+    _capacity = capacity;
+}
+
+////////////////////////////////////////////////////////////////////
+//     Function: SteamNetworkMessageBuilder::~SteamNetworkMessageBuilder
+//       Access: Published, Virtual
+//  Description: Releases the message if it was never sent.
+////////////////////////////////////////////////////////////////////
+SteamNetworkMessageBuilder::~SteamNetworkMessageBuilder() {
+    clear();
+}
+
+////////////////////////////////////////////////////////////////////
+//     Function: SteamNetworkMessageBuilder::is_valid
+//       Access: Published
+//  Description: Returns true if the builder holds a message that has
+//               not been sent yet.
+////////////////////////////////////////////////////////////////////
+bool SteamNetworkMessageBuilder::is_valid() const {
+    return _message != nullptr;
+}
+
+////////////////////////////////////////////////////////////////////
+//     Function: SteamNetworkMessageBuilder::get_connection
+//       Access: Published
+////////////////////////////////////////////////////////////////////
+SteamNetworkConnectionHandle SteamNetworkMessageBuilder::get_connection() const {
+    if (_message == nullptr) return INVALID_STEAM_NETWORK_CONNECTION_HANDLE;
+    return static_cast<SteamNetworkConnectionHandle>(_message->m_conn);
+}
+
+////////////////////////////////////////////////////////////////////
+//     Function: SteamNetworkMessageBuilder::get_send_flags
+//       Access: Published
+////////////////////////////////////////////////////////////////////
+int SteamNetworkMessageBuilder::get_send_flags() const {
+    if (_message == nullptr) return 0;
+    return _message->m_nFlags;
+}
+
+////////////////////////////////////////////////////////////////////
+//     Function: SteamNetworkMessageBuilder::get_lane
+//       Access: Published
+////////////////////////////////////////////////////////////////////
+int SteamNetworkMessageBuilder::get_lane() const {
+    if (_message == nullptr) return 0;
+    return _message->m_idxLane;
+}
+
+////////////////////////////////////////////////////////////////////
+//     Function: SteamNetworkMessageBuilder::get_capacity
+//       Access: Published
+//  Description: Returns the size of the allocated buffer.
+////////////////////////////////////////////////////////////////////
+size_t SteamNetworkMessageBuilder::get_capacity() const {
+    return _capacity;
+}
+
+////////////////////////////////////////////////////////////////////
+//     Function: SteamNetworkMessageBuilder::set_length
+//       Access: Published
+//  Description: Sets the number of bytes that will be sent, which
+//               may not exceed the capacity.  Useful when the
+//               payload turned out smaller than allocated.
+////////////////////////////////////////////////////////////////////
+void SteamNetworkMessageBuilder::set_length(size_t length) {
+    nassertv(_message != nullptr);
+    nassertv(length <= _capacity);
+    _message->m_cbSize = static_cast<int>(length);
+}
+
+////////////////////////////////////////////////////////////////////
+//     Function: SteamNetworkMessageBuilder::get_length
+//       Access: Published
+//  Description: Returns the number of bytes that will be sent.
+////////////////////////////////////////////////////////////////////
+size_t SteamNetworkMessageBuilder::get_length() const {
+    if (_message == nullptr) return 0;
+    return static_cast<size_t>(_message->m_cbSize);
+}
+
+////////////////////////////////////////////////////////////////////
+//     Function: SteamNetworkMessageBuilder::set_offset
+//       Access: Published
+//  Description: Moves the cursor the add_* methods write at.
+////////////////////////////////////////////////////////////////////
+void SteamNetworkMessageBuilder::set_offset(size_t offset) {
+    nassertv(offset <= _capacity);
+    _offset = offset;
+}
+
+////////////////////////////////////////////////////////////////////
+//     Function: SteamNetworkMessageBuilder::get_offset
+//       Access: Published
+//  Description: Returns the cursor the add_* methods write at; after
+//               filling the message with them, this is the length
+//               to pass to set_length.
+////////////////////////////////////////////////////////////////////
+size_t SteamNetworkMessageBuilder::get_offset() const {
+    return _offset;
+}
+
+////////////////////////////////////////////////////////////////////
+//     Function: SteamNetworkMessageBuilder::add_bool
+//       Access: Published
+//  Description: Writes the value at the cursor and advances it.
+//               Returns false if it does not fit.
+////////////////////////////////////////////////////////////////////
+bool SteamNetworkMessageBuilder::add_bool(bool value) {
+    return add_uint8(value ? 1 : 0);
+}
+
+////////////////////////////////////////////////////////////////////
+//     Function: SteamNetworkMessageBuilder::add_int8
+//       Access: Published
+////////////////////////////////////////////////////////////////////
+bool SteamNetworkMessageBuilder::add_int8(int8_t value) {
+    return add_uint8(static_cast<uint8_t>(value));
+}
+
+////////////////////////////////////////////////////////////////////
+//     Function: SteamNetworkMessageBuilder::add_uint8
+//       Access: Published
+////////////////////////////////////////////////////////////////////
+bool SteamNetworkMessageBuilder::add_uint8(uint8_t value) {
+    return append_data(&value, 1);
+}
+
+////////////////////////////////////////////////////////////////////
+//     Function: SteamNetworkMessageBuilder::add_int16
+//       Access: Published
+////////////////////////////////////////////////////////////////////
+bool SteamNetworkMessageBuilder::add_int16(int16_t value) {
+    return add_uint16(static_cast<uint16_t>(value));
+}
+
+////////////////////////////////////////////////////////////////////
+//     Function: SteamNetworkMessageBuilder::add_uint16
+//       Access: Published
+////////////////////////////////////////////////////////////////////
+bool SteamNetworkMessageBuilder::add_uint16(uint16_t value) {
+    unsigned char bytes[2];
+    write_le(bytes, value, sizeof(bytes));
+    return append_data(bytes, sizeof(bytes));
+}
+
+////////////////////////////////////////////////////////////////////
+//     Function: SteamNetworkMessageBuilder::add_int32
+//       Access: Published
+////////////////////////////////////////////////////////////////////
+bool SteamNetworkMessageBuilder::add_int32(int32_t value) {
+    return add_uint32(static_cast<uint32_t>(value));
+}
+
+////////////////////////////////////////////////////////////////////
+//     Function: SteamNetworkMessageBuilder::add_uint32
+//       Access: Published
+////////////////////////////////////////////////////////////////////
+bool SteamNetworkMessageBuilder::add_uint32(uint32_t value) {
+    unsigned char bytes[4];
+    write_le(bytes, value, sizeof(bytes));
+    return append_data(bytes, sizeof(bytes));
+}
+
+////////////////////////////////////////////////////////////////////
+//     Function: SteamNetworkMessageBuilder::add_int64
+//       Access: Published
+////////////////////////////////////////////////////////////////////
+bool SteamNetworkMessageBuilder::add_int64(int64_t value) {
+    return add_uint64(static_cast<uint64_t>(value));
+}
+
+////////////////////////////////////////////////////////////////////
+//     Function: SteamNetworkMessageBuilder::add_uint64
+//       Access: Published
+////////////////////////////////////////////////////////////////////
+bool SteamNetworkMessageBuilder::add_uint64(uint64_t value) {
+    unsigned char bytes[8];
+    write_le(bytes, value, sizeof(bytes));
+    return append_data(bytes, sizeof(bytes));
+}
+
+////////////////////////////////////////////////////////////////////
+//     Function: SteamNetworkMessageBuilder::add_float32
+//       Access: Published
+////////////////////////////////////////////////////////////////////
+bool SteamNetworkMessageBuilder::add_float32(float value) {
+    uint32_t bits;
+    memcpy(&bits, &value, sizeof(bits));
+    return add_uint32(bits);
+}
+
+////////////////////////////////////////////////////////////////////
+//     Function: SteamNetworkMessageBuilder::add_float64
+//       Access: Published
+////////////////////////////////////////////////////////////////////
+bool SteamNetworkMessageBuilder::add_float64(double value) {
+    uint64_t bits;
+    memcpy(&bits, &value, sizeof(bits));
+    return add_uint64(bits);
+}
+
+////////////////////////////////////////////////////////////////////
+//     Function: SteamNetworkMessageBuilder::append_data
+//       Access: Published
+//  Description: Copies the bytes in at the cursor and advances it.
+////////////////////////////////////////////////////////////////////
+bool SteamNetworkMessageBuilder::append_data(const vector_uchar &data) {
+    return append_data(data.data(), data.size());
+}
+
+////////////////////////////////////////////////////////////////////
+//     Function: SteamNetworkMessageBuilder::append_data
+//       Access: Public
+//  Description: Copies size bytes in at the cursor and advances it.
+//               Returns false if they do not fit.
+////////////////////////////////////////////////////////////////////
+bool SteamNetworkMessageBuilder::append_data(const void *data, size_t size) {
+    nassertr(_message != nullptr, false);
+    if (size > _capacity - _offset) {
+        return false;
+    }
+    if (size > 0) {
+        memcpy(static_cast<unsigned char *>(_message->m_pData) + _offset, data, size);
+    }
+    _offset += size;
+    return true;
+}
+
+////////////////////////////////////////////////////////////////////
+//     Function: SteamNetworkMessageBuilder::clear
+//       Access: Published
+//  Description: Releases the message without sending it.
+////////////////////////////////////////////////////////////////////
+void SteamNetworkMessageBuilder::clear() {
+    SteamNetworkingMessage_t *msg = release_message();
+    if (msg != nullptr) {
+        msg->Release();
+    }
+}
+
+////////////////////////////////////////////////////////////////////
+//     Function: SteamNetworkMessageBuilder::__getbuffer__
+//       Access: Published
+//  Description: Exposes the whole allocated buffer as a writable,
+//               one-dimensional byte buffer.
+////////////////////////////////////////////////////////////////////
+int SteamNetworkMessageBuilder::__getbuffer__(PyObject *self, Py_buffer *view, int flags) {
+    if (_message == nullptr) {
+        PyErr_SetString(PyExc_BufferError, "SteamNetworkMessageBuilder has already been sent");
+        return -1;
+    }
+    if (PyBuffer_FillInfo(view, self, _message->m_pData, static_cast<Py_ssize_t>(_capacity), 0, flags) != 0) {
+        return -1;
+    }
+    ++_num_exports;
+    return 0;
+}
+
+////////////////////////////////////////////////////////////////////
+//     Function: SteamNetworkMessageBuilder::__releasebuffer__
+//       Access: Published
+//  Description: Called when a buffer view is released.
+////////////////////////////////////////////////////////////////////
+void SteamNetworkMessageBuilder::__releasebuffer__(PyObject *self, Py_buffer *view) const {
+    --_num_exports;
+}
+
+////////////////////////////////////////////////////////////////////
+//     Function: SteamNetworkMessageBuilder::release_message
+//       Access: Private
+//  Description: Gives up ownership of the message and returns it,
+//               or returns nullptr if buffer views into it are still
+//               alive, since they would be left dangling.
+////////////////////////////////////////////////////////////////////
+SteamNetworkingMessage_t *SteamNetworkMessageBuilder::release_message() {
+    if (_message == nullptr) {
+        return nullptr;
+    }
+    if (_num_exports > 0) {
+        steam_cat.error() << "SteamNetworkMessageBuilder still has " << _num_exports
+                          << " buffer view(s) open." << std::endl;
+        return nullptr;
+    }
+
+    SteamNetworkingMessage_t *msg = _message;
+    _message = nullptr;
+    _capacity = 0;
+    _offset = 0;
+    return msg;
+}
+
+#endif  // CPPPARSER
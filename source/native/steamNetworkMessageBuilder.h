@@ -0,0 +1,88 @@
+///
+// Copyright (c) 2026, Digital Descent, LLC. All rights reserved.
+//
+
+#pragma once
+
+#include "config_module.h"
+#include "steamConstants_bindings.h"
+#include "steamPython_bindings.h"
+
+#include "referenceCount.h"
+#include "datagram.h"
+
+////////////////////////////////////////////////////////////////////
+//       Class : SteamNetworkMessageBuilder
+// Description : An outgoing message written in place, straight into
+//               a buffer allocated by Steam.  The payload is exposed
+//               as a writable buffer, so struct.pack_into(),
+//               memoryview slicing and numpy.frombuffer() can fill
+//               it without an intermediate Datagram, and the add_*
+//               methods append little-endian values at a cursor just
+//               like Datagram does.  SteamNetworkManager::send_message
+//               hands the buffer to Steam without copying it; after
+//               that the builder is empty.  Every buffer view must be
+//               released before sending.
+////////////////////////////////////////////////////////////////////
+class EXPORT_CLASS SteamNetworkMessageBuilder : public ReferenceCount {
+PUBLISHED:
+  SteamNetworkMessageBuilder(SteamNetworkConnectionHandle connection, size_t capacity, int send_flags,
+                             int lane = 0);
+  virtual ~SteamNetworkMessageBuilder();
+
+  bool is_valid() const;
+  SteamNetworkConnectionHandle get_connection() const;
+  int get_send_flags() const;
+  int get_lane() const;
+  size_t get_capacity() const;
+
+  void set_length(size_t length);
+  size_t get_length() const;
+
+  void set_offset(size_t offset);
+  size_t get_offset() const;
+
+  bool add_bool(bool value);
+  bool add_int8(int8_t value);
+  bool add_uint8(uint8_t value);
+  bool add_int16(int16_t value);
+  bool add_uint16(uint16_t value);
+  bool add_int32(int32_t value);
+  bool add_uint32(uint32_t value);
+  bool add_int64(int64_t value);
+  bool add_uint64(uint64_t value);
+  bool add_float32(float value);
+  bool add_float64(double value);
+  bool append_data(const vector_uchar &data);
+
+  void clear();
+
+  int __getbuffer__(PyObject *self, Py_buffer *view, int flags);
+  void __releasebuffer__(PyObject *self, Py_buffer *view) const;
+
+  MAKE_PROPERTY(valid, is_valid);
+  MAKE_PROPERTY(connection, get_connection);
+  MAKE_PROPERTY(send_flags, get_send_flags);
+  MAKE_PROPERTY(lane, get_lane);
+  MAKE_PROPERTY(capacity, get_capacity);
+  MAKE_PROPERTY(length, get_length, set_length);
+  MAKE_PROPERTY(offset, get_offset, set_offset);
+
+public:
+  bool append_data(const void *data, size_t size);
+
+private:
+  SteamNetworkMessageBuilder(const SteamNetworkMessageBuilder &copy) = delete;
+  SteamNetworkMessageBuilder &operator = (const SteamNetworkMessageBuilder &copy) = delete;
+
+#ifndef CPPPARSER
+  SteamNetworkingMessage_t *release_message();
+
+  SteamNetworkingMessage_t *_message;
+#endif
+  size_t _capacity;
+  size_t _offset;
+  mutable int _num_exports;
+
+  friend class SteamNetworkManager;
+};
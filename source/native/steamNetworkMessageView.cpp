@@ -0,0 +1,175 @@
+///
+// Copyright (c) 2026, Digital Descent, LLC. All rights reserved.
+//
+
+#include "steamNetworkMessageView.h"
+#include "steamNetworkMessageBatch.h"
+
+// Guard everything below from interrogate's parser.
+#ifndef CPPPARSER
+
+////////////////////////////////////////////////////////////////////
+//     Function: SteamNetworkMessageView::SteamNetworkMessageView
+//       Access: Public
+//  Description: Creates a view of the nth message of the batch.
+////////////////////////////////////////////////////////////////////
+SteamNetworkMessageView::SteamNetworkMessageView(const SteamNetworkMessageBatch *batch, size_t n) :
+    _batch(batch),
+    _index(n),
+    _generation(batch->_generation) {
+}
+
+////////////////////////////////////////////////////////////////////
+//     Function: SteamNetworkMessageView::~SteamNetworkMessageView
+//       Access: Published, Virtual
+////////////////////////////////////////////////////////////////////
+SteamNetworkMessageView::~SteamNetworkMessageView() {
+}
+
+////////////////////////////////////////////////////////////////////
+//     Function: SteamNetworkMessageView::is_valid
+//       Access: Published
+//  Description: Returns false once the batch has been cleared or
+//               refilled since the view was made.
+////////////////////////////////////////////////////////////////////
+bool SteamNetworkMessageView::is_valid() const {
+    return _batch->_generation == _generation && _index < _batch->_messages.size();
+}
+
+////////////////////////////////////////////////////////////////////
+//     Function: SteamNetworkMessageView::get_connection
+//       Access: Published
+//  Description: Returns the connection the message arrived on.
+////////////////////////////////////////////////////////////////////
+SteamNetworkConnectionHandle SteamNetworkMessageView::get_connection() const {
+    nassertr(is_valid(), INVALID_STEAM_NETWORK_CONNECTION_HANDLE);
+    return static_cast<SteamNetworkConnectionHandle>(_batch->_messages[_index]->m_conn);
+}
+
+////////////////////////////////////////////////////////////////////
+//     Function: SteamNetworkMessageView::get_lane
+//       Access: Published
+//  Description: Returns the lane the message was sent on.
+////////////////////////////////////////////////////////////////////
+int SteamNetworkMessageView::get_lane() const {
+    nassertr(is_valid(), 0);
+    return _batch->_messages[_index]->m_idxLane;
+}
+
+////////////////////////////////////////////////////////////////////
+//     Function: SteamNetworkMessageView::get_message_number
+//       Access: Published
+//  Description: Returns the sender-assigned message number.
+////////////////////////////////////////////////////////////////////
+int64_t SteamNetworkMessageView::get_message_number() const {
+    nassertr(is_valid(), 0);
+    return _batch->_messages[_index]->m_nMessageNumber;
+}
+
+////////////////////////////////////////////////////////////////////
+//     Function: SteamNetworkMessageView::get_remote_steam_id
+//       Access: Published
+//  Description: Returns the Steam ID of the sender.
+////////////////////////////////////////////////////////////////////
+uint64_t SteamNetworkMessageView::get_remote_steam_id() const {
+    nassertr(is_valid(), 0);
+    return _batch->_messages[_index]->m_identityPeer.GetSteamID64();
+}
+
+////////////////////////////////////////////////////////////////////
+//     Function: SteamNetworkMessageView::get_channel
+//       Access: Published
+//  Description: Returns the channel the message was received on,
+//               for batches filled by SteamNetworkMessagesManager.
+////////////////////////////////////////////////////////////////////
+int SteamNetworkMessageView::get_channel() const {
+    nassertr(is_valid(), 0);
+    return _batch->_messages[_index]->m_nChannel;
+}
+
+////////////////////////////////////////////////////////////////////
+//     Function: SteamNetworkMessageView::get_size
+//       Access: Published
+//  Description: Returns the payload size in bytes.
+////////////////////////////////////////////////////////////////////
+size_t SteamNetworkMessageView::get_size() const {
+    nassertr(is_valid(), 0);
+    const unsigned char *data;
+    size_t size;
+    _batch->get_payload(_index, data, size);
+    return size;
+}
+
+////////////////////////////////////////////////////////////////////
+//     Function: SteamNetworkMessageView::get_datagram
+//       Access: Published
+//  Description: Returns the payload as a Datagram.  The payload is
+//               copied the first time any view of the message asks
+//               for it; the copy is cached in the batch and shared
+//               from then on.
+////////////////////////////////////////////////////////////////////
+Datagram SteamNetworkMessageView::get_datagram() const {
+    nassertr(is_valid(), Datagram());
+    return _batch->get_cached_datagram(_index);
+}
+
+////////////////////////////////////////////////////////////////////
+//     Function: SteamNetworkMessageView::get_datagram_iterator
+//       Access: Published
+//  Description: Returns an iterator over the payload, positioned at
+//               its start.  It shares the payload copy cached in the
+//               batch, and keeps that copy alive itself, so it stays
+//               readable after the view and the batch are gone or
+//               the batch is cleared.
+////////////////////////////////////////////////////////////////////
+SteamNetworkDatagramIterator SteamNetworkMessageView::get_datagram_iterator() const {
+    nassertr(is_valid(), SteamNetworkDatagramIterator());
+    return SteamNetworkDatagramIterator(_batch->get_cached_datagram(_index));
+}
+
+////////////////////////////////////////////////////////////////////
+//     Function: SteamNetworkMessageView::copy_to
+//       Access: Published
+//  Description: Copies the message into the given message, for code
+//               that needs to keep it beyond the batch's lifetime.
+//               Returns false if the view is no longer valid.
+////////////////////////////////////////////////////////////////////
+bool SteamNetworkMessageView::copy_to(SteamNetworkMessage &message) const {
+    nassertr(is_valid(), false);
+    return _batch->copy_message(_index, message);
+}
+
+////////////////////////////////////////////////////////////////////
+//     Function: SteamNetworkMessageView::__getbuffer__
+//       Access: Published
+//  Description: Exposes the payload as a read-only, one-dimensional
+//               byte buffer without copying it.  The payload stays
+//               allocated until the buffer is released, even if the
+//               batch is cleared first.
+////////////////////////////////////////////////////////////////////
+int SteamNetworkMessageView::__getbuffer__(PyObject *self, Py_buffer *view, int flags) const {
+    if (!is_valid()) {
+        PyErr_SetString(PyExc_BufferError, "SteamNetworkMessageView's batch has been cleared");
+        return -1;
+    }
+
+    const unsigned char *data;
+    size_t size;
+    _batch->get_payload(_index, data, size);
+    if (PyBuffer_FillInfo(view, self, (void *)data, static_cast<Py_ssize_t>(size), 1, flags) != 0) {
+        return -1;
+    }
+    ++_batch->_num_exports;
+    return 0;
+}
+
+////////////////////////////////////////////////////////////////////
+//     Function: SteamNetworkMessageView::__releasebuffer__
+//       Access: Published
+//  Description: Called when a buffer view is released.
+////////////////////////////////////////////////////////////////////
+void SteamNetworkMessageView::__releasebuffer__(PyObject *self, Py_buffer *view) const {
+    _batch->release_retired();
+}
+
+#endif  // CPPPARSER
@@ -0,0 +1,76 @@
+///
+// Copyright (c) 2026, Digital Descent, LLC. All rights reserved.
+//
+
+#pragma once
+
+#include "steamConstants_bindings.h"
+#include "steamPython_bindings.h"
+
+#include "referenceCount.h"
+#include "pointerTo.h"
+#include "datagram.h"
+#include "datagramIterator.h"
+#include "steamNetworkMessage.h"
+#include "steamNetworkDatagramIterator.h"
+
+class SteamNetworkMessageBatch;
+
+////////////////////////////////////////////////////////////////////
+//       Class : SteamNetworkMessageView
+// Description : One message of a SteamNetworkMessageBatch, returned
+//               by indexing or iterating over the batch.  A view is
+//               a handle onto the batch, not a copy: the metadata
+//               is read straight from the Steam message, and the
+//               payload is exposed through the buffer protocol
+//               without copying it.  The payload is only copied the
+//               first time dg or dgi is read, into a Datagram the
+//               batch caches for the rest of its lifetime.
+//
+//               A view keeps its batch alive, but it is only valid
+//               until the batch is cleared or refilled; after that
+//               is_valid() returns false.  A buffer exported from a
+//               view stays readable until it is released, and a
+//               Datagram or iterator read from dg or dgi keeps its
+//               own reference to the payload, even if the batch is
+//               cleared in the meantime.
+////////////////////////////////////////////////////////////////////
+class EXPORT_CLASS SteamNetworkMessageView : public ReferenceCount {
+public:
+  SteamNetworkMessageView(const SteamNetworkMessageBatch *batch, size_t n);
+
+PUBLISHED:
+  virtual ~SteamNetworkMessageView();
+
+  bool is_valid() const;
+  SteamNetworkConnectionHandle get_connection() const;
+  int get_lane() const;
+  int64_t get_message_number() const;
+  uint64_t get_remote_steam_id() const;
+  int get_channel() const;
+  size_t get_size() const;
+  Datagram get_datagram() const;
+  SteamNetworkDatagramIterator get_datagram_iterator() const;
+  bool copy_to(SteamNetworkMessage &message) const;
+
+  int __getbuffer__(PyObject *self, Py_buffer *view, int flags) const;
+  void __releasebuffer__(PyObject *self, Py_buffer *view) const;
+
+  MAKE_PROPERTY(valid, is_valid);
+  MAKE_PROPERTY(connection, get_connection);
+  MAKE_PROPERTY(lane, get_lane);
+  MAKE_PROPERTY(message_number, get_message_number);
+  MAKE_PROPERTY(remote_steam_id, get_remote_steam_id);
+  MAKE_PROPERTY(channel, get_channel);
+  MAKE_PROPERTY(size, get_size);
+  MAKE_PROPERTY(dg, get_datagram);
+  MAKE_PROPERTY(dgi, get_datagram_iterator);
+
+private:
+  SteamNetworkMessageView(const SteamNetworkMessageView &copy) = delete;
+  SteamNetworkMessageView &operator = (const SteamNetworkMessageView &copy) = delete;
+
+  CPT(SteamNetworkMessageBatch) _batch;
+  size_t _index;
+  uint64_t _generation;
+};
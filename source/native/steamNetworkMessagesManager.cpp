@@ -0,0 +1,396 @@
+///
+// Copyright (c) 2026, Digital Descent, LLC. All rights reserved.
+//
+
+#include "steamNetworkMessagesManager.h"
+
+// Guard everything below from interrogate's parser.
+#ifndef CPPPARSER
+#include "steamConstants_bindings.h"
+#include "steamEnums_bindings.h"
+#include <steam/isteamnetworkingsockets.h>
+#include <steam/isteamnetworkingutils.h>
+#include <algorithm>
+
+TypeHandle SteamNetworkMessagesManager::_type_handle;
+SteamNetworkMessagesManager *SteamNetworkMessagesManager::_global_ptr = nullptr;
+
+namespace {
+
+////////////////////////////////////////////////////////////////////
+//     Function: make_identity
+//  Description: Returns the networking identity of a Steam ID.
+////////////////////////////////////////////////////////////////////
+SteamNetworkingIdentity make_identity(uint64_t steam_id) {
+    SteamNetworkingIdentity identity;
+    identity.SetSteamID64(steam_id);
+    return identity;
+}
+
+} // namespace
+
+////////////////////////////////////////////////////////////////////
+//     Function: SteamNetworkMessagesManager::SteamNetworkMessagesManager
+//       Access: Private
+//  Description: Hooks up the session callbacks.  Session state is
+//               global to the process, so there is only ever the
+//               one instance returned by get_global_ptr().
+////////////////////////////////////////////////////////////////////
+SteamNetworkMessagesManager::SteamNetworkMessagesManager() :
+    _auto_accept_sessions(false) {
+    _interface = SteamNetworkingMessages();
+    if (_interface == nullptr) {
+        steam_cat.error() << "Failed to get SteamNetworkingMessages interface." << std::endl;
+    }
+
+    ISteamNetworkingUtils *utils = SteamNetworkingUtils();
+    if (utils == nullptr) {
+        steam_cat.error() << "SteamNetworkingUtils interface not initialised." << std::endl;
+        return;
+    }
+    utils->SetGlobalCallback_MessagesSessionRequest(on_session_request);
+    utils->SetGlobalCallback_MessagesSessionFailed(on_session_failed);
+}
+
+////////////////////////////////////////////////////////////////////
+//     Function: SteamNetworkMessagesManager::~SteamNetworkMessagesManager
+//       Access: Published, Virtual
+//  Description: Unhooks the session callbacks.
+////////////////////////////////////////////////////////////////////
+SteamNetworkMessagesManager::~SteamNetworkMessagesManager() {
+    ISteamNetworkingUtils *utils = SteamNetworkingUtils();
+    if (utils != nullptr) {
+        utils->SetGlobalCallback_MessagesSessionRequest(nullptr);
+        utils->SetGlobalCallback_MessagesSessionFailed(nullptr);
+    }
+    if (_global_ptr == this) {
+        _global_ptr = nullptr;
+    }
+}
+
+////////////////////////////////////////////////////////////////////
+//     Function: SteamNetworkMessagesManager::get_global_ptr
+//       Access: Published, Static
+//  Description: Returns the global SteamNetworkMessagesManager,
+//               creating it on first use.
+////////////////////////////////////////////////////////////////////
+SteamNetworkMessagesManager *SteamNetworkMessagesManager::get_global_ptr() {
+    if (!_global_ptr) {
+      _global_ptr = new SteamNetworkMessagesManager();
+    }
+
+    return _global_ptr;
+}
+
+////////////////////////////////////////////////////////////////////
+//     Function: SteamNetworkMessagesManager::send_message_to_user
+//       Access: Published
+//  Description: Sends the datagram to the peer with the given Steam
+//               ID on the given channel, opening a session with
+//               them if there is none yet.  Returns the EResult;
+//               k_EResultOK on success.
+////////////////////////////////////////////////////////////////////
+int SteamNetworkMessagesManager::send_message_to_user(uint64_t steam_id, const Datagram &dg, int send_flags, int channel) {
+    if (_interface == nullptr) return k_EResultNoConnection;
+
+    return _interface->SendMessageToUser(make_identity(steam_id), dg.get_data(),
+                                         static_cast<uint32>(dg.get_length()), send_flags, channel);
+}
+
+////////////////////////////////////////////////////////////////////
+//     Function: SteamNetworkMessagesManager::send_message_to_users
+//       Access: Published
+//  Description: Sends the datagram to every peer in the sequence of
+//               Steam IDs, e.g. the rest of a P2P mesh.  Returns the
+//               number of peers it was queued for.
+////////////////////////////////////////////////////////////////////
+int SteamNetworkMessagesManager::send_message_to_users(PyObject *steam_ids, const Datagram &dg,
+                                                       int send_flags, int channel) {
+    if (_interface == nullptr) return 0;
+
+    PyObject *id_seq = PySequence_Fast(steam_ids, "steam_ids must be a sequence");
+    if (id_seq == nullptr) {
+        return 0;
+    }
+
+    Py_ssize_t num_ids = PySequence_Fast_GET_SIZE(id_seq);
+    pvector<uint64_t> ids(num_ids);
+    for (Py_ssize_t i = 0; i < num_ids; ++i) {
+        ids[i] = (uint64_t)PyLong_AsUnsignedLongLong(PySequence_Fast_GET_ITEM(id_seq, i));
+    }
+    Py_DECREF(id_seq);
+    if (PyErr_Occurred()) {
+        return 0;
+    }
+
+    int sent = 0;
+    for (uint64_t steam_id : ids) {
+        if (_interface->SendMessageToUser(make_identity(steam_id), dg.get_data(),
+                                          static_cast<uint32>(dg.get_length()), send_flags, channel) == k_EResultOK) {
+            ++sent;
+        }
+    }
+    return sent;
+}
+
+////////////////////////////////////////////////////////////////////
+//     Function: SteamNetworkMessagesManager::receive_message_on_channel
+//       Access: Published
+//  Description: Receives the next message on the channel into the
+//               given message, reusing its payload storage.  Returns
+//               false if no message is waiting.
+////////////////////////////////////////////////////////////////////
+bool SteamNetworkMessagesManager::receive_message_on_channel(int channel, SteamNetworkMessage &message) {
+    if (_interface == nullptr) return false;
+
+    SteamNetworkingMessage_t *msg = nullptr;
+    int count = _interface->ReceiveMessagesOnChannel(channel, &msg, 1);
+    if (count <= 0 || msg == nullptr) {
+        return false;
+    }
+
+    message.assign_data(msg->m_pData, static_cast<size_t>(msg->m_cbSize));
+    message.set_connection(INVALID_STEAM_NETWORK_CONNECTION_HANDLE);
+    message.set_lane(0);
+    message.set_message_number(msg->m_nMessageNumber);
+    message.set_remote_steam_id(msg->m_identityPeer.GetSteamID64());
+    message.set_channel(msg->m_nChannel);
+    msg->Release();
+    return true;
+}
+
+////////////////////////////////////////////////////////////////////
+//     Function: SteamNetworkMessagesManager::receive_messages_on_channel
+//       Access: Published
+//  Description: Refills the given batch with up to max_messages
+//               messages from the channel in a single native call.
+//               Messages previously held by the batch are released,
+//               but its storage is kept, so a batch reused every
+//               frame does not reallocate.  Returns the number of
+//               messages received.
+////////////////////////////////////////////////////////////////////
+int SteamNetworkMessagesManager::receive_messages_on_channel(int channel, SteamNetworkMessageBatch &batch,
+                                                             int max_messages) {
+    batch.clear();
+    if (_interface == nullptr || max_messages <= 0) return 0;
+
+    batch._messages.resize(max_messages);
+    int count = _interface->ReceiveMessagesOnChannel(channel, batch._messages.data(), max_messages);
+    batch._messages.resize(count > 0 ? count : 0);
+    return static_cast<int>(batch._messages.size());
+}
+
+////////////////////////////////////////////////////////////////////
+//     Function: SteamNetworkMessagesManager::receive_messages_on_channel
+//       Access: Published
+//  Description: Receives up to max_messages messages from the
+//               channel into a new batch.  The batch may be empty,
+//               but is never null.
+////////////////////////////////////////////////////////////////////
+PT(SteamNetworkMessageBatch) SteamNetworkMessagesManager::receive_messages_on_channel(int channel, int max_messages) {
+    PT(SteamNetworkMessageBatch) batch = new SteamNetworkMessageBatch;
+    receive_messages_on_channel(channel, *batch, max_messages);
+    return batch;
+}
+
+////////////////////////////////////////////////////////////////////
+//     Function: SteamNetworkMessagesManager::add_channel
+//       Access: Published
+//  Description: Adds a channel to the set read by receive_messages.
+//               Channels may only be changed from the main thread.
+////////////////////////////////////////////////////////////////////
+void SteamNetworkMessagesManager::add_channel(int channel) {
+    if (std::find(_channels.begin(), _channels.end(), channel) == _channels.end()) {
+        _channels.push_back(channel);
+    }
+}
+
+////////////////////////////////////////////////////////////////////
+//     Function: SteamNetworkMessagesManager::remove_channel
+//       Access: Published
+//  Description: Removes a channel from the set read by
+//               receive_messages.  Channels may only be changed from
+//               the main thread.
+////////////////////////////////////////////////////////////////////
+void SteamNetworkMessagesManager::remove_channel(int channel) {
+    _channels.erase(std::remove(_channels.begin(), _channels.end(), channel), _channels.end());
+}
+
+////////////////////////////////////////////////////////////////////
+//     Function: SteamNetworkMessagesManager::receive_messages
+//       Access: Published
+//  Description: Refills the given batch with up to max_messages
+//               messages from every channel added with add_channel,
+//               in the order the channels were added.  Each message
+//               records the channel it came from.  Returns the
+//               number of messages received.
+////////////////////////////////////////////////////////////////////
+int SteamNetworkMessagesManager::receive_messages(SteamNetworkMessageBatch &batch, int max_messages) {
+    batch.clear();
+    if (_interface == nullptr || max_messages <= 0) return 0;
+
+    batch._messages.resize(max_messages);
+    size_t total = 0;
+    for (int channel : _channels) {
+        if (total >= static_cast<size_t>(max_messages)) {
+            break;
+        }
+        int count = _interface->ReceiveMessagesOnChannel(channel, batch._messages.data() + total,
+                                                         max_messages - static_cast<int>(total));
+        if (count > 0) {
+            total += count;
+        }
+    }
+    batch._messages.resize(total);
+    return static_cast<int>(total);
+}
+
+////////////////////////////////////////////////////////////////////
+//     Function: SteamNetworkMessagesManager::accept_session
+//       Access: Published
+//  Description: Accepts the session a peer requested, signalled by
+//               a T_session_request event.  Messages from the peer
+//               are dropped until this is called, unless
+//               auto_accept_sessions is set.
+////////////////////////////////////////////////////////////////////
+bool SteamNetworkMessagesManager::accept_session(uint64_t steam_id) {
+    if (_interface == nullptr) return false;
+    return _interface->AcceptSessionWithUser(make_identity(steam_id));
+}
+
+////////////////////////////////////////////////////////////////////
+//     Function: SteamNetworkMessagesManager::close_session
+//       Access: Published
+//  Description: Closes every channel with the peer and drops any
+//               messages from them that are still queued.
+////////////////////////////////////////////////////////////////////
+bool SteamNetworkMessagesManager::close_session(uint64_t steam_id) {
+    if (_interface == nullptr) return false;
+    return _interface->CloseSessionWithUser(make_identity(steam_id));
+}
+
+////////////////////////////////////////////////////////////////////
+//     Function: SteamNetworkMessagesManager::close_channel
+//       Access: Published
+//  Description: Closes one channel with the peer; the session is
+//               closed once its last channel is.
+////////////////////////////////////////////////////////////////////
+bool SteamNetworkMessagesManager::close_channel(uint64_t steam_id, int channel) {
+    if (_interface == nullptr) return false;
+    return _interface->CloseChannelWithUser(make_identity(steam_id), channel);
+}
+
+////////////////////////////////////////////////////////////////////
+//     Function: SteamNetworkMessagesManager::get_session_state
+//       Access: Published
+//  Description: Returns the ESteamNetworkingConnectionState of the
+//               session with the peer, which is
+//               k_ESteamNetworkingConnectionState_None if there is
+//               no session.
+////////////////////////////////////////////////////////////////////
+int SteamNetworkMessagesManager::get_session_state(uint64_t steam_id) {
+    if (_interface == nullptr) return k_ESteamNetworkingConnectionState_None;
+    return _interface->GetSessionConnectionInfo(make_identity(steam_id), nullptr, nullptr);
+}
+
+////////////////////////////////////////////////////////////////////
+//     Function: SteamNetworkMessagesManager::set_auto_accept_sessions
+//       Access: Published
+//  Description: When set, session requests are accepted as soon as
+//               they arrive.  The T_session_request event is still
+//               queued.
+////////////////////////////////////////////////////////////////////
+void SteamNetworkMessagesManager::set_auto_accept_sessions(bool auto_accept) {
+    _auto_accept_sessions.store(auto_accept);
+}
+
+////////////////////////////////////////////////////////////////////
+//     Function: SteamNetworkMessagesManager::get_auto_accept_sessions
+//       Access: Published
+////////////////////////////////////////////////////////////////////
+bool SteamNetworkMessagesManager::get_auto_accept_sessions() const {
+    return _auto_accept_sessions.load();
+}
+
+////////////////////////////////////////////////////////////////////
+//     Function: SteamNetworkMessagesManager::run_callbacks
+//       Access: Published
+//  Description: Pumps the networking callbacks, which dispatches
+//               the session callbacks.  Not needed when something
+//               else, such as SteamShowBase, already pumps them.
+////////////////////////////////////////////////////////////////////
+void SteamNetworkMessagesManager::run_callbacks() {
+    ISteamNetworkingSockets *sockets = SteamNetworkingSockets();
+    if (sockets != nullptr) {
+        sockets->RunCallbacks();
+    }
+}
+
+////////////////////////////////////////////////////////////////////
+//     Function: SteamNetworkMessagesManager::get_next_event
+//       Access: Published
+//  Description: Returns and removes the oldest queued session
+//               event, or nullptr if there are none.
+////////////////////////////////////////////////////////////////////
+PT(SteamNetworkSessionEvent) SteamNetworkMessagesManager::get_next_event() {
+    std::lock_guard<std::mutex> guard(_events_lock);
+    if (_events.empty()) {
+        return nullptr;
+    }
+
+    PT(SteamNetworkSessionEvent) event = _events.front();
+    _events.pop_front();
+    return event;
+}
+
+////////////////////////////////////////////////////////////////////
+//     Function: SteamNetworkMessagesManager::get_num_pending_events
+//       Access: Published
+////////////////////////////////////////////////////////////////////
+size_t SteamNetworkMessagesManager::get_num_pending_events() const {
+    std::lock_guard<std::mutex> guard(_events_lock);
+    return _events.size();
+}
+
+////////////////////////////////////////////////////////////////////
+//     Function: SteamNetworkMessagesManager::queue_event
+//       Access: Private
+////////////////////////////////////////////////////////////////////
+void SteamNetworkMessagesManager::queue_event(SteamNetworkSessionEvent *event) {
+    std::lock_guard<std::mutex> guard(_events_lock);
+    _events.push_back(event);
+}
+
+////////////////////////////////////////////////////////////////////
+//     Function: SteamNetworkMessagesManager::on_session_request
+//       Access: Private, Static
+//  Description: Session request callback.  Accepts the session if
+//               auto_accept_sessions is set, and queues the event.
+////////////////////////////////////////////////////////////////////
+void SteamNetworkMessagesManager::on_session_request(SteamNetworkingMessagesSessionRequest_t *request) {
+    SteamNetworkMessagesManager *manager = _global_ptr;
+    if (manager == nullptr) return;
+
+    uint64_t steam_id = request->m_identityRemote.GetSteamID64();
+    if (manager->_auto_accept_sessions.load() && manager->_interface != nullptr) {
+        manager->_interface->AcceptSessionWithUser(request->m_identityRemote);
+    }
+    manager->queue_event(new SteamNetworkSessionEvent(SteamNetworkSessionEvent::T_session_request, steam_id));
+}
+
+////////////////////////////////////////////////////////////////////
+//     Function: SteamNetworkMessagesManager::on_session_failed
+//       Access: Private, Static
+//  Description: Session failure callback.  Queues the event.
+////////////////////////////////////////////////////////////////////
+void SteamNetworkMessagesManager::on_session_failed(SteamNetworkingMessagesSessionFailed_t *failure) {
+    SteamNetworkMessagesManager *manager = _global_ptr;
+    if (manager == nullptr) return;
+
+    const SteamNetConnectionInfo_t &info = failure->m_info;
+    manager->queue_event(new SteamNetworkSessionEvent(SteamNetworkSessionEvent::T_session_failed,
+                                                      info.m_identityRemote.GetSteamID64(),
+                                                      info.m_eState, info.m_eEndReason));
+}
+
+#endif  // CPPPARSER
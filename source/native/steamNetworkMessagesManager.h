@@ -0,0 +1,116 @@
+///
+// Copyright (c) 2026, Digital Descent, LLC. All rights reserved.
+//
+
+#pragma once
+
+#include "config_module.h"
+#include "steamConstants_bindings.h"
+#include "steamPython_bindings.h"
+
+#ifndef CPPPARSER
+#include <steam/isteamnetworkingmessages.h>
+#include <atomic>
+#include <mutex>
+#endif
+
+#include "pointerTo.h"
+#include "datagram.h"
+#include "pdeque.h"
+#include "pvector.h"
+#include "register_type.h"
+#include "steamNetworkMessage.h"
+#include "steamNetworkMessageBatch.h"
+#include "steamNetworkSessionEvent.h"
+#include "typedObject.h"
+
+////////////////////////////////////////////////////////////////////
+//       Class : SteamNetworkMessagesManager
+// Description : Connectionless messaging with ISteamNetworkingMessages.
+//               Messages are addressed to a peer's Steam ID and a
+//               channel number; Steam opens and closes the
+//               underlying sessions on demand, so there are no
+//               connection handles or state machines to drive.
+//               Session requests and failures are queued as
+//               SteamNetworkSessionEvents, in the same style as
+//               SteamNetworkManager's connection events.  The
+//               session callbacks are dispatched while the
+//               networking callbacks are pumped, e.g. by
+//               SteamShowBase or run_callbacks().
+////////////////////////////////////////////////////////////////////
+class EXPORT_CLASS SteamNetworkMessagesManager : public TypedObject {
+PUBLISHED:
+    virtual ~SteamNetworkMessagesManager();
+    static SteamNetworkMessagesManager *get_global_ptr();
+
+    int send_message_to_user(uint64_t steam_id, const Datagram &dg, int send_flags, int channel = 0);
+    int send_message_to_users(PyObject *steam_ids, const Datagram &dg, int send_flags,
+                              int channel = 0);
+
+    bool receive_message_on_channel(int channel, SteamNetworkMessage &message);
+    int receive_messages_on_channel(int channel, SteamNetworkMessageBatch &batch, int max_messages = 256);
+    PT(SteamNetworkMessageBatch) receive_messages_on_channel(int channel, int max_messages = 256);
+
+    void add_channel(int channel);
+    void remove_channel(int channel);
+    int receive_messages(SteamNetworkMessageBatch &batch, int max_messages = 256);
+
+    bool accept_session(uint64_t steam_id);
+    bool close_session(uint64_t steam_id);
+    bool close_channel(uint64_t steam_id, int channel);
+    int get_session_state(uint64_t steam_id);
+
+    void set_auto_accept_sessions(bool auto_accept);
+    bool get_auto_accept_sessions() const;
+
+    void run_callbacks();
+    PT(SteamNetworkSessionEvent) get_next_event();
+    size_t get_num_pending_events() const;
+
+    MAKE_PROPERTY(auto_accept_sessions, get_auto_accept_sessions, set_auto_accept_sessions);
+
+public:
+    static TypeHandle get_class_type() {
+        return _type_handle;
+    }
+    static void init_type() {
+        TypedObject::init_type();
+        register_type(_type_handle, "SteamNetworkMessagesManager",
+                      TypedObject::get_class_type());
+    }
+    virtual TypeHandle get_type() const {
+        return get_class_type();
+    }
+    virtual TypeHandle force_init_type() {
+        init_type();
+        return get_class_type();
+    }
+
+private:
+  SteamNetworkMessagesManager();
+
+#ifndef CPPPARSER
+  static void on_session_request(SteamNetworkingMessagesSessionRequest_t *request);
+  static void on_session_failed(SteamNetworkingMessagesSessionFailed_t *failure);
+  void queue_event(SteamNetworkSessionEvent *event);
+
+  ISteamNetworkingMessages *_interface;
+
+  // Session events, filled by the callbacks on whichever thread pumps
+  // them, so guarded by _events_lock.
+  pdeque<PT(SteamNetworkSessionEvent)> _events;
+  mutable std::mutex _events_lock;
+
+  // Read by the session request callback, on whichever thread pumps
+  // the callbacks.
+  std::atomic<bool> _auto_accept_sessions;
+#endif
+
+  // Channels read by receive_messages.  Not guarded: add_channel,
+  // remove_channel and receive_messages must all be called from the
+  // main thread.
+  pvector<int> _channels;
+
+  static TypeHandle _type_handle;
+  static SteamNetworkMessagesManager *_global_ptr;
+};
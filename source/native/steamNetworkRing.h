@@ -0,0 +1,121 @@
+///
+// Copyright (c) 2026, Digital Descent, LLC. All rights reserved.
+//
+
+#pragma once
+
+// Internal helper; not exposed to Python.
+#ifndef CPPPARSER
+
+#include "pandabase.h"
+#include "pvector.h"
+
+#include <atomic>
+
+////////////////////////////////////////////////////////////////////
+//       Class : SteamNetworkRing
+// Description : Bounded, lock-free single-producer/single-consumer
+//               ring buffer used to hand data from a networking
+//               thread to the main thread.  push() may only be
+//               called from one thread and pop() from one other
+//               thread.  The capacity is rounded up to a power of
+//               two.
+////////////////////////////////////////////////////////////////////
+template<class Element>
+class SteamNetworkRing {
+public:
+  explicit SteamNetworkRing(size_t capacity);
+
+  bool push(const Element &element);
+  bool pop(Element &element);
+
+  size_t get_capacity() const;
+  size_t get_size() const;
+
+private:
+  SteamNetworkRing(const SteamNetworkRing &copy) = delete;
+  SteamNetworkRing &operator = (const SteamNetworkRing &copy) = delete;
+
+  pvector<Element> _buffer;
+  size_t _mask;
+
+  // The indices live on separate cache lines so the producer and the
+  // consumer do not invalidate each other's line on every operation.
+  char _pad0[64];
+  // Read index, advanced by the consumer.
+  std::atomic<size_t> _head;
+  char _pad1[64 - sizeof(std::atomic<size_t>)];
+  // Write index, advanced by the producer.
+  std::atomic<size_t> _tail;
+};
+
+////////////////////////////////////////////////////////////////////
+//     Function: SteamNetworkRing::Constructor
+//       Access: Public
+////////////////////////////////////////////////////////////////////
+template<class Element>
+SteamNetworkRing<Element>::SteamNetworkRing(size_t capacity) : _head(0), _tail(0) {
+    size_t rounded = 2;
+    while (rounded < capacity) {
+        rounded <<= 1;
+    }
+    _buffer.resize(rounded);
+    _mask = rounded - 1;
+}
+
+////////////////////////////////////////////////////////////////////
+//     Function: SteamNetworkRing::push
+//       Access: Public
+//  Description: Appends an element.  Returns false if the ring is
+//               full.  Producer thread only.
+////////////////////////////////////////////////////////////////////
+template<class Element>
+bool SteamNetworkRing<Element>::push(const Element &element) {
+    size_t tail = _tail.load(std::memory_order_relaxed);
+    if (tail - _head.load(std::memory_order_acquire) > _mask) {
+        return false;
+    }
+    _buffer[tail & _mask] = element;
+    _tail.store(tail + 1, std::memory_order_release);
+    return true;
+}
+
+////////////////////////////////////////////////////////////////////
+//     Function: SteamNetworkRing::pop
+//       Access: Public
+//  Description: Removes the oldest element.  Returns false if the
+//               ring is empty.  Consumer thread only.
+////////////////////////////////////////////////////////////////////
+template<class Element>
+bool SteamNetworkRing<Element>::pop(Element &element) {
+    size_t head = _head.load(std::memory_order_relaxed);
+    if (head == _tail.load(std::memory_order_acquire)) {
+        return false;
+    }
+    element = _buffer[head & _mask];
+    _head.store(head + 1, std::memory_order_release);
+    return true;
+}
+
+////////////////////////////////////////////////////////////////////
+//     Function: SteamNetworkRing::get_capacity
+//       Access: Public
+////////////////////////////////////////////////////////////////////
+template<class Element>
+size_t SteamNetworkRing<Element>::get_capacity() const {
+    return _buffer.size();
+}
+
+////////////////////////////////////////////////////////////////////
+//     Function: SteamNetworkRing::get_size
+//       Access: Public
+//  Description: Returns the number of queued elements.  When called
+//               from the producer this is an upper bound, and from
+//               the consumer a lower bound.
+////////////////////////////////////////////////////////////////////
+template<class Element>
+size_t SteamNetworkRing<Element>::get_size() const {
+    return _tail.load(std::memory_order_acquire) - _head.load(std::memory_order_acquire);
+}
+
+#endif  // CPPPARSER
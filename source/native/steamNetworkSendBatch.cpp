@@ -0,0 +1,111 @@
+///
+// Copyright (c) 2026, Digital Descent, LLC. All rights reserved.
+//
+
+#include "steamNetworkSendBatch.h"
+
+// Guard everything below from interrogate's parser.
+#ifndef CPPPARSER
+#include "steamConstants_bindings.h"
+#include "steamEnums_bindings.h"
+#include <steam/isteamnetworkingutils.h>
+#include <string.h>
+
+////////////////////////////////////////////////////////////////////
+//     Function: SteamNetworkSendBatch::~SteamNetworkSendBatch
+//       Access: Published, Virtual
+//  Description: Releases any messages that were never sent.
+////////////////////////////////////////////////////////////////////
+SteamNetworkSendBatch::~SteamNetworkSendBatch() {
+    clear();
+}
+
+////////////////////////////////////////////////////////////////////
+//     Function: SteamNetworkSendBatch::add_message
+//       Access: Published
+//  Description: Queues a copy of the datagram for the given
+//               connection and lane.  Returns false if Steam could
+//               not allocate the message.  Adding to a batch that
+//               was just sent discards the previous results.
+////////////////////////////////////////////////////////////////////
+bool SteamNetworkSendBatch::add_message(SteamNetworkConnectionHandle connection, const Datagram &dg, int send_flags, int lane) {
+    ISteamNetworkingUtils *utils = SteamNetworkingUtils();
+    if (utils == nullptr) {
+        steam_cat.error() << "SteamNetworkingUtils interface not initialised." << std::endl;
+        return false;
+    }
+
+    SteamNetworkingMessage_t *msg = utils->AllocateMessage(static_cast<int>(dg.get_length()));
+    if (msg == nullptr) {
+        return false;
+    }
+
+    if (dg.get_length() > 0) {
+        memcpy(msg->m_pData, dg.get_data(), dg.get_length());
+    }
+    msg->m_conn = static_cast<HSteamNetConnection>(connection);
+    msg->m_nFlags = send_flags;
+    msg->m_idxLane = static_cast<uint16>(lane);
+
+    if (_messages.empty()) {
+        _results.clear();
+    }
+    _messages.push_back(msg);
+    return true;
+}
+
+////////////////////////////////////////////////////////////////////
+//     Function: SteamNetworkSendBatch::get_num_messages
+//       Access: Published
+//  Description: Returns the number of messages waiting to be sent.
+////////////////////////////////////////////////////////////////////
+size_t SteamNetworkSendBatch::get_num_messages() const {
+    return _messages.size();
+}
+
+////////////////////////////////////////////////////////////////////
+//     Function: SteamNetworkSendBatch::clear
+//       Access: Published
+//  Description: Discards all unsent messages and any results from
+//               the previous send.
+////////////////////////////////////////////////////////////////////
+void SteamNetworkSendBatch::clear() {
+    for (SteamNetworkingMessage_t *msg : _messages) {
+        msg->Release();
+    }
+    _messages.clear();
+    _results.clear();
+}
+
+////////////////////////////////////////////////////////////////////
+//     Function: SteamNetworkSendBatch::get_num_results
+//       Access: Published
+//  Description: Returns the number of results recorded by the last
+//               send.
+////////////////////////////////////////////////////////////////////
+size_t SteamNetworkSendBatch::get_num_results() const {
+    return _results.size();
+}
+
+////////////////////////////////////////////////////////////////////
+//     Function: SteamNetworkSendBatch::get_result
+//       Access: Published
+//  Description: Returns the outcome of the nth message from the
+//               last send: a positive message number on success, or
+//               a negated EResult code on failure.
+////////////////////////////////////////////////////////////////////
+int64_t SteamNetworkSendBatch::get_result(size_t n) const {
+    nassertr(n < _results.size(), 0);
+    return _results[n];
+}
+
+////////////////////////////////////////////////////////////////////
+//     Function: SteamNetworkSendBatch::size
+//       Access: Published
+//  Description: Python len() support; same as get_num_messages().
+////////////////////////////////////////////////////////////////////
+size_t SteamNetworkSendBatch::size() const {
+    return _messages.size();
+}
+
+#endif  // CPPPARSER
@@ -0,0 +1,53 @@
+///
+// Copyright (c) 2026, Digital Descent, LLC. All rights reserved.
+//
+
+#pragma once
+
+#include "config_module.h"
+#include "steamConstants_bindings.h"
+#include "steamPython_bindings.h"
+
+#include "referenceCount.h"
+#include "pvector.h"
+#include "datagram.h"
+
+////////////////////////////////////////////////////////////////////
+//       Class : SteamNetworkSendBatch
+// Description : Collects outgoing messages for any number of
+//               connections so they can be submitted to Steam with
+//               a single SendMessages call.  Each added datagram is
+//               copied once, straight into a Steam-allocated
+//               message.  After SteamNetworkManager::send_messages,
+//               the batch is empty and holds one result per message
+//               that was submitted.
+////////////////////////////////////////////////////////////////////
+class EXPORT_CLASS SteamNetworkSendBatch : public ReferenceCount {
+PUBLISHED:
+  SteamNetworkSendBatch() = default;
+  virtual ~SteamNetworkSendBatch();
+
+  bool add_message(SteamNetworkConnectionHandle connection, const Datagram &dg, int send_flags, int lane = 0);
+  size_t get_num_messages() const;
+  void clear();
+
+  size_t get_num_results() const;
+  int64_t get_result(size_t n) const;
+  MAKE_SEQ(get_results, get_num_results, get_result);
+
+  size_t size() const;
+
+  MAKE_PROPERTY(num_messages, get_num_messages);
+  MAKE_SEQ_PROPERTY(results, get_num_results, get_result);
+
+private:
+  SteamNetworkSendBatch(const SteamNetworkSendBatch &copy) = delete;
+  SteamNetworkSendBatch &operator = (const SteamNetworkSendBatch &copy) = delete;
+
+#ifndef CPPPARSER
+  pvector<SteamNetworkingMessage_t *> _messages;
+  pvector<int64> _results;
+#endif
+
+  friend class SteamNetworkManager;
+};
@@ -0,0 +1,46 @@
+///
+// Copyright (c) 2026, Digital Descent, LLC. All rights reserved.
+//
+
+#include "steamNetworkSessionEvent.h"
+
+// Guard everything below from interrogate's parser.
+#ifndef CPPPARSER
+
+////////////////////////////////////////////////////////////////////
+//     Function: SteamNetworkSessionEvent::get_type
+//       Access: Published
+////////////////////////////////////////////////////////////////////
+SteamNetworkSessionEvent::Type SteamNetworkSessionEvent::get_type() const {
+    return _type;
+}
+
+////////////////////////////////////////////////////////////////////
+//     Function: SteamNetworkSessionEvent::get_remote_steam_id
+//       Access: Published
+////////////////////////////////////////////////////////////////////
+uint64_t SteamNetworkSessionEvent::get_remote_steam_id() const {
+    return _remote_steam_id;
+}
+
+////////////////////////////////////////////////////////////////////
+//     Function: SteamNetworkSessionEvent::get_state
+//       Access: Published
+//  Description: Returns the session's connection state when it
+//               failed, or 0 for session requests.
+////////////////////////////////////////////////////////////////////
+int SteamNetworkSessionEvent::get_state() const {
+    return _state;
+}
+
+////////////////////////////////////////////////////////////////////
+//     Function: SteamNetworkSessionEvent::get_end_reason
+//       Access: Published
+//  Description: Returns the ESteamNetConnectionEnd reason a session
+//               failed with, or 0 for session requests.
+////////////////////////////////////////////////////////////////////
+int SteamNetworkSessionEvent::get_end_reason() const {
+    return _end_reason;
+}
+
+#endif  // CPPPARSER
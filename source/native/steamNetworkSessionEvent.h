@@ -0,0 +1,46 @@
+///
+// Copyright (c) 2026, Digital Descent, LLC. All rights reserved.
+//
+
+#pragma once
+
+#include "steamConstants_bindings.h"
+#include "steamPython_bindings.h"
+#include "referenceCount.h"
+
+////////////////////////////////////////////////////////////////////
+//       Class : SteamNetworkSessionEvent
+// Description : Represents a single session callback from
+//               SteamNetworkMessagesManager: a peer asking to open a
+//               session, or a session that failed.
+////////////////////////////////////////////////////////////////////
+class EXPORT_CLASS SteamNetworkSessionEvent : public ReferenceCount {
+PUBLISHED:
+  enum Type {
+    // A peer sent the first message of a new session.
+    T_session_request = 0,
+    // A session could not be established or was lost.
+    T_session_failed = 1,
+  };
+
+public:
+    SteamNetworkSessionEvent(Type type, uint64_t remote_steam_id, int state = 0, int end_reason = 0)
+        : _type(type), _remote_steam_id(remote_steam_id), _state(state), _end_reason(end_reason) {}
+
+PUBLISHED:
+  Type get_type() const;
+  uint64_t get_remote_steam_id() const;
+  int get_state() const;
+  int get_end_reason() const;
+
+  MAKE_PROPERTY(type, get_type);
+  MAKE_PROPERTY(remote_steam_id, get_remote_steam_id);
+  MAKE_PROPERTY(state, get_state);
+  MAKE_PROPERTY(end_reason, get_end_reason);
+
+private:
+  Type _type;
+  uint64_t _remote_steam_id;
+  int _state;
+  int _end_reason;
+};
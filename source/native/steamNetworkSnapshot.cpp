@@ -0,0 +1,250 @@
+///
+// Copyright (c) 2026, Digital Descent, LLC. All rights reserved.
+//
+
+#include "steamNetworkSnapshot.h"
+#include "steamNetworkMessage.h"
+
+// Guard everything below from interrogate's parser.
+#ifndef CPPPARSER
+#include <algorithm>
+#include <string.h>
+
+namespace {
+
+const size_t word_size = 4;
+
+////////////////////////////////////////////////////////////////////
+//     Function: read_word
+//  Description: Returns the nth word of the buffer, zero-padded
+//               past its end.
+////////////////////////////////////////////////////////////////////
+uint32_t read_word(const unsigned char *data, size_t length, size_t n) {
+    uint32_t word = 0;
+    size_t offset = n * word_size;
+    if (offset < length) {
+        memcpy(&word, data + offset, std::min(word_size, length - offset));
+    }
+    return word;
+}
+
+////////////////////////////////////////////////////////////////////
+//     Function: read_uint32
+//  Description: Reads a little-endian uint32.
+////////////////////////////////////////////////////////////////////
+uint32_t read_uint32(const unsigned char *data) {
+    return (uint32_t)data[0] | ((uint32_t)data[1] << 8) |
+           ((uint32_t)data[2] << 16) | ((uint32_t)data[3] << 24);
+}
+
+} // namespace
+
+////////////////////////////////////////////////////////////////////
+//     Function: SteamNetworkSnapshotDelta::encode
+//       Access: Published, Static
+//  Description: Returns the delta that turns baseline into state.
+////////////////////////////////////////////////////////////////////
+Datagram SteamNetworkSnapshotDelta::encode(const Datagram &baseline, const Datagram &state) {
+    const unsigned char *base_data = static_cast<const unsigned char *>(baseline.get_data());
+    const unsigned char *state_data = static_cast<const unsigned char *>(state.get_data());
+    size_t base_length = baseline.get_length();
+    size_t state_length = state.get_length();
+
+    size_t num_words = (state_length + word_size - 1) / word_size;
+    pvector<unsigned char> mask((num_words + 7) / 8, 0);
+    pvector<uint32_t> changed;
+
+    for (size_t i = 0; i < num_words; ++i) {
+        uint32_t diff = read_word(state_data, state_length, i) ^ read_word(base_data, base_length, i);
+        if (diff != 0) {
+            mask[i >> 3] |= (unsigned char)(1 << (i & 7));
+            changed.push_back(diff);
+        }
+    }
+
+    Datagram delta;
+    delta.add_uint32(static_cast<uint32_t>(state_length));
+    if (!mask.empty()) {
+        delta.append_data(mask.data(), mask.size());
+    }
+    for (uint32_t diff : changed) {
+        // XOR works bytewise, so the word's byte order is irrelevant
+        // as long as decode copies it back the same way.
+        delta.append_data(&diff, word_size);
+    }
+    return delta;
+}
+
+////////////////////////////////////////////////////////////////////
+//     Function: SteamNetworkSnapshotDelta::decode
+//       Access: Published, Static
+//  Description: Applies a delta produced by encode() to baseline,
+//               storing the result in state.  Returns false if the
+//               delta is malformed.
+////////////////////////////////////////////////////////////////////
+bool SteamNetworkSnapshotDelta::decode(const Datagram &baseline, const Datagram &delta, Datagram &state) {
+    return decode(baseline, static_cast<const unsigned char *>(delta.get_data()), delta.get_length(), state);
+}
+
+////////////////////////////////////////////////////////////////////
+//     Function: SteamNetworkSnapshotDelta::decode
+//       Access: Public, Static
+//  Description: Raw-buffer version of decode(), used to apply a
+//               delta in place within a larger message.
+////////////////////////////////////////////////////////////////////
+bool SteamNetworkSnapshotDelta::decode(const Datagram &baseline, const unsigned char *delta, size_t delta_length,
+                                       Datagram &state) {
+    if (delta_length < 4) {
+        return false;
+    }
+    size_t state_length = read_uint32(delta);
+    size_t num_words = (state_length + word_size - 1) / word_size;
+    size_t mask_length = (num_words + 7) / 8;
+    if (4 + mask_length > delta_length) {
+        return false;
+    }
+    const unsigned char *mask = delta + 4;
+    const unsigned char *words = mask + mask_length;
+    const unsigned char *end = delta + delta_length;
+
+    // Start from the baseline, resized to the new length.
+    pvector<unsigned char> result(num_words * word_size, 0);
+    size_t copy_length = std::min(baseline.get_length(), result.size());
+    if (copy_length > 0) {
+        memcpy(result.data(), baseline.get_data(), copy_length);
+    }
+
+    for (size_t i = 0; i < num_words; ++i) {
+        if ((mask[i >> 3] & (1 << (i & 7))) == 0) {
+            continue;
+        }
+        if (words + word_size > end) {
+            return false;
+        }
+        uint32_t word, diff;
+        memcpy(&word, result.data() + i * word_size, word_size);
+        memcpy(&diff, words, word_size);
+        word ^= diff;
+        memcpy(result.data() + i * word_size, &word, word_size);
+        words += word_size;
+    }
+
+    state = Datagram(result.data(), state_length);
+    return true;
+}
+
+////////////////////////////////////////////////////////////////////
+//     Function: SteamNetworkSnapshotDecoder::SteamNetworkSnapshotDecoder
+//       Access: Published
+//  Description: Creates a decoder that remembers the last
+//               max_history states as potential baselines.
+////////////////////////////////////////////////////////////////////
+SteamNetworkSnapshotDecoder::SteamNetworkSnapshotDecoder(size_t max_history) :
+    _max_history(std::max(max_history, (size_t)1)),
+    _message_number(0) {
+}
+
+////////////////////////////////////////////////////////////////////
+//     Function: SteamNetworkSnapshotDecoder::decode
+//       Access: Published
+//  Description: Decodes a received snapshot message.  Returns false
+//               if it is older than the current state, or if it is
+//               a delta against a baseline no longer in the
+//               history.
+////////////////////////////////////////////////////////////////////
+bool SteamNetworkSnapshotDecoder::decode(const SteamNetworkMessage &message) {
+    return decode(message.get_datagram(), message.get_message_number());
+}
+
+////////////////////////////////////////////////////////////////////
+//     Function: SteamNetworkSnapshotDecoder::decode
+//       Access: Published
+//  Description: Decodes a snapshot message given its payload and
+//               the message number it was sent with.
+////////////////////////////////////////////////////////////////////
+bool SteamNetworkSnapshotDecoder::decode(const Datagram &dg, int64_t message_number) {
+    if (message_number <= _message_number) {
+        // Unreliable snapshots may arrive out of order; keep the newest.
+        return false;
+    }
+
+    const unsigned char *data = static_cast<const unsigned char *>(dg.get_data());
+    size_t length = dg.get_length();
+    if (length < 1) {
+        return false;
+    }
+
+    Datagram state;
+    if (data[0] == SteamNetworkSnapshotDelta::K_full) {
+        state = Datagram(data + 1, length - 1);
+
+    } else if (data[0] == SteamNetworkSnapshotDelta::K_delta) {
+        if (length < 1 + sizeof(int64_t)) {
+            return false;
+        }
+        uint64_t baseline_bits = 0;
+        for (size_t i = 0; i < sizeof(int64_t); ++i) {
+            baseline_bits |= (uint64_t)data[1 + i] << (8 * i);
+        }
+        int64_t baseline_number = (int64_t)baseline_bits;
+
+        const Datagram *baseline = nullptr;
+        for (const HistoryEntry &entry : _history) {
+            if (entry.first == baseline_number) {
+                baseline = &entry.second;
+                break;
+            }
+        }
+        if (baseline == nullptr) {
+            return false;
+        }
+
+        size_t header = 1 + sizeof(int64_t);
+        if (!SteamNetworkSnapshotDelta::decode(*baseline, data + header, length - header, state)) {
+            return false;
+        }
+
+    } else {
+        return false;
+    }
+
+    _state = state;
+    _message_number = message_number;
+    _history.push_back(HistoryEntry(message_number, state));
+    while (_history.size() > _max_history) {
+        _history.pop_front();
+    }
+    return true;
+}
+
+////////////////////////////////////////////////////////////////////
+//     Function: SteamNetworkSnapshotDecoder::clear
+//       Access: Published
+//  Description: Forgets every state, e.g. after reconnecting.
+////////////////////////////////////////////////////////////////////
+void SteamNetworkSnapshotDecoder::clear() {
+    _state = Datagram();
+    _message_number = 0;
+    _history.clear();
+}
+
+////////////////////////////////////////////////////////////////////
+//     Function: SteamNetworkSnapshotDecoder::get_state
+//       Access: Published
+//  Description: Returns the most recently decoded full state.
+////////////////////////////////////////////////////////////////////
+const Datagram &SteamNetworkSnapshotDecoder::get_state() const {
+    return _state;
+}
+
+////////////////////////////////////////////////////////////////////
+//     Function: SteamNetworkSnapshotDecoder::get_message_number
+//       Access: Published
+//  Description: Returns the message number of the most recently
+//               decoded snapshot; this is what the client acks.
+////////////////////////////////////////////////////////////////////
+int64_t SteamNetworkSnapshotDecoder::get_message_number() const {
+    return _message_number;
+}
+
+#endif  // CPPPARSER
@@ -0,0 +1,79 @@
+///
+// Copyright (c) 2026, Digital Descent, LLC. All rights reserved.
+//
+
+#pragma once
+
+#include "steamConstants_bindings.h"
+#include "steamPython_bindings.h"
+
+#include "referenceCount.h"
+#include "pdeque.h"
+#include "datagram.h"
+
+class SteamNetworkMessage;
+
+////////////////////////////////////////////////////////////////////
+//       Class : SteamNetworkSnapshotDelta
+// Description : Word-level XOR delta codec for snapshot state.  The
+//               state is treated as a sequence of 32-bit words; a
+//               delta holds the new state length, a bitmask of the
+//               words that differ from the baseline, and the XOR of
+//               each of those words with its baseline value.
+//               Baseline words past the end of the baseline read as
+//               zero, so the state may grow or shrink.
+////////////////////////////////////////////////////////////////////
+class EXPORT_CLASS SteamNetworkSnapshotDelta {
+PUBLISHED:
+  static Datagram encode(const Datagram &baseline, const Datagram &state);
+  static bool decode(const Datagram &baseline, const Datagram &delta, Datagram &state);
+
+public:
+  static bool decode(const Datagram &baseline, const unsigned char *delta, size_t delta_length, Datagram &state);
+
+  // First byte of every snapshot message sent by
+  // SteamNetworkManager::send_snapshot.
+  enum Kind {
+    K_full = 0,
+    K_delta = 1,
+  };
+
+private:
+  SteamNetworkSnapshotDelta() = delete;
+};
+
+////////////////////////////////////////////////////////////////////
+//       Class : SteamNetworkSnapshotDecoder
+// Description : Client side of SteamNetworkManager::send_snapshot.
+//               Rebuilds the full state from each snapshot message,
+//               keeping the recent states so deltas against any of
+//               them can be applied.  After decoding, the client
+//               should send get_message_number() back to the server
+//               through its own protocol, where it is passed to
+//               SteamNetworkManager::ack_snapshot.
+////////////////////////////////////////////////////////////////////
+class EXPORT_CLASS SteamNetworkSnapshotDecoder : public ReferenceCount {
+PUBLISHED:
+  explicit SteamNetworkSnapshotDecoder(size_t max_history = 64);
+  virtual ~SteamNetworkSnapshotDecoder() = default;
+
+  bool decode(const SteamNetworkMessage &message);
+  bool decode(const Datagram &dg, int64_t message_number);
+  void clear();
+
+  const Datagram &get_state() const;
+  int64_t get_message_number() const;
+
+  MAKE_PROPERTY(state, get_state);
+  MAKE_PROPERTY(message_number, get_message_number);
+
+private:
+  size_t _max_history;
+  Datagram _state;
+  int64_t _message_number;
+
+#ifndef CPPPARSER
+  typedef std::pair<int64_t, Datagram> HistoryEntry;
+  pdeque<HistoryEntry> _history;
+#endif
+};
@@ -0,0 +1,238 @@
+///
+// Copyright (c) 2026, Digital Descent, LLC. All rights reserved.
+//
+
+#include "steamNetworkTickChannel.h"
+
+// Guard everything below from interrogate's parser.
+#ifndef CPPPARSER
+
+////////////////////////////////////////////////////////////////////
+//     Function: SteamNetworkTickChannel::SteamNetworkTickChannel
+//       Access: Published
+//  Description: Creates a channel that packs records for the given
+//               connection, to be sent with the given flags on the
+//               given lane.  max_message_size defaults to roughly
+//               one packet's worth of payload.
+////////////////////////////////////////////////////////////////////
+SteamNetworkTickChannel::SteamNetworkTickChannel(SteamNetworkConnectionHandle connection, int send_flags,
+                                                 int lane, size_t max_message_size) :
+    _connection(connection),
+    _send_flags(send_flags),
+    _lane(lane),
+    _max_message_size(max_message_size),
+    _num_records(0),
+    _num_messages(0) {
+}
+
+////////////////////////////////////////////////////////////////////
+//     Function: SteamNetworkTickChannel::add_record
+//       Access: Published
+//  Description: Appends the datagram as one record.  Returns false
+//               if it is too large to be framed (over 65535 bytes).
+////////////////////////////////////////////////////////////////////
+bool SteamNetworkTickChannel::add_record(const Datagram &dg) {
+    size_t length = dg.get_length();
+    if (length > max_record_size) {
+        return false;
+    }
+
+    size_t framed = length + sizeof(uint16_t);
+    if (_num_messages == 0 ||
+        (_messages[_num_messages - 1].get_length() > 0 &&
+         _messages[_num_messages - 1].get_length() + framed > _max_message_size)) {
+        if (_num_messages == _messages.size()) {
+            _messages.push_back(Datagram());
+        } else {
+            reset_message(_messages[_num_messages]);
+        }
+        ++_num_messages;
+    }
+
+    Datagram &message = _messages[_num_messages - 1];
+    message.add_uint16(static_cast<uint16_t>(length));
+    if (length > 0) {
+        message.append_data(dg.get_data(), length);
+    }
+    ++_num_records;
+    return true;
+}
+
+////////////////////////////////////////////////////////////////////
+//     Function: SteamNetworkTickChannel::clear
+//       Access: Published
+//  Description: Discards every pending record.
+////////////////////////////////////////////////////////////////////
+void SteamNetworkTickChannel::clear() {
+    _num_records = 0;
+    _num_messages = 0;
+}
+
+////////////////////////////////////////////////////////////////////
+//     Function: SteamNetworkTickChannel::reset_message
+//       Access: Private, Static
+//  Description: Empties a packed message left over from an earlier
+//               tick without giving up its storage.  Datagram::clear
+//               would drop the array, so the length is reset on the
+//               array itself.  If a copy of the datagram still
+//               shares the array, it gets a fresh one instead so the
+//               copy keeps its contents.
+////////////////////////////////////////////////////////////////////
+void SteamNetworkTickChannel::reset_message(Datagram &message) {
+    PTA_uchar array = message.modify_array();
+
+    // One reference is ours and one is the datagram's.
+    if (array.get_ref_count() > 2) {
+        message.set_array(PTA_uchar::empty_array(0, Datagram::get_class_type()));
+    } else {
+        array.v().clear();
+    }
+}
+
+////////////////////////////////////////////////////////////////////
+//     Function: SteamNetworkTickChannel::get_connection
+//       Access: Published
+////////////////////////////////////////////////////////////////////
+SteamNetworkConnectionHandle SteamNetworkTickChannel::get_connection() const {
+    return _connection;
+}
+
+////////////////////////////////////////////////////////////////////
+//     Function: SteamNetworkTickChannel::get_send_flags
+//       Access: Published
+////////////////////////////////////////////////////////////////////
+int SteamNetworkTickChannel::get_send_flags() const {
+    return _send_flags;
+}
+
+////////////////////////////////////////////////////////////////////
+//     Function: SteamNetworkTickChannel::get_lane
+//       Access: Published
+////////////////////////////////////////////////////////////////////
+int SteamNetworkTickChannel::get_lane() const {
+    return _lane;
+}
+
+////////////////////////////////////////////////////////////////////
+//     Function: SteamNetworkTickChannel::get_max_message_size
+//       Access: Published
+////////////////////////////////////////////////////////////////////
+size_t SteamNetworkTickChannel::get_max_message_size() const {
+    return _max_message_size;
+}
+
+////////////////////////////////////////////////////////////////////
+//     Function: SteamNetworkTickChannel::get_num_records
+//       Access: Published
+//  Description: Returns the number of records added since the last
+//               flush.
+////////////////////////////////////////////////////////////////////
+size_t SteamNetworkTickChannel::get_num_records() const {
+    return _num_records;
+}
+
+////////////////////////////////////////////////////////////////////
+//     Function: SteamNetworkTickChannel::get_num_messages
+//       Access: Published
+//  Description: Returns the number of packed messages the pending
+//               records will be sent as.
+////////////////////////////////////////////////////////////////////
+size_t SteamNetworkTickChannel::get_num_messages() const {
+    return _num_messages;
+}
+
+////////////////////////////////////////////////////////////////////
+//     Function: SteamNetworkTickChannel::get_pending_size
+//       Access: Published
+//  Description: Returns the total size in bytes of the packed
+//               messages, including record framing.
+////////////////////////////////////////////////////////////////////
+size_t SteamNetworkTickChannel::get_pending_size() const {
+    size_t total = 0;
+    for (size_t i = 0; i < _num_messages; ++i) {
+        total += _messages[i].get_length();
+    }
+    return total;
+}
+
+////////////////////////////////////////////////////////////////////
+//     Function: SteamNetworkTickReader::SteamNetworkTickReader
+//       Access: Published
+//  Description: Indexes the records in a packed message.  If the
+//               framing is corrupt, the records up to the damage
+//               are kept and is_valid() returns false.
+////////////////////////////////////////////////////////////////////
+SteamNetworkTickReader::SteamNetworkTickReader(const Datagram &dg) :
+    _dg(dg),
+    _valid(true) {
+    const unsigned char *data = static_cast<const unsigned char *>(_dg.get_data());
+    size_t length = _dg.get_length();
+
+    size_t offset = 0;
+    while (offset < length) {
+        if (offset + sizeof(uint16_t) > length) {
+            _valid = false;
+            break;
+        }
+        size_t record_length = data[offset] | (data[offset + 1] << 8);
+        offset += sizeof(uint16_t);
+        if (offset + record_length > length) {
+            _valid = false;
+            break;
+        }
+        _offsets.push_back(offset);
+        offset += record_length;
+    }
+}
+
+////////////////////////////////////////////////////////////////////
+//     Function: SteamNetworkTickReader::is_valid
+//       Access: Published
+//  Description: Returns false if the message ended partway through
+//               a record.
+////////////////////////////////////////////////////////////////////
+bool SteamNetworkTickReader::is_valid() const {
+    return _valid;
+}
+
+////////////////////////////////////////////////////////////////////
+//     Function: SteamNetworkTickReader::get_num_records
+//       Access: Published
+////////////////////////////////////////////////////////////////////
+size_t SteamNetworkTickReader::get_num_records() const {
+    return _offsets.size();
+}
+
+////////////////////////////////////////////////////////////////////
+//     Function: SteamNetworkTickReader::get_record
+//       Access: Published
+//  Description: Returns a copy of the nth record.
+////////////////////////////////////////////////////////////////////
+Datagram SteamNetworkTickReader::get_record(size_t n) const {
+    nassertr(n < _offsets.size(), Datagram());
+
+    const unsigned char *data = static_cast<const unsigned char *>(_dg.get_data());
+    size_t offset = _offsets[n];
+    size_t record_length = data[offset - 2] | (data[offset - 1] << 8);
+    return Datagram(data + offset, record_length);
+}
+
+////////////////////////////////////////////////////////////////////
+//     Function: SteamNetworkTickReader::size
+//       Access: Published
+//  Description: Python len() support; same as get_num_records().
+////////////////////////////////////////////////////////////////////
+size_t SteamNetworkTickReader::size() const {
+    return _offsets.size();
+}
+
+////////////////////////////////////////////////////////////////////
+//     Function: SteamNetworkTickReader::operator []
+//       Access: Published
+//  Description: Python indexing support; same as get_record().
+////////////////////////////////////////////////////////////////////
+Datagram SteamNetworkTickReader::operator [] (size_t n) const {
+    return get_record(n);
+}
+
+#endif  // CPPPARSER
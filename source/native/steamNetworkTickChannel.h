@@ -0,0 +1,99 @@
+///
+// Copyright (c) 2026, Digital Descent, LLC. All rights reserved.
+//
+
+#pragma once
+
+#include "steamConstants_bindings.h"
+#include "steamPython_bindings.h"
+
+#include "referenceCount.h"
+#include "pvector.h"
+#include "datagram.h"
+
+////////////////////////////////////////////////////////////////////
+//       Class : SteamNetworkTickChannel
+// Description : Coalesces the small records a connection is sent
+//               during one tick into as few messages as possible.
+//               Each record is appended to a packed buffer with a
+//               16-bit length prefix; a new message is started
+//               whenever the next record would push the current
+//               one past max_message_size.  The packed messages
+//               are sent by SteamNetworkManager::flush_tick_channel
+//               and split back into records on the receiving side
+//               by SteamNetworkTickReader.
+////////////////////////////////////////////////////////////////////
+class EXPORT_CLASS SteamNetworkTickChannel : public ReferenceCount {
+PUBLISHED:
+  explicit SteamNetworkTickChannel(SteamNetworkConnectionHandle connection, int send_flags,
+                                   int lane = 0, size_t max_message_size = 1200);
+  virtual ~SteamNetworkTickChannel() = default;
+
+  bool add_record(const Datagram &dg);
+  void clear();
+
+  SteamNetworkConnectionHandle get_connection() const;
+  int get_send_flags() const;
+  int get_lane() const;
+  size_t get_max_message_size() const;
+
+  size_t get_num_records() const;
+  size_t get_num_messages() const;
+  size_t get_pending_size() const;
+
+  MAKE_PROPERTY(connection, get_connection);
+  MAKE_PROPERTY(send_flags, get_send_flags);
+  MAKE_PROPERTY(lane, get_lane);
+  MAKE_PROPERTY(max_message_size, get_max_message_size);
+  MAKE_PROPERTY(num_records, get_num_records);
+  MAKE_PROPERTY(num_messages, get_num_messages);
+  MAKE_PROPERTY(pending_size, get_pending_size);
+
+public:
+  static const size_t max_record_size = 0xffff;
+
+private:
+  static void reset_message(Datagram &message);
+
+  SteamNetworkConnectionHandle _connection;
+  int _send_flags;
+  int _lane;
+  size_t _max_message_size;
+  size_t _num_records;
+  size_t _num_messages;
+
+  // Packed messages; only the first _num_messages are in use, the
+  // rest are kept around so their storage is reused next tick.
+  pvector<Datagram> _messages;
+
+  friend class SteamNetworkManager;
+};
+
+////////////////////////////////////////////////////////////////////
+//       Class : SteamNetworkTickReader
+// Description : Splits a message packed by a SteamNetworkTickChannel
+//               back into its records.  The record boundaries are
+//               found once, natively, when the reader is built.
+////////////////////////////////////////////////////////////////////
+class EXPORT_CLASS SteamNetworkTickReader : public ReferenceCount {
+PUBLISHED:
+  explicit SteamNetworkTickReader(const Datagram &dg);
+  virtual ~SteamNetworkTickReader() = default;
+
+  bool is_valid() const;
+
+  size_t get_num_records() const;
+  Datagram get_record(size_t n) const;
+  MAKE_SEQ(get_records, get_num_records, get_record);
+
+  size_t size() const;
+  Datagram operator [] (size_t n) const;
+
+  MAKE_PROPERTY(valid, is_valid);
+  MAKE_SEQ_PROPERTY(records, get_num_records, get_record);
+
+private:
+  Datagram _dg;
+  pvector<size_t> _offsets;
+  bool _valid;
+};
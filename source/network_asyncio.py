@@ -0,0 +1,352 @@
+"""asyncio front end for `SteamNetworkManager`.
+
+- `SteamNetworkAsyncio`: pumps a `SteamNetworkManager` from the running event
+  loop and exposes awaitable connects plus `async for` message and event
+  streams.
+- `SteamNetworkMessageStream` / `SteamNetworkEventStream`: the async iterators
+  returned by `SteamNetworkAsyncio.messages()` and `SteamNetworkAsyncio.events()`.
+
+The pump runs on an adaptive schedule: it polls every ``min_interval`` seconds
+while traffic is flowing and backs off towards ``max_interval`` while idle, so
+a server holding many quiet connections does not spin.
+
+Usage::
+
+    async with SteamNetworkAsyncio() as net:
+        conn = await net.connect_by_ip_address(addr, timeout=10.0)
+        async for msg in net.messages(connection=conn):
+            print(msg.dgi.get_string())
+"""
+
+from __future__ import annotations
+
+import asyncio
+from typing import Dict, List, Optional
+
+from panda3d import core
+from panda3d_steamworks import (
+    SteamNetworkEvent,
+    SteamNetworkingConnectionState,
+    SteamNetworkManager,
+)
+
+STATE_CONNECTED = SteamNetworkingConnectionState.k_ESteamNetworkingConnectionState_Connected
+STATE_CLOSED_BY_PEER = SteamNetworkingConnectionState.k_ESteamNetworkingConnectionState_ClosedByPeer
+STATE_PROBLEM = SteamNetworkingConnectionState.k_ESteamNetworkingConnectionState_ProblemDetectedLocally
+
+# Handle value Steam uses for "no connection / listen socket / poll group".
+INVALID_HANDLE = 0
+
+
+class _Stream:
+    """
+    Shared plumbing for the async iterators handed out by `SteamNetworkAsyncio`.
+    """
+
+    _closed_marker = object()
+
+    def __init__(self, owner: "SteamNetworkAsyncio", max_pending: int) -> None:
+        self._owner = owner
+        self._queue: asyncio.Queue = asyncio.Queue()
+        self.max_pending = int(max_pending)
+        self.closed = False
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self):
+        if self.closed and self._queue.empty():
+            raise StopAsyncIteration
+        item = await self._queue.get()
+        if item is self._closed_marker:
+            raise StopAsyncIteration
+        return item
+
+    def get_free_space(self) -> int:
+        """
+        Number of items the pump may still enqueue before the stream is full.
+        """
+
+        return max(0, self.max_pending - self._queue.qsize())
+
+    def close(self) -> None:
+        """
+        Stops the stream.  Items already queued are still delivered, after
+        which iteration ends.
+        """
+
+        if self.closed:
+            return
+        self.closed = True
+        self._owner._remove_stream(self)
+        self._queue.put_nowait(self._closed_marker)
+
+    def _put(self, item) -> None:
+        self._queue.put_nowait(item)
+
+
+class SteamNetworkMessageStream(_Stream):
+    """
+    Async iterator over the messages arriving on one connection or poll group.
+    Messages are left in Steam's queue while the stream is full, so a slow
+    consumer does not grow memory without bound.
+    """
+
+    def __init__(
+        self,
+        owner: "SteamNetworkAsyncio",
+        connection: int = INVALID_HANDLE,
+        poll_group: int = INVALID_HANDLE,
+        max_pending: int = 1024,
+    ) -> None:
+        super().__init__(owner, max_pending)
+        self.connection = connection
+        self.poll_group = poll_group
+
+    def _receive(self, mgr: SteamNetworkManager) -> int:
+        received = 0
+        while not self.closed:
+            space = self.get_free_space()
+            if space == 0:
+                break
+
+            if self.poll_group != INVALID_HANDLE:
+                batch = mgr.receive_messages_on_poll_group(self.poll_group, space)
+            else:
+                batch = mgr.receive_messages_on_connection(self.connection, space)
+            if not batch:
+                break
+
+            for msg in batch:
+                self._put(msg)
+            received += len(batch)
+        return received
+
+
+class SteamNetworkEventStream(_Stream):
+    """
+    Async iterator over connection status events.  ``listen_socket`` limits
+    the stream to one listen socket; `INVALID_HANDLE` selects outgoing client
+    connections and ``None`` selects every event.
+    """
+
+    def __init__(
+        self,
+        owner: "SteamNetworkAsyncio",
+        listen_socket: Optional[int] = None,
+        max_pending: int = 4096,
+    ) -> None:
+        super().__init__(owner, max_pending)
+        self.listen_socket = listen_socket
+
+    def _offer(self, event) -> None:
+        if self.closed:
+            return
+        if self.listen_socket is not None and event.listen_socket != self.listen_socket:
+            return
+        if self.get_free_space() == 0:
+            # Drop the oldest event rather than stall the pump.
+            self._queue.get_nowait()
+        self._put(event)
+
+
+class SteamNetworkAsyncio:
+    """
+    Drives a `SteamNetworkManager` from an asyncio event loop.
+
+    The adapter consumes every connection event the manager queues, so it
+    should be the only code calling ``drain_events()`` / ``get_next_event()``
+    on the manager while it is running.
+    """
+
+    def __init__(
+        self,
+        manager: Optional[SteamNetworkManager] = None,
+        min_interval: float = 0.001,
+        max_interval: float = 0.05,
+    ) -> None:
+        self.manager = manager if manager is not None else SteamNetworkManager.get_global_ptr()
+        self.min_interval = float(min_interval)
+        self.max_interval = max(float(max_interval), self.min_interval)
+
+        self._interval = self.min_interval
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._handle: Optional[asyncio.TimerHandle] = None
+        self._pending_connects: Dict[int, asyncio.Future] = {}
+        self._message_streams: List[SteamNetworkMessageStream] = []
+        self._event_streams: List[SteamNetworkEventStream] = []
+
+    async def __aenter__(self) -> "SteamNetworkAsyncio":
+        self.start()
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        self.close()
+
+    @property
+    def running(self) -> bool:
+        return self._loop is not None
+
+    def start(self) -> None:
+        """
+        Starts pumping the manager on the running event loop.
+        """
+
+        if self._loop is not None:
+            return
+        self._loop = asyncio.get_running_loop()
+        self._interval = self.min_interval
+        self._schedule(0.0)
+
+    def close(self) -> None:
+        """
+        Stops pumping, ends every open stream and fails pending connects.
+        """
+
+        if self._handle is not None:
+            self._handle.cancel()
+            self._handle = None
+
+        for stream in list(self._message_streams) + list(self._event_streams):
+            stream.close()
+
+        for future in self._pending_connects.values():
+            if not future.done():
+                future.set_exception(ConnectionError("SteamNetworkAsyncio was closed"))
+        self._pending_connects.clear()
+        self._loop = None
+
+    def wake(self) -> None:
+        """
+        Resets the adaptive schedule so the next pump happens right away.
+        """
+
+        self._interval = self.min_interval
+        if self._loop is not None:
+            self._schedule(0.0)
+
+    # ------------------------------------------------------------------
+    # Connections
+    # ------------------------------------------------------------------
+    async def connect_by_ip_address(self, address: core.NetAddress, timeout: Optional[float] = None) -> int:
+        """
+        Connects to a remote host by IP address and returns the connection
+        handle once it reaches the Connected state.
+        """
+
+        return await self._wait_connected(self.manager.connect_by_ip_address(address), timeout)
+
+    async def connect_by_steam_id(self, steam_id: str, timeout: Optional[float] = None) -> int:
+        """
+        Connects to a remote peer by SteamID and returns the connection handle
+        once it reaches the Connected state.
+        """
+
+        return await self._wait_connected(self.manager.connect_by_steam_id(steam_id), timeout)
+
+    async def _wait_connected(self, connection: int, timeout: Optional[float]) -> int:
+        if connection == INVALID_HANDLE:
+            raise ConnectionError("Failed to start connection")
+
+        self.start()
+        future = self._loop.create_future()
+        self._pending_connects[connection] = future
+        self.wake()
+
+        try:
+            return await asyncio.wait_for(future, timeout)
+        except BaseException:
+            # Timed out, cancelled, or rejected: don't leave a half-open
+            # connection behind.
+            self._pending_connects.pop(connection, None)
+            self.manager.close_connection(connection)
+            raise
+
+    # ------------------------------------------------------------------
+    # Streams
+    # ------------------------------------------------------------------
+    def messages(
+        self,
+        connection: int = INVALID_HANDLE,
+        poll_group: int = INVALID_HANDLE,
+        max_pending: int = 1024,
+    ) -> SteamNetworkMessageStream:
+        """
+        Returns an async iterator over the messages received on a connection
+        or, if given, a poll group.
+        """
+
+        if connection == INVALID_HANDLE and poll_group == INVALID_HANDLE:
+            raise ValueError("messages() needs a connection or a poll group")
+
+        stream = SteamNetworkMessageStream(self, connection, poll_group, max_pending)
+        self._message_streams.append(stream)
+        self.wake()
+        return stream
+
+    def events(self, listen_socket: Optional[int] = None, max_pending: int = 4096) -> SteamNetworkEventStream:
+        """
+        Returns an async iterator over connection status events, optionally
+        limited to one listen socket.
+        """
+
+        stream = SteamNetworkEventStream(self, listen_socket, max_pending)
+        self._event_streams.append(stream)
+        self.wake()
+        return stream
+
+    def client_events(self, max_pending: int = 4096) -> SteamNetworkEventStream:
+        """
+        Returns an async iterator over the events of outgoing connections.
+        """
+
+        return self.events(INVALID_HANDLE, max_pending)
+
+    def _remove_stream(self, stream: _Stream) -> None:
+        for streams in (self._message_streams, self._event_streams):
+            if stream in streams:
+                streams.remove(stream)
+
+    # ------------------------------------------------------------------
+    # Pumping
+    # ------------------------------------------------------------------
+    def _schedule(self, delay: float) -> None:
+        if self._handle is not None:
+            self._handle.cancel()
+        self._handle = self._loop.call_later(delay, self._pump)
+
+    def _pump(self) -> None:
+        self._handle = None
+        mgr = self.manager
+        mgr.run_callbacks()
+
+        activity = 0
+        for event in mgr.drain_events():
+            activity += 1
+            self._dispatch_event(event)
+
+        for stream in list(self._message_streams):
+            activity += stream._receive(mgr)
+
+        # Poll quickly while traffic is flowing; back off while idle.
+        if activity or self._pending_connects:
+            self._interval = self.min_interval
+        else:
+            self._interval = min(self._interval * 2.0, self.max_interval)
+
+        if self._loop is not None:
+            self._schedule(self._interval)
+
+    def _dispatch_event(self, event) -> None:
+        future = self._pending_connects.get(event.connection)
+        if future is not None and not future.done() and event.type == SteamNetworkEvent.T_state_changed:
+            if event.state == STATE_CONNECTED:
+                del self._pending_connects[event.connection]
+                future.set_result(event.connection)
+            elif event.state in (STATE_CLOSED_BY_PEER, STATE_PROBLEM):
+                del self._pending_connects[event.connection]
+                future.set_exception(ConnectionError(
+                    f"Connection {event.connection} failed (end reason {event.end_reason})"))
+
+        for stream in self._event_streams:
+            stream._offer(event)
@@ -0,0 +1,173 @@
+"""NumPy codec for `SteamNetworkManager` message payloads.
+
+- `SteamArrayCodec`: packs a NumPy array, structured dtypes included, into a
+  `Datagram` or a `SteamNetworkMessageBuilder` in one call, and decodes a
+  received `SteamNetworkMessage`, `SteamNetworkMessageView`,
+  `SteamNetworkMessageBuffer`, `DatagramIterator` or bytes-like payload back
+  into an array without any per-element Python work.
+
+Arrays travel the way Panda3D's ``Datagram.add_*`` methods write values:
+little-endian, whatever the host byte order or the byte order of the array
+being packed.  Each array is written as a ``uint32`` element count followed by
+the raw elements, so arrays can sit between other ``add_*`` fields in the same
+message and be read back in order.  Only the element count is sent; the shape
+of each element belongs in the dtype, e.g. ``("pos", "f4", 3)``.
+
+NumPy is an optional dependency; it is only needed once a codec is created.
+
+Usage::
+
+    ENTITY = SteamArrayCodec([("id", "u4"), ("pos", "f4", 3), ("yaw", "f4")])
+
+    # Sending: the elements are copied once, straight into Steam's buffer.
+    ENTITY.send(mgr, conn, entities, SEND_FLAGS)
+
+    # Receiving: a read-only view over the payload, no per-field calls.
+    for msg in mgr.receive_messages_on_connection(conn):
+        entities = ENTITY.unpack(msg)
+        print(entities["pos"].mean(axis=0))
+"""
+
+from __future__ import annotations
+
+from typing import Any, Tuple
+
+from panda3d import core
+from panda3d_steamworks import (
+    SteamNetworkManager,
+    SteamNetworkMessage,
+    SteamNetworkMessageBuilder,
+)
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+# Size of the little-endian uint32 element count in front of every array.
+COUNT_SIZE = 4
+
+
+class SteamArrayCodec:
+    """
+    Packs and unpacks arrays of one dtype.  The dtype is converted to
+    little-endian when the codec is created, so `dtype` is the layout on the
+    wire and the dtype of every array returned by `unpack`.
+    """
+
+    def __init__(self, dtype: Any) -> None:
+        if np is None:
+            raise ImportError("SteamArrayCodec requires numpy; install it with 'pip install numpy'.")
+        dtype = np.dtype(dtype)
+        if dtype.hasobject:
+            raise TypeError(f"Cannot send arrays of dtype {dtype}, which holds Python objects.")
+        if dtype.itemsize == 0:
+            raise TypeError(f"Cannot send arrays of dtype {dtype}, which has no size.")
+        # Recurses into structured fields and subarrays, and leaves padding
+        # and single-byte types alone.
+        self.dtype = dtype.newbyteorder("<")
+
+    @property
+    def itemsize(self) -> int:
+        return self.dtype.itemsize
+
+    def get_size(self, count: int) -> int:
+        """Returns the number of bytes `pack` writes for count elements."""
+        return COUNT_SIZE + count * self.dtype.itemsize
+
+    def _prepare(self, array: Any):
+        """Returns array as a contiguous, little-endian 1-D array of the
+        codec's dtype, copying it only if it is not one already."""
+        array = np.ascontiguousarray(array, dtype=self.dtype)
+        if array.ndim != 1:
+            array = array.reshape(-1)
+        if array.size > 0xFFFFFFFF:
+            raise ValueError(f"Cannot send {array.size} elements in one array.")
+        return array
+
+    def encode(self, array: Any) -> bytes:
+        """Returns the count-prefixed payload for array as bytes."""
+        array = self._prepare(array)
+        return len(array).to_bytes(COUNT_SIZE, "little") + array.tobytes()
+
+    def pack(self, dg: core.Datagram, array: Any) -> None:
+        """Appends array to dg."""
+        array = self._prepare(array)
+        dg.add_uint32(len(array))
+        dg.append_data(array.tobytes())
+
+    def pack_into(self, builder: SteamNetworkMessageBuilder, array: Any) -> bool:
+        """Writes array into builder at its cursor and advances the cursor.
+        Returns False, writing nothing, if it does not fit."""
+        array = self._prepare(array)
+        start = builder.offset
+        end = start + self.get_size(len(array))
+        if not builder.valid or end > builder.capacity:
+            return False
+        # The view must be gone before the builder is sent.
+        with memoryview(builder) as view:
+            view[start:start + COUNT_SIZE] = len(array).to_bytes(COUNT_SIZE, "little")
+            view[start + COUNT_SIZE:end] = array.view(np.uint8)
+        builder.offset = end
+        return True
+
+    def send(self, mgr: SteamNetworkManager, connection: int, array: Any, send_flags: int,
+             lane: int = 0) -> int:
+        """Sends array as a message of its own, written straight into a
+        Steam-allocated buffer.  Returns what `SteamNetworkManager.send_message`
+        returns: the message number, or a negated EResult."""
+        array = self._prepare(array)
+        builder = SteamNetworkMessageBuilder(connection, self.get_size(len(array)), send_flags, lane)
+        if builder.valid:
+            self.pack_into(builder, array)
+        return mgr.send_message(builder)
+
+    def unpack(self, source: Any, offset: int = 0):
+        """Decodes an array from source, which may be a `SteamNetworkMessage`,
+        `SteamNetworkMessageView`, `SteamNetworkMessageBuffer`, `Datagram`,
+        `DatagramIterator` or any bytes-like object.
+
+        A `DatagramIterator` is read from its current position and advanced
+        past the array; for every other source the array starts offset bytes
+        into the payload.  The result is read-only and, for a
+        `SteamNetworkMessageView` or `SteamNetworkMessageBuffer`, a view over
+        the Steam message itself.
+        Raises ValueError if the payload is too short."""
+        if isinstance(source, core.DatagramIterator):
+            if source.get_remaining_size() < COUNT_SIZE:
+                raise ValueError("Payload is too short for an array header.")
+            count = source.get_uint32()
+            size = count * self.dtype.itemsize
+            if source.get_remaining_size() < size:
+                raise ValueError(f"Payload is too short for {count} elements of {self.dtype}.")
+            return np.frombuffer(source.extract_bytes(size), dtype=self.dtype, count=count)
+
+        array, _ = self.unpack_from(source, offset)
+        return array
+
+    def unpack_from(self, source: Any, offset: int = 0) -> Tuple[Any, int]:
+        """Like `unpack`, but also returns the offset just past the array, for
+        reading several arrays out of one payload.  Does not accept a
+        `DatagramIterator`."""
+        view = _payload_view(source)
+        if offset < 0 or len(view) - offset < COUNT_SIZE:
+            raise ValueError("Payload is too short for an array header.")
+        count = int.from_bytes(view[offset:offset + COUNT_SIZE], "little")
+        start = offset + COUNT_SIZE
+        end = start + count * self.dtype.itemsize
+        if end > len(view):
+            raise ValueError(f"Payload is too short for {count} elements of {self.dtype}.")
+        array = np.frombuffer(view, dtype=self.dtype, count=count, offset=start)
+        return array, end
+
+
+def _payload_view(source: Any) -> memoryview:
+    """Returns a flat byte view of a message payload."""
+    if isinstance(source, SteamNetworkMessage):
+        source = source.dg
+    if isinstance(source, core.Datagram):
+        return memoryview(source.get_message())
+    if isinstance(source, core.DatagramIterator):
+        raise TypeError("Use SteamArrayCodec.unpack() to read from a DatagramIterator.")
+    # Message views and buffers, and bytes-like objects, export their data.
+    return memoryview(source).cast("B")